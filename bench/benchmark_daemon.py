@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+End-to-end latency of saving, restarting and closing, against bench/fittsmon
+
+Drives the daemon handling of FittsmonGUI through its own main loop and
+reports p50/p95 for:
+
+    save                    edit one binding, press Save
+    save+restart (reload)   Save, then Restart with a daemon handling SIGHUP
+    save+restart (respawn)  the same with a daemon that has to be restarted
+    close with respawn      daemon died while the GUI was open, close it
+
+"applied" is when the stand-in daemon had actually read the new file.
+
+Needs PyGObject and a display (xvfb-run is fine). fittsmon is the stand-in
+from this directory, running under its own process name, and
+HOME/XDG_RUNTIME_DIR point to a temporary directory, so a real fittsmon
+and its config are never touched.
+
+    xvfb-run python3 bench/benchmark_daemon.py --rounds 20 --fail-above 1500
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT = BENCH_DIR.parent / "fittsmon-gui.py"
+MONITORS = [{'name': "BENCH-1", 'primary': True}, {'name': "BENCH-2", 'primary': False}]
+# The stand-in runs under its own process name, so the GUI under test
+# never finds (or stops) a real fittsmon of the same user
+STANDIN_NAME = "fittsmon-bench"
+TIMEOUT_S = 10
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=20, help="samples per scenario (default 20)")
+    parser.add_argument("--fail-above", type=float, metavar="MS",
+                        help="exit with 1 if any p95 is above MS milliseconds")
+    parser.add_argument("--startup-delay", type=float, default=0.0, metavar="S",
+                        help="seconds the stand-in takes to become ready (default 0)")
+    parser.add_argument("--verbose", action="store_true", help="show the GUI's own output")
+    return parser.parse_args(argv)
+
+
+def load_gui_module():
+    """Import fittsmon-gui.py without running its main block, with GTK loaded"""
+    spec = importlib.util.spec_from_file_location("fittsmon_gui", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    module.load_gtk()
+    return module
+
+
+def percentile(samples, q):
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+
+class Harness:
+    def __init__(self, module, events_file):
+        self.mod = module
+        self.GLib = module.GLib
+        self.events_file = events_file
+        self.quit_requested = False
+        self.edits = 0
+
+        # on_window_close ends with Gtk.main_quit(); there is no Gtk.main() here
+        module.Gtk.main_quit = self._on_quit
+
+        class BenchGUI(module.FittsmonGUI):
+            DAEMON_NAME = STANDIN_NAME
+
+            def probe_monitors(self):
+                return [dict(mon) for mon in MONITORS]
+
+        self.gui_class = BenchGUI
+
+    def _on_quit(self):
+        self.quit_requested = True
+        return False
+
+    def run_until(self, condition, what):
+        context = self.GLib.MainContext.default()
+        deadline = time.monotonic() + TIMEOUT_S
+        while not condition():
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"timed out waiting for {what}")
+            if not context.iteration(False):
+                time.sleep(0.0005)
+
+    def events(self):
+        try:
+            with open(self.events_file) as f:
+                return [json.loads(line) for line in f]
+        except FileNotFoundError:
+            return []
+
+    def wait_event(self, kinds, since):
+        """First stand-in event of one of kinds at or after since (monotonic)"""
+        found = []
+
+        def seen():
+            found[:] = [e for e in self.events() if e['event'] in kinds and e['t'] >= since]
+            return bool(found)
+
+        self.run_until(seen, f"daemon {'/'.join(kinds)}")
+        return found[0]
+
+    def new_gui(self):
+        gui = self.gui_class()
+        self.run_until(lambda: gui.ready and not gui.startup_pending, "GUI startup")
+        return gui
+
+    def stop_daemon(self, gui):
+        pids = gui.daemon.find()
+        gui.supervisor.expect_exit(pids)
+        gui.daemon.terminate()
+        self.run_until(lambda: not any(gui.daemon.pid_alive(pid) for pid in pids), "daemon exit")
+
+    def start_daemon(self, gui, reload_support):
+        os.environ["FITTSMON_STANDIN_SIGHUP"] = "1" if reload_support else "0"
+        self.stop_daemon(gui)
+        since = time.monotonic()
+        gui.spawn_daemon()
+        self.wait_event(("ready",), since)
+
+    def edit(self, gui):
+        """A new command each time, so every save and restart has work to do"""
+        self.edits += 1
+        monitor = MONITORS[self.edits % len(MONITORS)]['name']
+        gui.set_command(monitor, "TopLeft", "WheelUp", f"notify-send bench-{self.edits}")
+        gui.mark_config_dirty()
+
+    def bench_save(self, gui, rounds):
+        samples = []
+        for _round in range(rounds):
+            self.edit(gui)
+            started = time.perf_counter()
+            gui.on_save_clicked(None)
+            samples.append((time.perf_counter() - started) * 1000)
+        return {"save": samples}
+
+    def bench_save_restart(self, gui, rounds):
+        done, applied = [], []
+        for _round in range(rounds):
+            self.edit(gui)
+            started = time.monotonic()
+            gui.on_save_clicked(None)
+            if not gui.restart_fittsmon():
+                raise RuntimeError("restart_fittsmon did not start")
+            self.run_until(lambda: not gui.is_restarting, "restart")
+            done.append((time.monotonic() - started) * 1000)
+            event = self.wait_event(("reload", "ready"), started)
+            applied.append((event['t'] - started) * 1000)
+        return {"": done, "applied": applied}
+
+    def bench_close(self, rounds):
+        done, applied = [], []
+        for _round in range(rounds):
+            gui = self.new_gui()
+            if not gui.daemon_was_running:
+                raise RuntimeError("no daemon at GUI start")
+            self.stop_daemon(gui)
+
+            self.quit_requested = False
+            started = time.monotonic()
+            gui.on_window_close(None, None)
+            self.run_until(lambda: self.quit_requested, "close")
+            done.append((time.monotonic() - started) * 1000)
+            event = self.wait_event(("ready",), started)
+            applied.append((event['t'] - started) * 1000)
+            gui.window.destroy()
+        return {"": done, "applied": applied}
+
+
+def report(results):
+    print(f"[BENCH] {'scenario':34} {'p50':>9} {'p95':>9} {'max':>9}")
+    for name, samples in results:
+        print(f"[BENCH] {name:34} {percentile(samples, 50):6.1f} ms {percentile(samples, 95):6.1f} ms "
+              f"{max(samples):6.1f} ms")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="fittsmon-bench-") as tmp:
+        # Set up before the import: the GUI reads HOME when it starts
+        os.environ["HOME"] = str(Path(tmp) / "home")
+        os.environ["XDG_RUNTIME_DIR"] = str(Path(tmp) / "run")
+        os.environ["PATH"] = f"{BENCH_DIR}{os.pathsep}{os.environ.get('PATH', '')}"
+        os.environ["FITTSMON_STANDIN_LOG"] = str(Path(tmp) / "events.jsonl")
+        os.environ["FITTSMON_STANDIN_DELAY"] = str(args.startup_delay)
+        os.environ["FITTSMON_STANDIN_NAME"] = STANDIN_NAME
+        os.makedirs(os.environ["HOME"])
+        os.makedirs(os.environ["XDG_RUNTIME_DIR"], mode=0o700)
+
+        quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        results = []
+        gui = None
+        try:
+            with quiet:
+                harness = Harness(load_gui_module(), os.environ["FITTSMON_STANDIN_LOG"])
+                gui = harness.new_gui()
+
+                results += harness.bench_save(gui, args.rounds).items()
+                for label, reload_support in (("reload", True), ("respawn", False)):
+                    harness.start_daemon(gui, reload_support)
+                    for key, samples in harness.bench_save_restart(gui, args.rounds).items():
+                        results.append((f"save+restart ({label}) {key}".strip(), samples))
+
+                harness.start_daemon(gui, True)
+                gui.supervisor.stop()
+                gui.window.destroy()
+                gui = None
+                for key, samples in harness.bench_close(args.rounds).items():
+                    results.append((f"close with respawn {key}".strip(), samples))
+        finally:
+            # Never leave a stand-in daemon behind
+            if gui is not None:
+                gui.supervisor.stop()
+            module = sys.modules.get("fittsmon_gui")
+            if module is not None:
+                module.DaemonTracker(STANDIN_NAME).terminate()
+
+    print(f"[BENCH] {args.rounds} rounds per scenario, stand-in startup delay {args.startup_delay} s")
+    report(results)
+    if args.fail_above is not None:
+        slow = [name for name, samples in results if percentile(samples, 95) > args.fail_above]
+        for name in slow:
+            print(f"[BENCH] FAIL: {name} p95 above {args.fail_above:.0f} ms")
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
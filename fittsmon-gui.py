@@ -3,15 +3,28 @@
 fittsmon Configuration GUI - Simple Edition
 """
 
-import gi
-gi.require_version('Gtk', '3.0')
-gi.require_version('Gdk', '3.0')
-from gi.repository import Gtk, Gdk, GLib
+import argparse
+import contextlib
+import ctypes
 import subprocess
 import os
+import sys
 import time
+import hashlib
+import json
+import re
+import collections
+import csv
+import io
+import select
+import signal
+import tempfile
+import threading
 from pathlib import Path
 
+# Reference point for --startup-profile
+_START_TIME = time.perf_counter()
+
 _VERSION = "__VERSION__"
 if _VERSION.startswith("__"):
     try:
@@ -40,31 +53,94 @@ TRANSLATIONS = {
         
         # Buttons
         'help': 'Help',
+        'overview': 'Overview',
         'test': 'Test',
         'edit_file': 'Edit File',
+        'benchmark': 'Benchmark',
+        'benchmark_all': 'Benchmark All…',
+        'benchmark_export': 'Export CSV…',
+        'benchmark_stop': 'Stop',
         'show_hotspots': 'Show Hotspots',
         'hide_hotspots': 'Hide Hotspots',
         'save': 'Save',
         'restart': 'Restart',
         'clear_conflict': 'Clear Conflict',
+        'fix_all_conflicts': 'Fix All Conflicts ({count})',
         'close': 'Close',
         
+        # Overview
+        'overview_title': 'All Bindings',
+        'search_placeholder': 'Search commands (e.g. amixer)',
+        'search_none': 'No bound command matches',
+        'search_more': '… and {count} more',
+        'search_not_connected': '(not connected)',
+        'overview_filter': 'Filter by monitor, zone, event or command',
+        'overview_bound_only': 'Bound only',
+        'overview_count': '{bound} bindings, {shown} rows shown',
+        'col_monitor': 'Monitor',
+        'col_zone': 'Zone',
+        'col_event': 'Event',
+        'col_command': 'Command',
+        
         # Status messages
         'status_ready': 'Ready',
+        'status_loading': 'Loading',
         'status_saved': 'Saved',
         'status_stopping': 'Stopping',
         'status_starting': 'Starting',
         'status_failed_start': 'Failed to start',
         'status_executed': 'Executed',
+        'test_running': 'Running (PID {pid})…',
+        'test_failed_start': 'could not start /bin/sh',
+        'test_timed_out': 'Stopped after the {timeout:g} s timeout',
+        'test_elapsed': '{elapsed:.2f} s',
+        'test_no_output': '(no output)',
+        'test_output_dropped': '[{count} more bytes not kept]',
+        'benchmark_tooltip': 'Run the command {runs} times one after another, then {runs} times at wheel speed, and show how long it takes',
+        'benchmark_progress': 'Benchmarking {done}/{total}: {command}',
+        'benchmark_mode_sequential': 'one after another',
+        'benchmark_mode_wheel': 'one every {interval} ms',
+        'benchmark_stats': '{mode}: min {min:.1f} · p50 {p50:.1f} · p95 {p95:.1f} · max {max:.1f} ms',
+        'benchmark_no_runs': '{mode}: no run finished',
+        'benchmark_failed_runs': '{count} of {runs} runs failed',
+        'benchmark_too_slow': 'too slow for {event} (p95 over {budget} ms)',
+        'benchmark_summary': '{count} bindings benchmarked, {slow} too slow',
+        'benchmark_all_confirm': 'Run every bound command {runs} times?',
+        'benchmark_all_detail': 'This executes all {count} bindings, wheel bindings twice as often. Commands that change something (volume, windows, workspaces) will do it each time.',
+        'benchmark_none': 'No bindings to benchmark',
+        'benchmark_stopped': 'Benchmark stopped',
+        'benchmark_exported': 'Benchmark saved to {path}',
         'status_opening_editor': 'Opening editor',
         'status_showing_hotspots': 'Showing hotspots on all monitors',
         'status_hotspots_hidden': 'Hotspots hidden',
         'status_enter_command': 'Enter a command first',
         'status_error': 'Error',
         'status_cleared': 'Cleared',
+        'status_conflicts_fixed': 'Fixed {count} conflict(s)',
         'status_restarting_closing': 'Restarting daemon before closing',
         'status_daemon_restarted': 'Daemon restarted, closing',
         'status_daemon_failed': 'Warning: Failed to restart daemon',
+        'status_restarted_in': 'Daemon restarted in {ms} ms',
+        'status_reloading': 'Reloading',
+        'status_reloaded_in': 'Daemon reloaded in {ms} ms',
+        'status_no_changes': 'No changes for the daemon, not restarted',
+        'status_monitors_changed': 'Monitors changed: {names}',
+        'status_profile_switched': 'Switched to the bindings for {layout}',
+        'status_monitor_renamed': 'Bindings moved to renamed outputs: {renames}',
+        'restart_tooltip': 'Shift+click to restart even without changes',
+        'pending_bindings': 'Pending changes: {count} binding(s)',
+        'pending_monitors': 'monitors changed',
+        'pending_unknown': 'Daemon configuration unknown, Restart applies the current one',
+        
+        # Daemon supervisor
+        'daemon_running': 'fittsmon running (PID {pid}), up {uptime}',
+        'daemon_not_running': 'fittsmon not running',
+        'daemon_restart_pending': 'restarting in {seconds} s',
+        'daemon_crash_loop': 'crash loop detected, auto-restart stopped',
+        'daemon_restarts': 'restarts: {count}',
+        'daemon_last_exit': 'last exit: {status}',
+        'daemon_log': 'Daemon output',
+        'daemon_log_adopted': 'fittsmon (PID {pid}) was started outside the GUI, its output is not captured',
         
         # Event descriptions
         'event_wheel_up': 'Scroll wheel UP',
@@ -124,31 +200,94 @@ TRANSLATIONS = {
         
         # Buttons
         'help': '❓ Ayuda',
+        'overview': '📋 Resumen',
         'test': '🧪 Probar',
         'edit_file': '✏️  Editar Archivo',
+        'benchmark': '⏱ Medir',
+        'benchmark_all': 'Medir Todo…',
+        'benchmark_export': 'Exportar CSV…',
+        'benchmark_stop': 'Detener',
         'show_hotspots': '👁️  Mostrar Zonas',
         'hide_hotspots': '👁️  Ocultar Zonas',
         'save': '💾 Guardar',
         'restart': '⟳ Reiniciar',
         'clear_conflict': '✓ Limpiar Conflicto',
+        'fix_all_conflicts': '✓ Corregir Todos los Conflictos ({count})',
         'close': 'Cerrar',
         
+        # Overview
+        'overview_title': 'Todas las Asignaciones',
+        'search_placeholder': 'Buscar comandos (p. ej. amixer)',
+        'search_none': 'Ningún comando asignado coincide',
+        'search_more': '… y {count} más',
+        'search_not_connected': '(no conectado)',
+        'overview_filter': 'Filtrar por monitor, zona, evento o comando',
+        'overview_bound_only': 'Solo asignados',
+        'overview_count': '{bound} asignaciones, {shown} filas mostradas',
+        'col_monitor': 'Monitor',
+        'col_zone': 'Zona',
+        'col_event': 'Evento',
+        'col_command': 'Comando',
+        
         # Status messages
         'status_ready': 'Listo',
+        'status_loading': 'Cargando',
         'status_saved': 'Guardado',
         'status_stopping': 'Deteniendo',
         'status_starting': 'Iniciando',
         'status_failed_start': 'Error al iniciar',
         'status_executed': 'Ejecutado',
+        'test_running': 'Ejecutando (PID {pid})…',
+        'test_failed_start': 'no se pudo iniciar /bin/sh',
+        'test_timed_out': 'Detenido tras el límite de {timeout:g} s',
+        'test_elapsed': '{elapsed:.2f} s',
+        'test_no_output': '(sin salida)',
+        'test_output_dropped': '[{count} bytes más no guardados]',
+        'benchmark_tooltip': 'Ejecuta el comando {runs} veces una tras otra, luego {runs} veces a velocidad de rueda, y muestra cuánto tarda',
+        'benchmark_progress': 'Midiendo {done}/{total}: {command}',
+        'benchmark_mode_sequential': 'una tras otra',
+        'benchmark_mode_wheel': 'una cada {interval} ms',
+        'benchmark_stats': '{mode}: mín {min:.1f} · p50 {p50:.1f} · p95 {p95:.1f} · máx {max:.1f} ms',
+        'benchmark_no_runs': '{mode}: ninguna ejecución terminó',
+        'benchmark_failed_runs': '{count} de {runs} ejecuciones fallaron',
+        'benchmark_too_slow': 'demasiado lento para {event} (p95 más de {budget} ms)',
+        'benchmark_summary': '{count} asignaciones medidas, {slow} demasiado lentas',
+        'benchmark_all_confirm': '¿Ejecutar cada comando asignado {runs} veces?',
+        'benchmark_all_detail': 'Esto ejecuta las {count} asignaciones, las de rueda el doble de veces. Los comandos que cambian algo (volumen, ventanas, escritorios) lo harán cada vez.',
+        'benchmark_none': 'No hay asignaciones que medir',
+        'benchmark_stopped': 'Medición detenida',
+        'benchmark_exported': 'Medición guardada en {path}',
         'status_opening_editor': 'Abriendo editor',
         'status_showing_hotspots': 'Mostrando zonas en todos los monitores',
         'status_hotspots_hidden': 'Zonas ocultas',
         'status_enter_command': 'Ingrese un comando primero',
         'status_error': 'Error',
         'status_cleared': 'Limpiado',
+        'status_conflicts_fixed': '{count} conflicto(s) corregido(s)',
         'status_restarting_closing': 'Reiniciando daemon antes de cerrar',
         'status_daemon_restarted': 'Daemon reiniciado, cerrando',
         'status_daemon_failed': 'Advertencia: Error al reiniciar daemon',
+        'status_restarted_in': 'Daemon reiniciado en {ms} ms',
+        'status_reloading': 'Recargando',
+        'status_reloaded_in': 'Daemon recargado en {ms} ms',
+        'status_no_changes': 'Sin cambios para el daemon, no se reinició',
+        'status_monitors_changed': 'Monitores cambiados: {names}',
+        'status_profile_switched': 'Cambiado a las asignaciones de {layout}',
+        'status_monitor_renamed': 'Asignaciones movidas a salidas renombradas: {renames}',
+        'restart_tooltip': 'Mayús+clic para reiniciar aunque no haya cambios',
+        'pending_bindings': 'Cambios pendientes: {count} asignación(es)',
+        'pending_monitors': 'monitores cambiados',
+        'pending_unknown': 'Configuración del daemon desconocida, Reiniciar aplica la actual',
+        
+        # Daemon supervisor
+        'daemon_running': 'fittsmon en ejecución (PID {pid}), activo {uptime}',
+        'daemon_not_running': 'fittsmon no está en ejecución',
+        'daemon_restart_pending': 'reinicio en {seconds} s',
+        'daemon_crash_loop': 'bucle de fallos detectado, reinicio automático detenido',
+        'daemon_restarts': 'reinicios: {count}',
+        'daemon_last_exit': 'última salida: {status}',
+        'daemon_log': 'Salida del daemon',
+        'daemon_log_adopted': 'fittsmon (PID {pid}) se inició fuera de la GUI, su salida no se captura',
         
         # Event descriptions
         'event_wheel_up': 'Rueda de scroll ARRIBA',
@@ -208,31 +347,94 @@ TRANSLATIONS = {
         
         # Buttons
         'help': '❓ Pomoc',
+        'overview': '📋 Przegląd',
         'test': '🧪 Testuj',
         'edit_file': '✏️  Edytuj Plik',
+        'benchmark': '⏱ Zmierz',
+        'benchmark_all': 'Zmierz Wszystkie…',
+        'benchmark_export': 'Eksportuj CSV…',
+        'benchmark_stop': 'Zatrzymaj',
         'show_hotspots': '👁️  Pokaż Strefy',
         'hide_hotspots': '👁️  Ukryj Strefy',
         'save': '💾 Zapisz',
         'restart': '⟳ Restart',
         'clear_conflict': '✓ Usuń Konflikt',
+        'fix_all_conflicts': '✓ Napraw Wszystkie Konflikty ({count})',
         'close': 'Zamknij',
         
+        # Overview
+        'overview_title': 'Wszystkie Przypisania',
+        'search_placeholder': 'Szukaj poleceń (np. amixer)',
+        'search_none': 'Żadne przypisane polecenie nie pasuje',
+        'search_more': '… i {count} więcej',
+        'search_not_connected': '(niepodłączony)',
+        'overview_filter': 'Filtruj po monitorze, strefie, zdarzeniu lub poleceniu',
+        'overview_bound_only': 'Tylko przypisane',
+        'overview_count': 'Przypisania: {bound}, widoczne wiersze: {shown}',
+        'col_monitor': 'Monitor',
+        'col_zone': 'Strefa',
+        'col_event': 'Zdarzenie',
+        'col_command': 'Polecenie',
+        
         # Status messages
         'status_ready': 'Gotowy',
+        'status_loading': 'Wczytywanie',
         'status_saved': 'Zapisano',
         'status_stopping': 'Zatrzymywanie',
         'status_starting': 'Uruchamianie',
         'status_failed_start': 'Nie udało się uruchomić',
         'status_executed': 'Wykonano',
+        'test_running': 'Uruchomiono (PID {pid})…',
+        'test_failed_start': 'nie można uruchomić /bin/sh',
+        'test_timed_out': 'Zatrzymano po limicie {timeout:g} s',
+        'test_elapsed': '{elapsed:.2f} s',
+        'test_no_output': '(brak wyjścia)',
+        'test_output_dropped': '[pominięto kolejne bajty: {count}]',
+        'benchmark_tooltip': 'Uruchamia polecenie {runs} razy jedno po drugim, potem {runs} razy w tempie kółka, i pokazuje czas wykonania',
+        'benchmark_progress': 'Pomiar {done}/{total}: {command}',
+        'benchmark_mode_sequential': 'jedno po drugim',
+        'benchmark_mode_wheel': 'co {interval} ms',
+        'benchmark_stats': '{mode}: min {min:.1f} · p50 {p50:.1f} · p95 {p95:.1f} · maks {max:.1f} ms',
+        'benchmark_no_runs': '{mode}: żadne uruchomienie się nie zakończyło',
+        'benchmark_failed_runs': 'nieudane uruchomienia: {count} z {runs}',
+        'benchmark_too_slow': 'za wolne dla {event} (p95 ponad {budget} ms)',
+        'benchmark_summary': 'Zmierzone przypisania: {count}, za wolne: {slow}',
+        'benchmark_all_confirm': 'Uruchomić każde przypisane polecenie {runs} razy?',
+        'benchmark_all_detail': 'To wykona wszystkie przypisania ({count}), przypisania kółka dwa razy częściej. Polecenia, które coś zmieniają (głośność, okna, pulpity), zrobią to za każdym razem.',
+        'benchmark_none': 'Brak przypisań do zmierzenia',
+        'benchmark_stopped': 'Pomiar zatrzymany',
+        'benchmark_exported': 'Pomiar zapisany w {path}',
         'status_opening_editor': 'Otwieranie edytora',
         'status_showing_hotspots': 'Pokazywanie stref na wszystkich monitorach',
         'status_hotspots_hidden': 'Strefy ukryte',
         'status_enter_command': 'Najpierw wpisz polecenie',
         'status_error': 'Błąd',
         'status_cleared': 'Usunięto',
+        'status_conflicts_fixed': 'Naprawiono konflikty: {count}',
         'status_restarting_closing': 'Restartowanie demona przed zamknięciem',
         'status_daemon_restarted': 'Demon zrestartowany, zamykanie',
         'status_daemon_failed': 'Uwaga: Nie udało się zrestartować demona',
+        'status_restarted_in': 'Demon zrestartowany w {ms} ms',
+        'status_reloading': 'Przeładowywanie',
+        'status_reloaded_in': 'Demon przeładowany w {ms} ms',
+        'status_no_changes': 'Brak zmian dla demona, bez restartu',
+        'status_monitors_changed': 'Zmienione monitory: {names}',
+        'status_profile_switched': 'Przełączono na powiązania dla {layout}',
+        'status_monitor_renamed': 'Powiązania przeniesione na wyjścia o nowych nazwach: {renames}',
+        'restart_tooltip': 'Shift+klik, aby zrestartować mimo braku zmian',
+        'pending_bindings': 'Oczekujące zmiany: {count} powiązań',
+        'pending_monitors': 'zmienione monitory',
+        'pending_unknown': 'Nieznana konfiguracja demona, Restart zastosuje bieżącą',
+        
+        # Daemon supervisor
+        'daemon_running': 'fittsmon działa (PID {pid}), od {uptime}',
+        'daemon_not_running': 'fittsmon nie działa',
+        'daemon_restart_pending': 'restart za {seconds} s',
+        'daemon_crash_loop': 'wykryto pętlę awarii, automatyczny restart wstrzymany',
+        'daemon_restarts': 'restarty: {count}',
+        'daemon_last_exit': 'ostatnie wyjście: {status}',
+        'daemon_log': 'Wyjście demona',
+        'daemon_log_adopted': 'fittsmon (PID {pid}) uruchomiono poza GUI, jego wyjście nie jest przechwytywane',
         
         # Event descriptions
         'event_wheel_up': 'Kółko myszy W GÓRĘ',
@@ -292,545 +494,3752 @@ def detect_language():
     return 'en'
 
 
-# Global language setting
-CURRENT_LANG = detect_language()
+# Global language setting, detected on first use
+CURRENT_LANG = None
 
 
 def _(key):
     """Get translated string for key"""
+    global CURRENT_LANG
+    if CURRENT_LANG is None:
+        CURRENT_LANG = detect_language()
     return TRANSLATIONS[CURRENT_LANG].get(key, TRANSLATIONS['en'].get(key, key))
 
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+ZONES = [
+    "TopLeft", "TopCenter", "TopRight",
+    "Left", "Right",
+    "BottomLeft", "BottomCenter", "BottomRight"
+]
+
+EVENTS = [
+    "WheelUp", "WheelDown", "WheelUpOnce", "WheelDownOnce",
+    "LeftButton", "RightButton", "MiddleButton",
+    "Enter", "Leave"
+]
+
+# Bindings that don't go together in one zone: (type, events, other events).
+# fittsmon honours only one of a wheel pair, so "fix all" clears the other
+# events of those; buttons next to Enter/Leave are only a warning.
+CONFLICT_RULES = (
+    ('wheel', ('WheelUp',), ('WheelUpOnce',)),
+    ('wheel', ('WheelDown',), ('WheelDownOnce',)),
+    ('enter_leave', ('LeftButton', 'RightButton', 'MiddleButton'), ('Enter', 'Leave')),
+)
+
+# Time between two wheel events when scrolling fast (ms). fittsmon runs a
+# WheelUp/WheelDown command for each one, so a slower command piles up.
+WHEEL_INTERVAL_MS = 50
+WHEEL_REPEAT_EVENTS = ("WheelUp", "WheelDown")
+
+# Spawn-to-exit time past which a bound command feels slow (ms)
+LATENCY_BUDGET_MS = {
+    "WheelUp": WHEEL_INTERVAL_MS, "WheelDown": WHEEL_INTERVAL_MS,
+    "WheelUpOnce": 100, "WheelDownOnce": 100,
+    "LeftButton": 100, "RightButton": 100, "MiddleButton": 100,
+    "Enter": 200, "Leave": 200,
+}
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
 
+def atomic_write(filepath, text):
+    """
+    Replace filepath with text atomically: write a temp file in the same
+    directory, fsync it and rename it over the target. Readers (the daemon)
+    see either the old or the new file, never a half-written one. A
+    symlinked target (dotfile managers) is resolved first, so the link
+    stays and the file it points to is the one replaced.
+    """
+    filepath = Path(os.path.realpath(filepath))
+    try:
+        mode = filepath.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Make the rename itself durable
+    try:
+        dir_fd = os.open(filepath.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def latency_summary(samples):
+    """min/p50/p95/max of samples (nearest-rank), None if there are none"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    
+    def percentile(q):
+        rank = -(-q * len(ordered) // 100)
+        return ordered[min(len(ordered), max(rank, 1)) - 1]
+    
+    return {'min': ordered[0], 'p50': percentile(50), 'p95': percentile(95), 'max': ordered[-1]}
+
+
+class BindingStore:
+    """
+    Compact table of every binding, addressed by integer indices
+    
+    Cells live in one flat list indexed by (monitor, zone, event); command
+    strings are interned so repeated commands share one object. Monitor
+    slots are keyed by section prefix ("" for the primary's bare zone
+    sections, "HDMI-1" for [HDMI-1-TopLeft] ...). The indices of non-empty
+    cells are kept in a set so walking only the real bindings is cheap.
+    
+    Each section's filled events are also kept as a bitmask, with the
+    CONFLICT_RULES it breaks. Writes only mark their section stale and
+    validate() re-checks just those, so a keystroke costs one section.
+    
+    Commands are indexed by token (lowercased words between whitespace and
+    shell punctuation): every write moves its cell between the postings of
+    the old and the new tokens, so search() never reads the cells.
+    """
+    
+    __slots__ = (
+        'zones', 'events', 'zone_index', 'event_index',
+        'n_zones', 'n_events', 'prefixes', 'prefix_index', 'cells', 'filled',
+        'rules', 'masks', 'conflicts', 'stale', 'tokens'
+    )
+    
+    TOKEN_RE = re.compile(r"[^\s'\"`;|&<>()=]+")
+    
+    def __init__(self, zones=ZONES, events=EVENTS):
+        self.zones = list(zones)
+        self.events = list(events)
+        self.zone_index = {zone: i for i, zone in enumerate(self.zones)}
+        self.event_index = {event: i for i, event in enumerate(self.events)}
+        self.n_zones = len(self.zones)
+        self.n_events = len(self.events)
+        self.prefixes = []
+        self.prefix_index = {}
+        self.cells = []
+        self.filled = set()
+        self.rules = [
+            (kind, self.event_mask(events), self.event_mask(others))
+            for kind, events, others in CONFLICT_RULES
+        ]
+        # {(slot, zone): mask} of non-empty sections and
+        # {(slot, zone): ((type, mask, other mask), ...)} of conflicting ones
+        self.masks = {}
+        self.conflicts = {}
+        self.stale = set()
+        # {token: {cell, ...}}
+        self.tokens = {}
+    
+    def event_mask(self, events):
+        mask = 0
+        for event in events:
+            mask |= 1 << self.event_index[event]
+        return mask
+    
+    def event_names(self, mask):
+        return [event for i, event in enumerate(self.events) if mask >> i & 1]
+    
+    def monitor_slot(self, prefix, create=True):
+        """Slot for a section prefix, allocated on first use"""
+        slot = self.prefix_index.get(prefix)
+        if slot is None and create:
+            slot = len(self.prefixes)
+            self.prefixes.append(prefix)
+            self.prefix_index[prefix] = slot
+            self.cells.extend([""] * (self.n_zones * self.n_events))
+        return slot
+    
+    def section_name(self, slot, zone):
+        prefix = self.prefixes[slot]
+        return f"{prefix}-{self.zones[zone]}" if prefix else self.zones[zone]
+    
+    def get(self, slot, zone, event):
+        return self.cells[(slot * self.n_zones + zone) * self.n_events + event]
+    
+    def address(self, cell):
+        """(slot, zone, event) of a cell index"""
+        slot, rest = divmod(cell, self.n_zones * self.n_events)
+        zone, event = divmod(rest, self.n_events)
+        return slot, zone, event
+    
+    def _index(self, cell, value, add):
+        for token in set(self.TOKEN_RE.findall(value.lower())):
+            if add:
+                self.tokens.setdefault(token, set()).add(cell)
+            else:
+                postings = self.tokens[token]
+                postings.discard(cell)
+                if not postings:
+                    del self.tokens[token]
+    
+    def set(self, slot, zone, event, value):
+        """Store a command; returns True if the cell changed"""
+        cell = (slot * self.n_zones + zone) * self.n_events + event
+        if self.cells[cell] == value:
+            return False
+        if self.cells[cell]:
+            self._index(cell, self.cells[cell], add=False)
+        if value:
+            self._index(cell, value, add=True)
+            self.cells[cell] = sys.intern(value)
+            self.filled.add(cell)
+        else:
+            self.cells[cell] = ""
+            self.filled.discard(cell)
+        self.stale.add((slot, zone))
+        return True
+    
+    def clear_section(self, slot, zone):
+        base = (slot * self.n_zones + zone) * self.n_events
+        for cell in range(base, base + self.n_events):
+            if self.cells[cell]:
+                self._index(cell, self.cells[cell], add=False)
+            self.cells[cell] = ""
+            self.filled.discard(cell)
+        self.stale.add((slot, zone))
+    
+    def validate(self):
+        """Re-check the sections written since the last call; returns them"""
+        stale, self.stale = self.stale, set()
+        for slot, zone in stale:
+            base = (slot * self.n_zones + zone) * self.n_events
+            mask = 0
+            for event in range(self.n_events):
+                if self.cells[base + event]:
+                    mask |= 1 << event
+            found = tuple(
+                (kind, mask & events, mask & others)
+                for kind, events, others in self.rules
+                if mask & events and mask & others
+            )
+            if mask:
+                self.masks[(slot, zone)] = mask
+            else:
+                self.masks.pop((slot, zone), None)
+            if found:
+                self.conflicts[(slot, zone)] = found
+            else:
+                self.conflicts.pop((slot, zone), None)
+        return stale
+    
+    def section_mask(self, slot, zone):
+        """Bitmask of the section's non-empty events"""
+        if self.stale:
+            self.validate()
+        return self.masks.get((slot, zone), 0)
+    
+    def iter_filled(self):
+        """Yield (slot, zone, event, command) for every non-empty cell"""
+        for cell in sorted(self.filled):
+            yield self.address(cell) + (self.cells[cell],)
+    
+    def search(self, query):
+        """
+        Sorted cells whose command has each word of query inside one of its
+        tokens ("amixer", "master amix", "/usr/bin"). Words match anywhere in
+        a token, so each word is a linear scan of the distinct tokens (not of
+        the commands); a config has a few hundred of them at most.
+        """
+        hits = None
+        # Longest words first: they match the fewest tokens
+        for word in sorted(set(self.TOKEN_RE.findall(query.lower())), key=len, reverse=True):
+            cells = set()
+            for token, postings in self.tokens.items():
+                if word in token:
+                    cells |= postings
+            hits = cells if hits is None else hits & cells
+            if not hits:
+                break
+        return sorted(hits or ())
+    
+    def __len__(self):
+        return len(self.filled)
+
+
 class ConfigParser:
-    """Custom config parser that preserves case"""
+    """
+    Custom config parser that preserves case
     
-    def __init__(self):
-        self.data = {}
+    The file is kept as a lossless document: the raw lines plus an index of
+    where each section header and key lives. Writing patches only the lines
+    of sections that changed, so comments, blank lines, ordering and any
+    hand edits made through "Edit File" survive a save from the GUI.
+    """
+    
+    KEY_PREFIX_RE = re.compile(r'^(\s*[^=]*=[ \t]*)')
+    
+    def __init__(self, sparse=False):
+        # Bindings live in the store; keys/sections it can't address (unknown
+        # events, foreign sections) are kept verbatim in extras
+        self.store = BindingStore()
+        self.extras = {}
+        # Every section seen in the file or added since: {name: (slot, zone) or None}
+        self.sections = {}
+        # Sparse mode only writes non-empty bindings; missing keys read as ""
+        self.sparse = sparse
+        # Raw document lines (without newlines) and their section/key index:
+        # {section: {'header': line, 'keys': {key: line}, 'last': line}}
+        self.lines = []
+        self.index = {}
+        # Sections changed since the last read/write
+        self.dirty = set()
+        # (digest, layout, stat) of what is known to be on disk
+        self.disk_state = None
+        self.write_count = 0
+        self.skip_count = 0
+    
+    @staticmethod
+    def _stat_key(filepath):
+        try:
+            st = filepath.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    @staticmethod
+    def _digest(text):
+        return hashlib.sha256(text.encode()).hexdigest()
+    
+    def _scan(self):
+        """Parse self.lines into (data, index)"""
+        data = {}
+        index = {}
+        current_section = None
+        for i, line in enumerate(self.lines):
+            line = line.strip()
+            
+            if not line:
+                continue
+            
+            if line.startswith('#'):
+                if current_section is not None:
+                    index[current_section]['last'] = i
+                continue
+            
+            if line.startswith('[') and line.endswith(']'):
+                current_section = line[1:-1]
+                data[current_section] = {}
+                index[current_section] = {'header': i, 'keys': {}, 'last': i}
+                continue
+            
+            if '=' in line and current_section:
+                key, value = line.split('=', 1)
+                key = key.strip()
+                value = value.strip()
+                data[current_section][key] = value
+                index[current_section]['keys'][key] = i
+                index[current_section]['last'] = i
+        
+        return data, index
+    
+    def _load_text(self, text):
+        self.lines = text.splitlines()
+        data, self.index = self._scan()
+        return data
+    
+    def text(self):
+        """The current document as it would be written to disk"""
+        return "\n".join(self.lines) + "\n" if self.lines else ""
+    
+    def _clear(self):
+        self.store = BindingStore()
+        self.extras = {}
+        self.sections = {}
+    
+    def slot(self, section):
+        """(monitor slot, zone index) addressing a section, or None"""
+        try:
+            return self.sections[section]
+        except KeyError:
+            pass
+        store = self.store
+        zone = store.zone_index.get(section)
+        if zone is not None:
+            return (store.monitor_slot(""), zone)
+        prefix, _sep, zone_name = section.rpartition('-')
+        zone = store.zone_index.get(zone_name)
+        if prefix and zone is not None:
+            return (store.monitor_slot(prefix), zone)
+        return None
+    
+    def _import_section(self, section, values):
+        """Replace a section's contents with values from a parsed file"""
+        addr = self.slot(section)
+        self.sections[section] = addr
+        self.extras.pop(section, None)
+        if addr is not None:
+            self.store.clear_section(*addr)
+        for key, value in values.items():
+            event = self.store.event_index.get(key) if addr is not None else None
+            if event is None:
+                self.extras.setdefault(section, {})[key] = value
+            else:
+                self.store.set(addr[0], addr[1], event, value)
+    
+    def _drop_section(self, section):
+        addr = self.sections.pop(section, None)
+        if addr is not None:
+            self.store.clear_section(*addr)
+        self.extras.pop(section, None)
+    
+    def values(self, section):
+        """All key/value pairs of a section as a dict"""
+        addr = self.sections.get(section)
+        values = {}
+        if addr is not None:
+            slot, zone = addr
+            for event, name in enumerate(self.store.events):
+                value = self.store.get(slot, zone, event)
+                if value:
+                    values[name] = value
+        values.update(self.extras.get(section, {}))
+        return values
+    
+    @property
+    def data(self):
+        """Snapshot as {section: {key: value}}, for callers that want dicts"""
+        return {section: self.values(section) for section in self.sections}
     
     def read(self, filepath):
         """Read config file preserving case"""
-        self.data = {}
+        self._clear()
+        self.lines = []
+        self.index = {}
+        self.dirty = set()
+        self.disk_state = None
         if not filepath.exists():
             return
         
-        current_section = None
         with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                
-                if not line or line.startswith('#'):
-                    continue
-                
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                    self.data[current_section] = {}
-                    continue
-                
-                if '=' in line and current_section:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    self.data[current_section][key] = value
+            text = f.read()
+        
+        for section, values in self._load_text(text).items():
+            self._import_section(section, values)
+        self.disk_state = (self._digest(text), None, self._stat_key(filepath))
     
-    def write(self, filepath, zones, events, monitors):
+    def _merge_from_disk(self, filepath):
         """
-        Write config file preserving case
-        Writes ALL sections for ALL zones with ALL events (even if empty)
+        The file changed behind our back (e.g. "Edit File"): take the disk
+        version as the new document and keep only our own unsaved sections
+        """
+        try:
+            with open(filepath, 'r') as f:
+                text = f.read()
+        except OSError:
+            self.lines = []
+            self.index = {}
+            return
+        
+        disk_data = self._load_text(text)
+        for section in list(self.sections):
+            if section not in self.dirty and section not in disk_data:
+                self._drop_section(section)
+        for section, values in disk_data.items():
+            if section not in self.dirty:
+                self._import_section(section, values)
+        print(f"[CONFIG] Merged external changes from {filepath}")
+    
+    @staticmethod
+    def _sort_monitors(monitors):
+        """Primary first, then the others in detection order"""
+        primary_mon = None
+        secondary_mons = []
+        
+        for mon in monitors:
+            if mon['primary']:
+                primary_mon = mon
+            else:
+                secondary_mons.append(mon)
+        
+        sorted_monitors = []
+        if primary_mon:
+            sorted_monitors.append(primary_mon)
+        sorted_monitors.extend(secondary_mons)
+        return sorted_monitors
+    
+    def _layout_sections(self, zones, monitors):
+        sections = []
+        for mon in self._sort_monitors(monitors):
+            for zone in zones:
+                if mon['primary']:
+                    sections.append(zone)
+                else:
+                    sections.append(f"{mon['name']}-{zone}")
+        return sections
+    
+    def serialize(self, zones, events, monitors):
+        """
+        Render a fresh config file as a string
+        Dense (default): ALL sections for ALL zones with ALL events (even if empty)
+        Sparse: only non-empty bindings, zones without any are left out
         Order: Primary first, then each secondary monitor
         """
-        with open(filepath, 'w') as f:
-            f.write("# fittsmon Configuration\n")
-            f.write("# Generated by fittsmon GUI\n\n")
+        lines = ["# fittsmon Configuration", "# Generated by fittsmon GUI", ""]
+        
+        for section_name in self._layout_sections(zones, monitors):
+            section = self.values(section_name)
+            if self.sparse:
+                keys = [event for event in events if section.get(event)]
+                if not keys:
+                    continue
+            else:
+                keys = events
             
-            # Sort monitors: primary first, then others
-            primary_mon = None
-            secondary_mons = []
+            lines.append(f"[{section_name}]")
+            for event in keys:
+                lines.append(f"{event}={section.get(event, '')}")
             
-            for mon in monitors:
-                if mon['primary']:
-                    primary_mon = mon
-                else:
-                    secondary_mons.append(mon)
+            lines.append("")
+        
+        return "\n".join(lines) + "\n"
+    
+    def _patch_section(self, section, keys):
+        """
+        Bring the document lines of one section in line with the bindings.
+        Existing key lines are rewritten in place; returns the key lines
+        that have to be spliced in and (sparse mode) the line numbers of
+        keys that became empty and have to go.
+        """
+        values = self.values(section)
+        entry = self.index[section]
+        missing = []
+        emptied = []
+        for key in keys:
+            value = values.get(key, "")
+            i = entry['keys'].get(key)
+            if i is None:
+                if value or not self.sparse:
+                    missing.append(f"{key}={value}")
+                continue
+            if self.sparse and not value:
+                emptied.append(i)
+                continue
+            line = self.lines[i]
+            if line.split('=', 1)[1].strip() == value:
+                continue
+            prefix = self.KEY_PREFIX_RE.match(line).group(1)
+            self.lines[i] = (prefix + value) if value else prefix.rstrip()
+        return missing, emptied
+    
+    def _has_comments(self, section):
+        entry = self.index[section]
+        return any(self.lines[i].strip().startswith('#')
+                   for i in range(entry['header'] + 1, entry['last'] + 1))
+    
+    def _section_block_end(self, section):
+        """Line number just past a section's last line and trailing blanks"""
+        end = self.index[section]['last'] + 1
+        while end < len(self.lines) and not self.lines[end].strip():
+            end += 1
+        return end
+    
+    def _sync_document(self, zones, events, monitors):
+        """Patch only the sections that changed (or are new to the file)"""
+        layout = self._layout_sections(zones, monitors)
+        layout_set = set(layout)
+        todo = [s for s in layout if s in self.dirty or s not in self.index]
+        todo += [s for s in self.dirty if s not in layout_set and s in self.sections]
+        
+        # (start, end, new_lines) replacements of self.lines[start:end]
+        splices = []
+        appends = []
+        for section in todo:
+            values = self.values(section)
+            if section in layout_set:
+                keys = list(events) + [k for k in values if k not in events]
+            else:
+                keys = list(values)
             
-            sorted_monitors = []
-            if primary_mon:
-                sorted_monitors.append(primary_mon)
-            sorted_monitors.extend(secondary_mons)
+            if section not in self.index:
+                if not self.sparse or any(values.values()):
+                    appends.append(section)
+                continue
             
-            # Write all monitors in order
-            for mon in sorted_monitors:
-                mon_name = mon['name']
-                
-                # Write all zones for this monitor
-                for zone in zones:
-                    # Create section name
-                    if mon['primary']:
-                        section_name = zone
-                    else:
-                        section_name = f"{mon_name}-{zone}"
-                    
-                    f.write(f"[{section_name}]\n")
-                    
-                    # Write ALL events (even if empty)
-                    for event in events:
-                        value = self.data.get(section_name, {}).get(event, "")
-                        f.write(f"{event}={value}\n")
-                    
-                    f.write("\n")
+            entry = self.index[section]
+            keys += [k for k in entry['keys'] if k not in keys]
+            missing, emptied = self._patch_section(section, keys)
+            if self.sparse and len(emptied) == len(entry['keys']) and not missing \
+                    and not self._has_comments(section):
+                # Nothing left in the section, and no comments to keep
+                splices.append((entry['header'], self._section_block_end(section), []))
+                continue
+            for i in emptied:
+                splices.append((i, i + 1, []))
+            if missing:
+                pos = entry['last'] + 1
+                splices.append((pos, pos, missing))
+        
+        # Apply bottom-up so earlier positions stay valid
+        for start, end, new_lines in sorted(splices, key=lambda s: (s[0], s[1]), reverse=True):
+            self.lines[start:end] = new_lines
+        
+        for section in appends:
+            if self.lines and self.lines[-1].strip():
+                self.lines.append("")
+            values = self.values(section)
+            keys = list(events) if section in layout_set else []
+            keys += [k for k in values if k not in keys]
+            if self.sparse:
+                keys = [k for k in keys if values.get(k)]
+            self.lines.append(f"[{section}]")
+            self.lines.extend(f"{key}={values.get(key, '')}" for key in keys)
+            self.lines.append("")
+        
+        if splices or appends:
+            _, self.index = self._scan()
+    
+    def write(self, filepath, zones, events, monitors):
+        """
+        Write config file preserving case
+        
+        Only the lines of changed sections are touched. Nothing is written
+        (and the mtime is left alone) when the result would be byte-identical
+        to what is already on disk. Returns True if the file was rewritten,
+        False if the write was skipped.
+        """
+        layout = (
+            tuple(zones), tuple(events),
+            tuple((m['name'], m['primary']) for m in monitors)
+        )
+        stat_key = self._stat_key(filepath)
+        last_stat = self.disk_state[2] if self.disk_state else None
+        
+        if stat_key is not None and stat_key == last_stat:
+            # Fast path: nothing touched since our last write
+            if not self.dirty and layout == self.disk_state[1]:
+                self.skip_count += 1
+                return False
+        elif stat_key is not None:
+            self._merge_from_disk(filepath)
+        
+        if self.lines:
+            self._sync_document(zones, events, monitors)
+        else:
+            self._load_text(self.serialize(zones, events, monitors))
+        
+        text = self.text()
+        digest = self._digest(text)
+        if stat_key is not None and stat_key == last_stat and digest == self.disk_state[0]:
+            self.dirty.clear()
+            self.disk_state = (digest, layout, stat_key)
+            self.skip_count += 1
+            return False
+        
+        atomic_write(filepath, text)
+        self.dirty.clear()
+        self.disk_state = (digest, layout, self._stat_key(filepath))
+        self.write_count += 1
+        return True
     
     def has_section(self, section):
-        return section in self.data
+        return section in self.sections
     
     def add_section(self, section):
-        if section not in self.data:
-            self.data[section] = {}
+        if section not in self.sections:
+            self.sections[section] = self.slot(section)
+            self.dirty.add(section)
     
     def get(self, section, option, fallback=""):
+        addr = self.sections.get(section)
+        if addr is not None:
+            event = self.store.event_index.get(option)
+            if event is not None:
+                return self.store.get(addr[0], addr[1], event) or fallback
         try:
-            return self.data[section][option]
+            return self.extras[section][option]
         except KeyError:
             return fallback
     
     def set(self, section, option, value):
-        if section not in self.data:
-            self.data[section] = {}
-        self.data[section][option] = value
+        self.add_section(section)
+        addr = self.sections[section]
+        event = self.store.event_index.get(option) if addr is not None else None
+        if event is None:
+            extras = self.extras.setdefault(section, {})
+            if extras.get(option) == value:
+                return
+            extras[option] = value
+        elif not self.store.set(addr[0], addr[1], event, value):
+            return
+        self.dirty.add(section)
     
     def remove_option(self, section, option):
-        if section in self.data and option in self.data[section]:
-            del self.data[section][option]
-
-
-class HotspotWindow(Gtk.Window):
-    """Individual hotspot detail window"""
-    
-    ZONE_INFO = {
-        'TopLeft': {'pos': (0, 0), 'emoji': '↖'},
-        'TopCenter': {'pos': (0.5, 0), 'emoji': '↑'},
-        'TopRight': {'pos': (1, 0), 'emoji': '↗'},
-        'Left': {'pos': (0, 0.5), 'emoji': '←'},
-        'Right': {'pos': (1, 0.5), 'emoji': '→'},
-        'BottomLeft': {'pos': (0, 1), 'emoji': '↙'},
-        'BottomCenter': {'pos': (0.5, 1), 'emoji': '↓'},
-        'BottomRight': {'pos': (1, 1), 'emoji': '↘'},
-    }
+        if section not in self.sections:
+            return
+        addr = self.sections[section]
+        event = self.store.event_index.get(option) if addr is not None else None
+        if event is not None:
+            if self.store.set(addr[0], addr[1], event, ""):
+                self.dirty.add(section)
+        elif option in self.extras.get(section, {}):
+            del self.extras[section][option]
+            self.dirty.add(section)
+
+
+class ProfileStore:
+    """
+    Bindings per display layout, kept next to fittsmonrc
     
-    def __init__(self, zone, monitor_name, commands_dict, monitor_geom):
-        Gtk.Window.__init__(self, type=Gtk.WindowType.POPUP)
-        
-        self.zone = zone
-        self.monitor_name = monitor_name
-        self.commands = commands_dict
-        self.monitor_geom = monitor_geom
-        
-        # Window setup
-        self.set_decorated(False)
-        self.set_keep_above(True)
-        self.set_skip_taskbar_hint(True)
-        self.set_skip_pager_hint(True)
-        self.set_app_paintable(True)
-        self.set_type_hint(Gdk.WindowTypeHint.POPUP_MENU)
-        
-        # Transparency
-        screen = Gdk.Screen.get_default()
-        visual = screen.get_rgba_visual()
-        if visual:
-            self.set_visual(visual)
-        self.connect("draw", self.on_draw)
-        
-        # Content
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        box.set_margin_top(15)
-        box.set_margin_bottom(15)
-        box.set_margin_start(15)
-        box.set_margin_end(15)
-        
-        # Zone header
-        header = Gtk.Label()
-        header.set_markup(
-            f"<big><b>{self.ZONE_INFO[zone]['emoji']} {zone}</b></big>\n"
-            f"<small>{monitor_name}</small>"
-        )
-        header.set_halign(Gtk.Align.CENTER)
-        box.pack_start(header, False, False, 0)
-        
-        # Commands list
-        for event, command in commands_dict.items():
-            if command.strip():
-                cmd_display = command if len(command) < 30 else command[:27] + "..."
-                event_label = Gtk.Label()
-                event_label.set_markup(f"<small><b>{event}</b>\n{cmd_display}</small>")
-                event_label.set_halign(Gtk.Align.START)
-                event_label.set_line_wrap(True)
-                event_label.set_max_width_chars(35)
-                box.pack_start(event_label, False, False, 0)
-        
-        self.add(box)
-        self.set_size_request(300, -1)
-        self.show_all()
-        self.position_window()
-    
-    def position_window(self):
-        """Position window at zone location on specific monitor"""
-        geom = self.monitor_geom
-        
-        x_pos, y_pos = self.ZONE_INFO[self.zone]['pos']
-        
-        window_width = 300
-        padding = 20
-        
-        if x_pos == 0:
-            x = geom['x'] + padding
-        elif x_pos == 0.5:
-            x = geom['x'] + (geom['width'] // 2) - (window_width // 2)
-        else:
-            x = geom['x'] + geom['width'] - window_width - padding
-        
-        if y_pos == 0:
-            y = geom['y'] + padding
-        elif y_pos == 0.5:
-            y = geom['y'] + (geom['height'] // 2)
-        else:
-            y = geom['y'] + geom['height']
-        
-        self.move(int(x), int(y))
-        GLib.idle_add(self._reposition_after_layout, geom, x_pos, y_pos)
+    fittsmonrc can only describe one layout: the primary monitor's sections
+    have no prefix, so the same [TopLeft] means the laptop panel on the
+    road and the external screen at the desk. Every layout (the set of
+    connected outputs plus which one is primary) gets its own copy of the
+    non-empty bindings here, in one small JSON file that is read once and
+    rewritten atomically only when a profile actually changed.
+    """
     
-    def _reposition_after_layout(self, geom, x_pos, y_pos):
-        """Reposition window after it's been fully drawn"""
-        _, window_height = self.get_size()
-        x, _ = self.get_position()
-        
-        padding = 20
-        
-        if y_pos == 0:
-            y = geom['y'] + padding
-        elif y_pos == 0.5:
-            y = geom['y'] + (geom['height'] // 2) - (window_height // 2)
-        else:
-            y = geom['y'] + geom['height'] - window_height - padding
-        
-        self.move(int(x), int(y))
-        return False
+    def __init__(self, path):
+        self.path = Path(path)
+        self.profiles = None    # {layout key: {section: {event: command}}}
+        self.last = None        # layout fittsmonrc was last written for
+        self.dirty = False
     
-    def on_draw(self, widget, context):
-        """Draw semi-transparent background"""
-        context.set_source_rgba(0.1, 0.1, 0.1, 0.88)
-        context.paint()
-        return False
+    @staticmethod
+    def layout_key(monitors):
+        return ",".join(sorted(f"{mon['name']}{'*' if mon['primary'] else ''}" for mon in monitors))
+    
+    def _load(self):
+        if self.profiles is not None:
+            return
+        self.profiles = {}
+        try:
+            data = json.loads(self.path.read_text())
+            self.profiles = data.get("profiles", {})
+            self.last = data.get("last")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"[ERROR] Ignoring unreadable {self.path}: {e}")
+    
+    def get(self, key):
+        self._load()
+        return self.profiles.get(key)
+    
+    def last_layout(self):
+        self._load()
+        return self.last
+    
+    def put(self, key, bindings):
+        self._load()
+        if self.profiles.get(key) != bindings or self.last != key:
+            self.profiles[key] = bindings
+            self.last = key
+            self.dirty = True
+    
+    def save(self):
+        if not self.dirty:
+            return False
+        text = json.dumps({"last": self.last, "profiles": self.profiles},
+                          separators=(",", ":"), sort_keys=True)
+        atomic_write(self.path, text + "\n")
+        self.dirty = False
+        return True
 
 
-class MonitorHelper:
-    """Helper class to manage monitor information"""
+class RandrOutputs:
+    """
+    The connected outputs as RandR reports them, with its primary flag
+    and the EDID of the attached monitor
     
-    def __init__(self):
-        self.monitors = {}
+    The GUI and the command line both take their monitor list from here,
+    so they name the same sections, and the GUI places its overlays with
+    the geometry from the same reply. The X server is asked in-process
+    through libXrandr; nothing is forked. GDK can't be used for the
+    primary: without a RandR primary it makes one up (the laptop panel or
+    monitor 0), while fittsmonrc has no unprefixed sections then.
+    """
     
-    def detect_monitors(self):
-        """Detect all monitors and their geometry using modern Gdk.Display API"""
-        self.monitors = {}
-        display = Gdk.Display.get_default()
-        
-        n_monitors = display.get_n_monitors()
-        for i in range(n_monitors):
-            monitor = display.get_monitor(i)
-            geom = monitor.get_geometry()
-            
-            monitor_name = monitor.get_model()
-            if not monitor_name:
-                monitor_name = f"Monitor-{i}"
-            
-            if monitor_name in self.monitors:
-                monitor_name = f"{monitor_name}-{i}"
-            
-            self.monitors[monitor_name] = {
-                'index': i,
-                'x': geom.x,
-                'y': geom.y,
-                'width': geom.width,
-                'height': geom.height
-            }
-            
-            print(f"[MONITOR] {monitor_name}: {geom.x},{geom.y} ({geom.width}x{geom.height})")
-        
-        return self.monitors
+    RR_CONNECTED = 0
+    # In 32-bit units: the 128-byte EDID base block is all that's needed
+    EDID_LONGS = 32
     
-    def get_monitor_geom(self, monitor_name):
-        """Get geometry for specific monitor"""
-        if monitor_name in self.monitors:
-            return self.monitors[monitor_name]
-        
-        if self.monitors:
-            return list(self.monitors.values())[0]
+    class ScreenResources(ctypes.Structure):
+        _fields_ = [
+            ("timestamp", ctypes.c_ulong),
+            ("configTimestamp", ctypes.c_ulong),
+            ("ncrtc", ctypes.c_int),
+            ("crtcs", ctypes.POINTER(ctypes.c_ulong)),
+            ("noutput", ctypes.c_int),
+            ("outputs", ctypes.POINTER(ctypes.c_ulong)),
+            ("nmode", ctypes.c_int),
+            ("modes", ctypes.c_void_p),
+        ]
+    
+    class OutputInfo(ctypes.Structure):
+        _fields_ = [
+            ("timestamp", ctypes.c_ulong),
+            ("crtc", ctypes.c_ulong),
+            ("name", ctypes.c_void_p),
+            ("nameLen", ctypes.c_int),
+            ("mm_width", ctypes.c_ulong),
+            ("mm_height", ctypes.c_ulong),
+            ("connection", ctypes.c_ushort),
+            ("subpixel_order", ctypes.c_ushort),
+            ("ncrtc", ctypes.c_int),
+            ("crtcs", ctypes.POINTER(ctypes.c_ulong)),
+            ("nclone", ctypes.c_int),
+            ("clones", ctypes.POINTER(ctypes.c_ulong)),
+            ("nmode", ctypes.c_int),
+            ("npreferred", ctypes.c_int),
+            ("modes", ctypes.POINTER(ctypes.c_ulong)),
+        ]
+    
+    class CrtcInfo(ctypes.Structure):
+        _fields_ = [
+            ("timestamp", ctypes.c_ulong),
+            ("x", ctypes.c_int),
+            ("y", ctypes.c_int),
+            ("width", ctypes.c_uint),
+            ("height", ctypes.c_uint),
+            ("mode", ctypes.c_ulong),
+            ("rotation", ctypes.c_ushort),
+            ("noutput", ctypes.c_int),
+            ("outputs", ctypes.POINTER(ctypes.c_ulong)),
+            ("rotations", ctypes.c_ushort),
+            ("npossible", ctypes.c_int),
+            ("possible", ctypes.POINTER(ctypes.c_ulong)),
+        ]
+    
+    @classmethod
+    def query(cls):
+        """
+        [{'name', 'primary', 'edid', 'x', 'y', 'width', 'height'}] of the
+        connected outputs that are switched on, primary first; [] without
+        a display or RandR. 'edid' is b"" if the monitor has none, the
+        geometry is the output's CRTC in screen pixels.
+        """
+        try:
+            outputs = cls.query_xlib()
+        except (OSError, AttributeError) as e:
+            # AttributeError: a libXrandr without RandR 1.3
+            print(f"[ERROR] Monitor detection failed: RandR unavailable ({e})")
+            return []
+        # The X server lists the primary first too; get_section_prefix relies on it
+        return sorted(outputs, key=lambda out: not out['primary'])
+    
+    @classmethod
+    def query_xlib(cls):
+        """The outputs straight from the X server; OSError if libXrandr can't be loaded"""
+        x11 = ctypes.CDLL("libX11.so.6")
+        xrandr = ctypes.CDLL("libXrandr.so.2")
+        resources_p = ctypes.POINTER(cls.ScreenResources)
+        info_p = ctypes.POINTER(cls.OutputInfo)
+        crtc_p = ctypes.POINTER(cls.CrtcInfo)
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XInternAtom.restype = ctypes.c_ulong
+        x11.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        x11.XFree.argtypes = [ctypes.c_void_p]
+        xrandr.XRRGetOutputPrimary.restype = ctypes.c_ulong
+        xrandr.XRRGetOutputPrimary.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        xrandr.XRRGetScreenResourcesCurrent.restype = resources_p
+        xrandr.XRRGetScreenResourcesCurrent.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        xrandr.XRRFreeScreenResources.argtypes = [resources_p]
+        xrandr.XRRGetOutputInfo.restype = info_p
+        xrandr.XRRGetOutputInfo.argtypes = [ctypes.c_void_p, resources_p, ctypes.c_ulong]
+        xrandr.XRRFreeOutputInfo.argtypes = [info_p]
+        xrandr.XRRGetCrtcInfo.restype = crtc_p
+        xrandr.XRRGetCrtcInfo.argtypes = [ctypes.c_void_p, resources_p, ctypes.c_ulong]
+        xrandr.XRRFreeCrtcInfo.argtypes = [crtc_p]
+        xrandr.XRRGetOutputProperty.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_long, ctypes.c_long,
+            ctypes.c_int, ctypes.c_int, ctypes.c_ulong, ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte))
+        ]
         
-        return {'x': 0, 'y': 0, 'width': 1920, 'height': 1080}
+        display = x11.XOpenDisplay(None)
+        if not display:
+            print("[ERROR] Monitor detection failed: cannot open the X display")
+            return []
+        outputs = []
+        try:
+            root = x11.XDefaultRootWindow(display)
+            primary = xrandr.XRRGetOutputPrimary(display, root)
+            # Only if it exists: a server without it has no EDIDs to give
+            edid_atom = x11.XInternAtom(display, b"EDID", True)
+            resources = xrandr.XRRGetScreenResourcesCurrent(display, root)
+            if not resources:
+                return []
+            try:
+                for i in range(resources.contents.noutput):
+                    output = resources.contents.outputs[i]
+                    info = xrandr.XRRGetOutputInfo(display, resources, output)
+                    if not info:
+                        continue
+                    try:
+                        if info.contents.connection != cls.RR_CONNECTED or not info.contents.crtc:
+                            continue
+                        crtc = xrandr.XRRGetCrtcInfo(display, resources, info.contents.crtc)
+                        if not crtc:
+                            continue
+                        try:
+                            geometry = {key: getattr(crtc.contents, key) for key in ('x', 'y', 'width', 'height')}
+                        finally:
+                            xrandr.XRRFreeCrtcInfo(crtc)
+                        name = ctypes.string_at(info.contents.name, info.contents.nameLen)
+                        outputs.append({
+                            'name': name.decode(errors="replace"),
+                            'primary': output == primary,
+                            'edid': cls.read_edid(xrandr, x11, display, output, edid_atom),
+                            **geometry
+                        })
+                    finally:
+                        xrandr.XRRFreeOutputInfo(info)
+            finally:
+                xrandr.XRRFreeScreenResources(resources)
+        finally:
+            x11.XCloseDisplay(display)
+        return outputs
+    
+    @classmethod
+    def read_edid(cls, xrandr, x11, display, output, edid_atom):
+        """The EDID property of an output, b"" if it has none"""
+        if not edid_atom:
+            return b""
+        actual_type = ctypes.c_ulong()
+        actual_format = ctypes.c_int()
+        nitems = ctypes.c_ulong()
+        bytes_after = ctypes.c_ulong()
+        prop = ctypes.POINTER(ctypes.c_ubyte)()
+        status = xrandr.XRRGetOutputProperty(
+            display, output, edid_atom, 0, cls.EDID_LONGS, False, False, 0,
+            ctypes.byref(actual_type), ctypes.byref(actual_format), ctypes.byref(nitems),
+            ctypes.byref(bytes_after), ctypes.byref(prop)
+        )
+        if status != 0 or not prop:
+            return b""
+        try:
+            return ctypes.string_at(prop, nitems.value) if actual_format.value == 8 else b""
+        finally:
+            x11.XFree(prop)
 
 
-class ZoneGridWidget(Gtk.Grid):
-    """Visual 8-zone grid selector"""
+class MonitorIdentities:
+    """
+    Which connector each physical monitor was last seen on
     
-    ZONE_INFO = {
-        'TopLeft': {'emoji': '↖', 'pos': (0, 0)},
-        'TopCenter': {'emoji': '↑', 'pos': (1, 0)},
-        'TopRight': {'emoji': '↗', 'pos': (2, 0)},
-        'Left': {'emoji': '←', 'pos': (0, 1)},
-        'Right': {'emoji': '→', 'pos': (2, 1)},
-        'BottomLeft': {'emoji': '↙', 'pos': (0, 2)},
-        'BottomCenter': {'emoji': '↓', 'pos': (1, 2)},
-        'BottomRight': {'emoji': '↘', 'pos': (2, 2)},
-    }
+    Identities are built from the EDID (vendor, product and serial), so
+    a screen that a docking station moves from DP-1 to DP-3 is still
+    recognised and its sections can follow it. The table is a dict loaded
+    once from a small JSON file: every lookup is O(1).
+    """
     
-    def __init__(self, zones, callback):
-        Gtk.Grid.__init__(self)
-        self.set_column_spacing(8)
-        self.set_row_spacing(8)
-        self.set_halign(Gtk.Align.CENTER)
-        
-        self.zones = zones
-        self.callback = callback
-        self.buttons = {}
-        self.active_zone = zones[0]
+    EDID_HEADER = b"\x00\xff\xff\xff\xff\xff\xff\x00"
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.connectors = None  # {identity: connector}
+    
+    @classmethod
+    def identity(cls, edid):
+        """
+        "VENDOR-PRODUCT-SERIAL" from an EDID base block, "" without one.
+        Vendor and product are bytes 8-11; the serial is the text of the
+        0xFF display descriptor, else the number in bytes 12-15, else "".
+        """
+        if len(edid) < 128 or edid[:8] != cls.EDID_HEADER:
+            return ""
+        # Three letters of five bits each, "A" being 1
+        packed = int.from_bytes(edid[8:10], "big")
+        vendor = "".join(chr(ord("A") - 1 + (packed >> shift & 0x1F)) for shift in (10, 5, 0))
+        product = int.from_bytes(edid[10:12], "little")
         
-        for row in range(3):
-            for col in range(3):
-                if row == 1 and col == 1:
-                    continue
-                
-                zone = None
-                for z, info in self.ZONE_INFO.items():
-                    if info['pos'] == (col, row):
-                        zone = z
-                        break
-                
-                if zone:
-                    btn = Gtk.Button()
-                    btn.set_size_request(60, 60)
-                    btn.set_label(f"{self.ZONE_INFO[zone]['emoji']}\n{zone.replace('Center', 'C').replace('Left', 'L').replace('Right', 'R')}")
-                    btn.set_tooltip_text(zone)
-                    btn.connect("clicked", self.on_zone_clicked, zone)
-                    
-                    self.buttons[zone] = btn
-                    self.attach(btn, col, row, 1, 1)
-        
-        self.update_colors()
-        self.show_all()
-    
-    def on_zone_clicked(self, button, zone):
-        self.active_zone = zone
-        self.update_colors()
-        self.callback(zone)
-    
-    def update_colors(self):
-        for zone, btn in self.buttons.items():
-            if zone == self.active_zone:
-                btn.get_style_context().remove_class("zone-inactive")
-                btn.get_style_context().add_class("zone-active")
-            else:
-                btn.get_style_context().remove_class("zone-active")
-                btn.get_style_context().add_class("zone-inactive")
+        serial = ""
+        for offset in (54, 72, 90, 108):
+            if edid[offset:offset + 3] == b"\0\0\0" and edid[offset + 3] == 0xFF:
+                serial = edid[offset + 5:offset + 18].decode("ascii", "replace").split("\n")[0].strip()
+                break
+        if not serial:
+            number = int.from_bytes(edid[12:16], "little")
+            serial = str(number) if number else ""
+        return f"{vendor}-{product:04X}-{serial}"
     
-    def set_active_zone(self, zone):
-        if zone in self.buttons:
-            self.active_zone = zone
-            self.update_colors()
+    def _load(self):
+        if self.connectors is not None:
+            return
+        self.connectors = {}
+        try:
+            self.connectors = dict(json.loads(self.path.read_text()))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[ERROR] Ignoring unreadable {self.path}: {e}")
+    
+    def resolve(self, monitors):
+        """
+        Record the connectors of monitors [(name, identity)] and return
+        the (old name, new name) renames since they were last seen. A
+        monitor only moves if its old connector is free now, and identities
+        shared by two connected monitors (same model, no serial) are ignored.
+        """
+        self._load()
+        connected = {name for name, _identity in monitors}
+        counts = {}
+        for _name, identity in monitors:
+            counts[identity] = counts.get(identity, 0) + 1
+        
+        renames = []
+        changed = False
+        for name, identity in monitors:
+            if not identity or counts[identity] > 1:
+                continue
+            previous = self.connectors.get(identity)
+            if previous is not None and previous != name and previous not in connected:
+                renames.append((previous, name))
+            if previous != name:
+                self.connectors[identity] = name
+                changed = True
+        
+        if changed:
+            try:
+                atomic_write(self.path, json.dumps(self.connectors, sort_keys=True, indent=0) + "\n")
+            except OSError as e:
+                print(f"[ERROR] Failed to save {self.path}: {e}")
+        return renames
 
 
-class HelpDialog(Gtk.Dialog):
-    """Help dialog with usage information"""
+class FileOpenWatch:
+    """
+    Counts the times a file is opened, through inotify (IN_OPEN)
     
-    def __init__(self, parent):
-        Gtk.Dialog.__init__(
-            self,
-            title=_('help_title'),
-            parent=parent,
-            flags=0
-        )
-        self.add_button(_('close'), Gtk.ResponseType.CLOSE)
-        self.set_default_size(500, 450)
-        
-        content = self.get_content_area()
-        content.set_margin_top(15)
-        content.set_margin_bottom(15)
-        content.set_margin_start(15)
-        content.set_margin_end(15)
-        
-        scroll = Gtk.ScrolledWindow()
-        scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        
-        help_label = Gtk.Label()
-        help_label.set_markup(_('help_text'))
-        help_label.set_line_wrap(True)
-        help_label.set_xalign(0)
-        help_label.set_selectable(True)
-        
-        scroll.add(help_label)
-        content.pack_start(scroll, True, True, 0)
-
-        about_sep = Gtk.Separator()
-        about_sep.set_margin_top(10)
-        about_sep.set_margin_bottom(10)
-        content.pack_start(about_sep, False, False, 0)
-
-        about_label = Gtk.Label()
-        about_label.set_markup(
-            '<big><b>fittsmon-gui</b></big> v{version}\n'
-            '<a href="https://github.com/musqz/fittsmon-gui">github.com/musqz/fittsmon-gui</a>\n'
-            'musqz · MIT'.format(version=GLib.markup_escape_text(_VERSION))
-        )
-        about_label.set_justify(Gtk.Justification.CENTER)
-        about_label.set_selectable(True)
-        content.pack_start(about_label, False, False, 0)
-
-        self.show_all()
+    Set up before SIGHUP is sent, it tells whether the daemon really read
+    fittsmonrc again: a SIGHUP handler alone doesn't mean it reloads.
+    The directory is watched for opens of the file's name, so a save that
+    renames a new file into place meanwhile doesn't hide the reopen.
+    """
+    
+    IN_OPEN = 0x20
+    EVENT_SIZE = 16     # struct inotify_event, the name follows
+    
+    def __init__(self, path):
+        # The daemon opens the file a symlink points to (see atomic_write)
+        path = Path(os.path.realpath(path))
+        self.name = os.fsencode(path.name)
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(path.parent), self.IN_OPEN) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            self.fd = None
+            raise OSError(errno, f"cannot watch {path.parent}")
+        self.opens = 0
+    
+    def count(self):
+        """Opens seen so far (never blocks)"""
+        while self.fd is not None:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + self.EVENT_SIZE <= len(data):
+                mask = int.from_bytes(data[offset + 4:offset + 8], sys.byteorder)
+                name_len = int.from_bytes(data[offset + 12:offset + 16], sys.byteorder)
+                start = offset + self.EVENT_SIZE
+                name = data[start:start + name_len].split(b"\0", 1)[0]
+                if mask & self.IN_OPEN and name == self.name:
+                    self.opens += 1
+                offset = start + name_len
+        return self.opens
+    
+    @contextlib.contextmanager
+    def ignoring(self):
+        """Don't count the opens made inside the with block (our own)"""
+        before = self.count()
+        try:
+            yield
+        finally:
+            self.count()
+            self.opens = before
+    
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
 
 
-class FittsmonGUI:
-    WHEEL_CONFLICT_PAIRS = {
-        'WheelUp': 'WheelUpOnce',
-        'WheelUpOnce': 'WheelUp',
-        'WheelDown': 'WheelDownOnce',
-        'WheelDownOnce': 'WheelDown'
-    }
+class DaemonTracker:
+    """
+    Finds and tracks fittsmon processes without forking pgrep/killall
     
-    ENTER_LEAVE_EVENTS = {'Enter', 'Leave'}
-    BUTTON_EVENTS = {'LeftButton', 'RightButton', 'MiddleButton'}
+    The PID of a daemon we start (or find) is kept in a pidfile under
+    $XDG_RUNTIME_DIR together with its start time, so a status check is a
+    pidfd poll or a /proc read and survives GUI restarts. Daemons started
+    some other way are found with a single scan of /proc that matches the
+    process name exactly, instead of pgrep -f matching any command line
+    that mentions "fittsmon" (including fittsmon-gui itself).
+    """
     
-    def __init__(self):
+    def __init__(self, name="fittsmon", pidfile=None):
+        self.name = name
+        self.pidfile = Path(pidfile) if pidfile else self.default_pidfile()
+        self.pid = None
+        self.starttime = None
+        self.pidfd = None
+        self.fingerprint = None     # of the config the daemon was started with
+        self._load_pidfile()
+    
+    @staticmethod
+    def default_pidfile():
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if runtime_dir:
+            base = Path(runtime_dir) / "fittsmon-gui"
+        else:
+            base = Path(tempfile.gettempdir()) / f"fittsmon-gui-{os.getuid()}"
+        return base / "fittsmon.pid"
+    
+    @staticmethod
+    def proc_stat(pid):
+        """(state, starttime) of a process from /proc/<pid>/stat, None if gone"""
+        try:
+            with open(f"/proc/{pid}/stat", 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        # comm (in parentheses) may contain spaces; fields follow the last ')'
+        fields = data[data.rindex(b')') + 2:].split()
+        return fields[0].decode(), int(fields[19])
+    
+    @classmethod
+    def pid_alive(cls, pid):
+        stat = cls.proc_stat(pid)
+        return stat is not None and stat[0] not in ('Z', 'X')
+    
+    def _is_daemon(self, pid):
+        try:
+            with open(f"/proc/{pid}/comm") as f:
+                return f.read().rstrip('\n') == self.name
+        except OSError:
+            return False
+    
+    def _load_pidfile(self):
+        try:
+            fields = self.pidfile.read_text().split()
+            pid, starttime = int(fields[0]), int(fields[1])
+        except (OSError, ValueError, IndexError):
+            return
+        stat = self.proc_stat(pid)
+        if stat is not None and stat[1] == starttime and self._is_daemon(pid):
+            self._track(pid, starttime)
+            self.fingerprint = fields[2] if len(fields) > 2 else None
+        else:
+            self._remove_pidfile()
+    
+    def _remove_pidfile(self):
+        try:
+            self.pidfile.unlink()
+        except OSError:
+            pass
+    
+    def _track(self, pid, starttime):
+        self.forget()
+        self.pid = pid
+        self.starttime = starttime
+        if hasattr(os, 'pidfd_open'):
+            try:
+                self.pidfd = os.pidfd_open(pid)
+            except OSError:
+                self.pidfd = None
+    
+    def record(self, pid, fingerprint=None):
+        """
+        Track a daemon we just started (or found) and write the pidfile;
+        fingerprint identifies the config it runs, None if not known
+        """
+        stat = self.proc_stat(pid)
+        if stat is None:
+            return
+        self._track(pid, stat[1])
+        self.note_fingerprint(fingerprint)
+    
+    def note_fingerprint(self, fingerprint):
+        """The tracked daemon now runs the config with this fingerprint"""
+        if self.pid is None:
+            return
+        self.fingerprint = fingerprint
+        line = f"{self.pid} {self.starttime}"
+        if fingerprint:
+            line += f" {fingerprint}"
+        try:
+            self.pidfile.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            atomic_write(self.pidfile, line + "\n")
+        except OSError as e:
+            print(f"[ERROR] Failed to write {self.pidfile}: {e}")
+    
+    def forget(self, pid=None):
+        """Stop tracking (only if pid is the tracked one, when given)"""
+        if pid is not None and pid != self.pid:
+            return
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+        if self.pid is not None:
+            self.pid = None
+            self.starttime = None
+            self.fingerprint = None
+            self._remove_pidfile()
+    
+    def tracked_alive(self):
+        """Is the tracked daemon still running? No process is spawned."""
+        if self.pid is None:
+            return False
+        if self.pidfd is not None:
+            # A pidfd becomes readable once the process has exited
+            alive = not select.select([self.pidfd], [], [], 0)[0]
+        else:
+            stat = self.proc_stat(self.pid)
+            alive = stat is not None and stat[1] == self.starttime and stat[0] not in ('Z', 'X')
+        if not alive:
+            self.forget()
+        return alive
+    
+    def find(self):
+        """PIDs of all running daemons of this user (one /proc scan)"""
+        uid = os.getuid()
+        me = os.getpid()
+        pids = []
+        try:
+            entries = os.scandir('/proc')
+        except OSError:
+            return pids
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                pid = int(entry.name)
+                try:
+                    if pid == me or entry.stat().st_uid != uid:
+                        continue
+                except OSError:
+                    continue
+                if self._is_daemon(pid) and self.pid_alive(pid):
+                    pids.append(pid)
+        return pids
+    
+    def is_running(self):
+        if self.tracked_alive():
+            return True
+        pids = self.find()
+        if pids:
+            # Adopt it, so the next check is a cheap pidfd/proc lookup again
+            self.record(pids[0])
+        return bool(pids)
+    
+    def send(self, pids, sig):
+        for pid in pids:
+            try:
+                if pid == self.pid and self.pidfd is not None:
+                    signal.pidfd_send_signal(self.pidfd, sig)
+                else:
+                    os.kill(pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+    
+    def terminate(self, sig=signal.SIGTERM):
+        """Signal every running daemon; returns the PIDs signalled"""
+        pids = self.find()
+        self.send(pids, sig)
+        return pids
+    
+    @staticmethod
+    def catches(pid, sig):
+        """Has pid installed a handler for sig? (SigCgt in /proc/<pid>/status)"""
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("SigCgt:"):
+                        return bool(int(line.split()[1], 16) & (1 << (sig - 1)))
+        except (OSError, ValueError, IndexError):
+            pass
+        return False
+    
+    @staticmethod
+    def cmdline(pid):
+        try:
+            with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                return [arg.decode(errors="replace") for arg in f.read().split(b"\0")[:-1]]
+        except OSError:
+            return None
+    
+    def reload_targets(self, argv):
+        """
+        PIDs to send SIGHUP to instead of restarting, or None if a restart
+        is needed: no daemon runs, one of them would be killed by SIGHUP
+        (no handler installed) or was started with other arguments (the
+        monitor list is only read from the command line).
+        """
+        pids = self.find()
+        if not pids:
+            return None
+        # Compare the arguments only: the daemon may run through an
+        # interpreter or from a full path
+        tail = argv[1:]
+        for pid in pids:
+            args = self.cmdline(pid)
+            if args is None or args[len(args) - len(tail):] != tail:
+                return None
+            if not self.catches(pid, signal.SIGHUP):
+                return None
+        return pids
+    
+    def reload(self, argv, path):
+        """
+        Send SIGHUP if every daemon can take it. Returns the PIDs and a
+        FileOpenWatch on path (the config), set up just before, to confirm
+        they read it again; (None, None) if a restart is needed instead.
+        """
+        pids = self.reload_targets(argv)
+        if not pids:
+            return None, None
+        try:
+            watch = FileOpenWatch(path)
+        except OSError as e:
+            print(f"[DAEMON] A reload could not be confirmed ({e}), restarting instead")
+            return None, None
+        self.send(pids, signal.SIGHUP)
+        return pids, watch
+    
+    def wait_gone(self, pids, timeout):
+        """Block until all pids have exited (for the command line only)"""
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while any(self.pid_alive(pid) for pid in pids):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+        return True
+
+
+class FittsmonCore:
+    """
+    Config model and daemon control shared by the GUI and the command line
+    
+    Nothing in here touches GTK, so scripts can edit bindings on machines
+    without PyGObject or a running X session.
+    """
+    
+    # Process name (/proc/<pid>/comm) that identifies a running daemon
+    DAEMON_NAME = "fittsmon"
+    # After SIGHUP, time for the daemon to open fittsmonrc again before
+    # the reload counts as failed and it is restarted
+    RELOAD_CONFIRM_S = 1.0
+    
+    WHEEL_CONFLICT_PAIRS = {
+        'WheelUp': 'WheelUpOnce',
+        'WheelUpOnce': 'WheelUp',
+        'WheelDown': 'WheelDownOnce',
+        'WheelDownOnce': 'WheelDown'
+    }
+    
+    ENTER_LEAVE_EVENTS = {'Enter', 'Leave'}
+    BUTTON_EVENTS = {'LeftButton', 'RightButton', 'MiddleButton'}
+    
+    def __init__(self, sparse=False):
+        self.sparse = sparse
         self.config_dir = Path.home() / ".config/fittsmon"
         self.config_file = self.config_dir / "fittsmonrc"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         self.monitors = []
-        self.config = ConfigParser()
-        self.hotspot_windows = []
-        self.pending_status = None
-        self.monitor_helper = MonitorHelper()
-        self.daemon_was_running = False
-        self.is_restarting = False
+        self.section_names = {}
+        self.config = ConfigParser(sparse=self.sparse)
+        self.profiles = ProfileStore(self.config_dir / "profiles.json")
+        # False when self.monitors isn't the connected layout (--monitors)
+        self.track_layout = True
+        self.identities = MonitorIdentities(self.config_dir / "monitors.json")
+        self.daemon = DaemonTracker(self.DAEMON_NAME)
         
-        self.zones = [
-            "TopLeft", "TopCenter", "TopRight",
-            "Left", "Right",
-            "BottomLeft", "BottomCenter", "BottomRight"
-        ]
+        self.zones = list(ZONES)
+        self.events = list(EVENTS)
+    
+    def detect_monitors(self):
+        self.monitors = self.probe_monitors()
+        self.section_names = {}
+    
+    def probe_monitors(self):
+        """Ask RandR for the connected outputs (safe off the main thread)"""
+        monitors = []
+        try:
+            for output in RandrOutputs.query():
+                monitors.append({'name': output['name'], 'primary': output['primary']})
+                print(f"[DETECT] Monitor: {output['name']} {'[PRIMARY]' if output['primary'] else ''}")
+        except Exception as e:
+            print(f"[ERROR] Monitor detection failed: {e}")
+            monitors = [{'name': 'default', 'primary': True}]
+        return monitors
+    
+    def load_config(self, create_default=True):
+        self.apply_config(self.read_config(), create_default)
+    
+    def read_config(self):
+        """Parse fittsmonrc into a new ConfigParser (safe off the main thread)"""
+        config = ConfigParser(sparse=self.sparse)
+        if self.config_file.exists():
+            print(f"[CONFIG] Loading: {self.config_file}")
+            config.read(self.config_file)
+        return config
+    
+    def apply_config(self, config, create_default=True):
+        """
+        Use a parsed config; creates a default file if there is none yet,
+        unless create_default is False (the defaults then stay in memory
+        until the next save writes the file)
+        """
+        self.config = config
+        if self.config_file.exists() or not create_default:
+            return
+        if self.monitors:
+            print(f"[CONFIG] File not found - creating default from detected displays")
+            self.save_config()
+        else:
+            print(f"[CONFIG] File not found - no monitors detected, skipping default config creation")
+            self.set_status(f"{_('status_error')}: no monitors detected", error=True)
+    
+    def save_config(self):
+        try:
+            if self.config.write(self.config_file, self.zones, self.events, self.monitors):
+                print(f"[CONFIG] Saved: {self.config_file}")
+            else:
+                print(f"[CONFIG] Unchanged, not rewritten: {self.config_file}")
+            self.remember_layout()
+            self.set_status(_('status_saved'), error=False)
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to save config: {e}")
+            self.set_status(f"{_('status_error')}: {e}", error=True)
+            return False
+    
+    def binding_snapshot(self):
+        """Non-empty bindings as {section: {event: command}}"""
+        snapshot = {}
+        store = self.config.store
+        for slot, zone, event, command in store.iter_filled():
+            snapshot.setdefault(store.section_name(slot, zone), {})[store.events[event]] = command
+        return snapshot
+    
+    def remember_layout(self):
+        """Keep the current bindings as the profile of the connected layout"""
+        if not self.monitors or not self.track_layout:
+            return
+        self.profiles.put(self.profiles.layout_key(self.monitors), self.binding_snapshot())
+        try:
+            self.profiles.save()
+        except OSError as e:
+            print(f"[ERROR] Failed to save layout profiles: {e}")
+    
+    def restore_layout(self):
+        """
+        Load the bindings stored for the connected layout into the config
+        (not yet written). Returns True if that changed any binding; a
+        layout seen for the first time keeps the bindings as they are.
+        """
+        key = self.profiles.layout_key(self.monitors)
+        profile = self.profiles.get(key)
+        if profile is None:
+            print(f"[CONFIG] New display layout {key}, keeping the current bindings")
+            return False
         
-        self.events = [
-            "WheelUp", "WheelDown", "WheelUpOnce", "WheelDownOnce",
-            "LeftButton", "RightButton", "MiddleButton",
-            "Enter", "Leave"
-        ]
+        current = self.binding_snapshot()
+        changed = 0
+        for section, events in current.items():
+            for event in events:
+                if event not in profile.get(section, {}):
+                    self.config.set(section, event, "")
+                    changed += 1
+        for section, events in profile.items():
+            for event, command in events.items():
+                if current.get(section, {}).get(event) != command:
+                    self.config.set(section, event, command)
+                    changed += 1
+        self.section_names = {}
+        print(f"[CONFIG] Display layout {key}: {changed} binding(s) switched from its profile")
+        return changed > 0
+    
+    def move_monitor_sections(self, old, new):
+        """
+        Move the bindings of [old-Zone] sections to [new-Zone] (not yet
+        written); zones that already have bindings under the new name are
+        left alone. Returns the number of bindings moved.
+        """
+        moved = 0
+        for zone in self.zones:
+            old_section, new_section = f"{old}-{zone}", f"{new}-{zone}"
+            if not self.config.has_section(old_section):
+                continue
+            if any(self.config.values(new_section).values()):
+                print(f"[CONFIG] [{new_section}] already has bindings, not moving [{old_section}]")
+                continue
+            for event, command in self.config.values(old_section).items():
+                if command:
+                    self.config.set(new_section, event, command)
+                    self.config.set(old_section, event, "")
+                    moved += 1
+        self.section_names = {}
+        return moved
+    
+    def get_section_prefix(self, monitor):
+        if monitor == self.monitors[0]['name'] and self.monitors[0]['primary']:
+            return ""
+        return monitor
+    
+    def get_section_name(self, monitor, zone):
+        try:
+            return self.section_names[(monitor, zone)]
+        except KeyError:
+            pass
+        prefix = self.get_section_prefix(monitor)
+        section = f"{prefix}-{zone}" if prefix else zone
+        self.section_names[(monitor, zone)] = section
+        return section
+    
+    def get_command(self, monitor, zone, event):
+        section = self.get_section_name(monitor, zone)
+        return self.config.get(section, event, fallback="")
+    
+    def set_command(self, monitor, zone, event, command):
+        self.set_section_command(self.get_section_name(monitor, zone), event, command)
+    
+    def set_section_command(self, section, event, command):
+        if not self.config.has_section(section):
+            self.config.add_section(section)
         
-        self.detect_monitors()
-        self.load_config()
-        self.check_daemon_status()
-        self.setup_styles()
-        self.setup_gui()
+        if command and event in self.WHEEL_CONFLICT_PAIRS:
+            conflict_event = self.WHEEL_CONFLICT_PAIRS[event]
+            conflict_cmd = self.config.get(section, conflict_event, fallback="")
+            if conflict_cmd:
+                print(f"[CONFIG] Auto-clearing: {section}.{conflict_event}")
+                self.config.remove_option(section, conflict_event)
+        
+        self.config.set(section, event, command)
+        print(f"[CONFIG] Set {section}.{event} = '{command}'")
     
-    def detect_monitors(self):
+    def section_mask(self, monitor, zone):
+        """Bitmask (BindingStore.event_index bits) of a zone's non-empty events"""
+        addr = self.config.sections.get(self.get_section_name(monitor, zone))
+        return self.config.store.section_mask(*addr) if addr is not None else 0
+    
+    def slot_monitors(self):
+        """Monitor name of each BindingStore slot (the primary's for "")"""
+        primary = self.monitors[0]['name'] if self.monitors and self.monitors[0]['primary'] else ""
+        return [prefix or primary for prefix in self.config.store.prefixes]
+    
+    def section_monitor(self, section, zone):
+        """
+        The connected monitor whose zone is configured in section, if any
+        (None for a leftover [NAME-...] of the current primary)
+        """
+        return next((mon['name'] for mon in self.monitors
+                     if self.get_section_name(mon['name'], zone) == section), None)
+    
+    def bound_commands(self):
+        """(monitor, zone, event, command) of every non-empty binding"""
+        store = self.config.store
+        monitors = self.slot_monitors()
+        return [(monitors[slot], store.zones[zone], store.events[event], command)
+                for slot, zone, event, command in store.iter_filled()]
+    
+    def find_conflicts(self):
+        """
+        Every conflict in the config, on all monitors, connected or not:
+        [{'section', 'monitor', 'zone', 'type', 'events', 'conflict_events'}]
+        """
+        store = self.config.store
+        store.validate()
+        monitors = self.slot_monitors()
+        conflicts = []
+        for (slot, zone), found in sorted(store.conflicts.items()):
+            for kind, mask, other in found:
+                conflicts.append({
+                    'section': store.section_name(slot, zone),
+                    'monitor': monitors[slot],
+                    'zone': store.zones[zone],
+                    'type': kind,
+                    'events': store.event_names(mask),
+                    'conflict_events': store.event_names(other),
+                })
+        return conflicts
+    
+    def fix_conflicts(self):
+        """
+        Clear the second binding of every wheel conflict (not yet written);
+        returns the number of bindings cleared
+        """
+        cleared = 0
+        for conflict in self.find_conflicts():
+            if conflict['type'] != 'wheel':
+                continue
+            for event in conflict['conflict_events']:
+                print(f"[CONFIG] Fix conflict: clearing {conflict['section']}.{event}")
+                self.config.remove_option(conflict['section'], event)
+                cleared += 1
+        return cleared
+    
+    def is_daemon_running(self):
+        is_running = self.daemon.is_running()
+        print(f"[DAEMON] Status check: {'Running' if is_running else 'Not running'}")
+        return is_running
+    
+    def kill_fittsmon(self):
+        pids = self.daemon.terminate()
+        if not pids:
+            return True
+        print(f"[DAEMON] Stopping fittsmon (PID: {', '.join(map(str, pids))})")
+        return self.daemon.wait_gone(pids, timeout=3)
+    
+    def daemon_command(self):
+        return ["fittsmon", "--monitor"] + [m['name'] for m in self.monitors]
+    
+    def effective_config(self):
+        """
+        What the daemon acts on: its --monitor arguments and the set of
+        non-empty bindings. Formatting, comments, key order and empty keys
+        in fittsmonrc don't matter to it.
+        """
+        store = self.config.store
+        bindings = frozenset(
+            (store.section_name(slot, zone), store.events[event], command.strip())
+            for slot, zone, event, command in store.iter_filled()
+        )
+        return tuple(self.daemon_command()[1:]), bindings
+    
+    @staticmethod
+    def config_fingerprint(effective):
+        args, bindings = effective
+        digest = hashlib.sha1("\0".join(args).encode())
+        for binding in sorted(bindings):
+            digest.update(("\n" + "\0".join(binding)).encode())
+        return digest.hexdigest()
+    
+    def daemon_up_to_date(self):
+        """Does a running daemon already use exactly the current config?"""
+        return (self.daemon.is_running()
+                and self.daemon.fingerprint == self.config_fingerprint(self.effective_config()))
+    
+    def reload_fittsmon(self, settle=0.3):
+        """
+        Make the daemon pick up fittsmonrc: SIGHUP if it handles it, opens
+        the file again within RELOAD_CONFIRM_S and is still alive after
+        settle seconds, otherwise a full restart.
+        """
+        started = time.monotonic()
+        pids, watch = self.daemon.reload(self.daemon_command(), self.config_file)
+        if pids:
+            print(f"[DAEMON] Sent SIGHUP to fittsmon (PID: {', '.join(map(str, pids))})")
+            time.sleep(settle)
+            deadline = started + self.RELOAD_CONFIRM_S
+            while watch.count() < len(pids) and time.monotonic() < deadline:
+                time.sleep(0.02)
+            reread = watch.count() >= len(pids)
+            watch.close()
+            alive = all(self.daemon.pid_alive(pid) for pid in pids)
+            if reread and alive:
+                self.daemon.note_fingerprint(self.config_fingerprint(self.effective_config()))
+                print(f"[DAEMON] Reloaded in place, downtime 0 ms "
+                      f"(confirmed after {(time.monotonic() - started) * 1000:.0f} ms)")
+                return True
+            if alive:
+                print("[DAEMON] fittsmon did not read fittsmonrc again after SIGHUP, restarting it")
+            else:
+                print("[DAEMON] fittsmon died on SIGHUP, restarting it")
+        
+        self.kill_fittsmon()
+        down = time.monotonic()
+        if not self.start_fittsmon():
+            return False
+        print(f"[DAEMON] Restarted, downtime {(time.monotonic() - down) * 1000:.0f} ms")
+        return True
+    
+    def start_fittsmon(self):
         try:
-            result = subprocess.run(
-                ["xrandr", "--query"],
-                capture_output=True, text=True, timeout=5
+            cmd = self.daemon_command()
+            print(f"[DAEMON] Starting: {' '.join(cmd)}")
+            
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                close_fds=True,
+                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
             )
             
-            for line in result.stdout.split('\n'):
-                if ' connected' in line:
-                    parts = line.split()
-                    if len(parts) > 0:
-                        monitor_name = parts[0]
-                        is_primary = 'primary' in line
-                        self.monitors.append({
-                            'name': monitor_name,
-                            'primary': is_primary
-                        })
-                        print(f"[DETECT] Monitor: {monitor_name} {'[PRIMARY]' if is_primary else ''}")
+            self.daemon.record(process.pid, self.config_fingerprint(self.effective_config()))
+            time.sleep(1)
+            
+            if process.poll() is None:
+                print(f"[DAEMON] Started successfully (PID: {process.pid})")
+                return True
+            else:
+                return False
         except Exception as e:
-            print(f"[ERROR] Monitor detection failed: {e}")
-            self.monitors = [{'name': 'default', 'primary': True}]
+            print(f"[ERROR] Failed to start fittsmon: {e}")
+            return False
+    
+    def set_status(self, message, error=False, busy=False):
+        """Report progress; the GUI shows this in its status line"""
+        print(f"[{'ERROR' if error else 'STATUS'}] {message}")
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="fittsmon-gui",
+        description="Configure fittsmon screen-corner hotspots"
+    )
+    parser.add_argument(
+        "--sparse", action="store_true",
+        help="write only non-empty bindings to fittsmonrc"
+    )
+    parser.add_argument(
+        "--startup-profile", action="store_true",
+        help="print a timestamped breakdown of the startup phases"
+    )
+    parser.add_argument(
+        "--restart-on-hotplug", action="store_true",
+        help="restart a running daemon with the new --monitor list when "
+             "outputs are plugged or unplugged"
+    )
+    parser.add_argument(
+        "--daemon-log", metavar="FILE",
+        help="also append the output of daemons started by the GUI to FILE "
+             "(rotated at 1 MiB, 3 old files kept)"
+    )
+    parser.add_argument(
+        "--test-timeout", metavar="SECONDS", type=float, default=10.0,
+        help="stop a command started with Test or Benchmark after SECONDS, with its "
+             "child processes (default 10, 0 for never)"
+    )
+    
+    edits = parser.add_argument_group(
+        "headless editing",
+        "Edit fittsmonrc without starting the GUI. All edits of one call are "
+        "written at once."
+    )
+    edits.add_argument(
+        "--get", nargs=3, action="append", metavar=("MONITOR", "ZONE", "EVENT"),
+        help="print the command bound to an event"
+    )
+    edits.add_argument(
+        "--set", nargs=4, action="append", metavar=("MONITOR", "ZONE", "EVENT", "COMMAND"),
+        help="bind a command to an event"
+    )
+    edits.add_argument(
+        "--clear", nargs=3, action="append", metavar=("MONITOR", "ZONE", "EVENT"),
+        help="remove the command bound to an event"
+    )
+    edits.add_argument(
+        "--batch", metavar="FILE",
+        help="apply 'set MONITOR ZONE EVENT COMMAND' / 'clear MONITOR ZONE EVENT' "
+             "lines from FILE ('-' for stdin)"
+    )
+    edits.add_argument(
+        "--monitors", nargs="+", metavar="NAME",
+        help="connected outputs, primary first (default: ask xrandr)"
+    )
+    edits.add_argument(
+        "--restart", action="store_true",
+        help="restart the fittsmon daemon once after writing"
+    )
+    parser.add_argument(
+        "--benchmark-bindings", metavar="MONITORS", type=int, nargs="?", const=6,
+        help="compare binding lookups in the indexed store against nested "
+             "dicts for MONITORS displays (default 6) and exit"
+    )
+    parser.add_argument(
+        "--benchmark-config", metavar="MONITORS", type=int, nargs="?", const=6,
+        help="compare size and parse time of dense vs sparse config files "
+             "for MONITORS displays (default 6) and exit"
+    )
+    args = parser.parse_args(argv)
+    args.headless = bool(args.get or args.set or args.clear or args.batch)
+    if args.restart and not args.headless:
+        parser.error("--restart needs --set, --clear or --batch")
+    return args
+
+
+def read_batch(path):
+    """Parse a batch file into (action, monitor, zone, event, command) tuples"""
+    edits = []
+    # stdin is the caller's: read it, but leave it open
+    with contextlib.nullcontext(sys.stdin) if path == "-" else open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split(None, 4)
+            action = parts[0].lower()
+            if action == "set" and len(parts) == 5:
+                edits.append(("set", parts[1], parts[2], parts[3], parts[4]))
+            elif action == "clear" and len(parts) == 4:
+                edits.append(("clear", parts[1], parts[2], parts[3], ""))
+            else:
+                raise ValueError(f"{path}:{lineno}: expected 'set MONITOR ZONE EVENT COMMAND' "
+                                 f"or 'clear MONITOR ZONE EVENT'")
+    return edits
+
+
+def run_headless(args):
+    """--get/--set/--clear/--batch: edit fittsmonrc without GTK"""
+    edits = [("set", *edit) for edit in args.set or []]
+    edits += [("clear", *edit, "") for edit in args.clear or []]
+    output = []
+    
+    # Diagnostics go to stderr so --get output can be captured by scripts
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            if args.batch:
+                edits += read_batch(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            return 2
+        
+        core = FittsmonCore(sparse=args.sparse)
+        if args.monitors:
+            core.monitors = [{'name': name, 'primary': i == 0} for i, name in enumerate(args.monitors)]
+            # A scripted edit for some layout: the GUI must not take it for the last one
+            core.track_layout = False
+        else:
+            core.detect_monitors()
+        # A missing fittsmonrc is created by the save below, in one write
+        core.load_config(create_default=False)
+        
+        known = [m['name'] for m in core.monitors]
+        for _action, monitor, zone, event, _command in edits + [("get", *g, "") for g in args.get or []]:
+            if monitor not in known:
+                print(f"[ERROR] Unknown monitor '{monitor}' (connected: {', '.join(known)})")
+                return 2
+            if zone not in core.zones:
+                print(f"[ERROR] Unknown zone '{zone}' (one of: {', '.join(core.zones)})")
+                return 2
+            if event not in core.events:
+                print(f"[ERROR] Unknown event '{event}' (one of: {', '.join(core.events)})")
+                return 2
+        
+        for action, monitor, zone, event, command in edits:
+            core.set_command(monitor, zone, event, command if action == "set" else "")
+        
+        for monitor, zone, event in args.get or []:
+            output.append(core.get_command(monitor, zone, event))
+        
+        status = 0
+        if edits:
+            if not core.save_config():
+                return 1
+            if args.restart and core.daemon_up_to_date():
+                print("[DAEMON] Configuration unchanged for the daemon, not restarting")
+            elif args.restart:
+                if not core.reload_fittsmon():
+                    print("[ERROR] Failed to restart fittsmon")
+                    status = 1
+    
+    for line in output:
+        print(line)
+    return status
+
+
+def benchmark_config(n_monitors, rounds=200):
+    """Size and parse-time comparison of the dense and sparse file formats"""
+    monitors = [{'name': f"DP-{i}", 'primary': i == 0} for i in range(n_monitors)]
+    
+    # A typical setup: a handful of bindings per display, everything else empty
+    dense = ConfigParser()
+    for mon in monitors:
+        prefix = "" if mon['primary'] else f"{mon['name']}-"
+        dense.set(f"{prefix}TopRight", "WheelUp", "amixer -D pulse set Master 5%+")
+        dense.set(f"{prefix}TopRight", "WheelDown", "amixer -D pulse set Master 5%-")
+        dense.set(f"{prefix}BottomLeft", "LeftButton", "rofi -show drun")
+    sparse = ConfigParser(sparse=True)
+    sparse.store, sparse.sections = dense.store, dense.sections
+    
+    print(f"[BENCH] {n_monitors} monitors, {rounds} parses per format")
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, parser in (("dense", dense), ("sparse", sparse)):
+            path = Path(tmp) / f"fittsmonrc.{label}"
+            text = parser.serialize(ZONES, EVENTS, monitors)
+            path.write_text(text)
+            
+            reader = ConfigParser()
+            start = time.perf_counter()
+            for _round in range(rounds):
+                reader.read(path)
+            elapsed = (time.perf_counter() - start) / rounds
+            
+            bindings = len(reader.store)
+            results[label] = (len(text.encode()), text.count("\n"), elapsed, bindings)
+            print(f"[BENCH] {label:6}: {results[label][0]:7d} bytes {results[label][1]:5d} lines "
+                  f"{elapsed * 1e6:8.1f} us/parse ({bindings} bindings)")
+    
+    d, sp = results["dense"], results["sparse"]
+    print(f"[BENCH] sparse/dense: {sp[0] / d[0]:.1%} size, {sp[2] / d[2]:.1%} parse time")
+    return 0 if d[3] == sp[3] else 1
+
+
+def benchmark_bindings(n_monitors, rounds=200):
+    """Micro-benchmark: BindingStore against the old dict-of-dicts lookups"""
+    import tracemalloc
+    
+    monitors = [{'name': f"DP-{i}", 'primary': i == 0} for i in range(n_monitors)]
+    commands = ["amixer -D pulse set Master 5%+", "amixer -D pulse set Master 5%-", "rofi -show drun"]
+    bound = [("TopRight", "WheelUp"), ("TopRight", "WheelDown"), ("BottomLeft", "LeftButton")]
+    
+    def section_name(mon, zone):
+        return zone if mon['primary'] else f"{mon['name']}-{zone}"
+    
+    # Old layout: what ConfigParser.read produced from a dense file. The
+    # "".join() copies stand in for the separate strings a file parse creates.
+    tracemalloc.start()
+    data = {}
+    for mon in monitors:
+        for zone in ZONES:
+            data[section_name(mon, zone)] = {event: "" for event in EVENTS}
+        for (zone, event), cmd in zip(bound, commands):
+            data[section_name(mon, zone)][event] = "".join(cmd)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    store = BindingStore()
+    for mon in monitors:
+        slot = store.monitor_slot("" if mon['primary'] else mon['name'])
+        for (zone, event), cmd in zip(bound, commands):
+            store.set(slot, store.zone_index[zone], store.event_index[event], "".join(cmd))
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    def dict_lookup_all():
+        n = 0
+        for mon in monitors:
+            for zone in ZONES:
+                for event in EVENTS:
+                    if data.get(section_name(mon, zone), {}).get(event, ""):
+                        n += 1
+        return n
+    
+    def store_lookup_all():
+        n = 0
+        for slot in range(len(store.prefixes)):
+            for zone in range(store.n_zones):
+                for event in range(store.n_events):
+                    if store.get(slot, zone, event):
+                        n += 1
+        return n
+    
+    def store_iter_filled():
+        return sum(1 for _cell in store.iter_filled())
+    
+    cells = n_monitors * len(ZONES) * len(EVENTS)
+    print(f"[BENCH] {n_monitors} monitors, {cells} cells, {len(store)} bindings, {rounds} rounds")
+    print(f"[BENCH] memory: dict {dict_bytes} bytes, store {store_bytes} bytes")
+    timings = {}
+    for label, fn in (
+        ("dict, all cells", dict_lookup_all),
+        ("store, all cells", store_lookup_all),
+        ("store, non-empty", store_iter_filled),
+    ):
+        count = fn()
+        start = time.perf_counter()
+        for _round in range(rounds):
+            fn()
+        timings[label] = (time.perf_counter() - start) / rounds
+        print(f"[BENCH] {label:17}: {timings[label] * 1e6:8.1f} us/pass ({count} found)")
+    
+    base = timings["dict, all cells"]
+    print(f"[BENCH] speedup: {base / timings['store, all cells']:.1f}x all cells, "
+          f"{base / timings['store, non-empty']:.1f}x non-empty only")
+    return 0
+
+
+# =============================================================================
+# GUI
+# =============================================================================
+# GTK is only loaded by load_gtk(), which main() calls once it is clear the
+# GUI is wanted, so the command line paths never import PyGObject.
+
+Gtk = Gdk = GLib = Pango = PangoCairo = cairo = None
+
+
+def load_gtk():
+    """Import GTK and define the widget classes that derive from it"""
+    global Gtk, Gdk, GLib, Pango, PangoCairo, cairo
+    global MonitorOverlay, ZoneGridWidget, HelpDialog, OverviewDialog
+    if Gtk is not None:
+        return
+    import gi
+    gi.require_version('Gtk', '3.0')
+    gi.require_version('Gdk', '3.0')
+    gi.require_version('Pango', '1.0')
+    gi.require_version('PangoCairo', '1.0')
+    from gi.repository import Gtk, Gdk, GLib, Pango, PangoCairo
+    import cairo
+    
+    class MonitorOverlay(Gtk.Window):
+        """
+        Hotspot cards of one monitor, drawn in a single window covering it
+        
+        The cards are laid out with Pango before the window is shown, so they
+        are placed right away instead of being moved once GTK has sized them.
+        The window shape is cut to the cards (nothing else is painted, with or
+        without a compositor) and it takes no input, so clicks pass through.
+        
+        The GUI keeps one per monitor and only maps and unmaps it; set_zone
+        re-lays out a single card and redraws just the area it covered.
+        """
+        
+        ZONE_INFO = {
+            'TopLeft': {'pos': (0, 0), 'emoji': '↖'},
+            'TopCenter': {'pos': (0.5, 0), 'emoji': '↑'},
+            'TopRight': {'pos': (1, 0), 'emoji': '↗'},
+            'Left': {'pos': (0, 0.5), 'emoji': '←'},
+            'Right': {'pos': (1, 0.5), 'emoji': '→'},
+            'BottomLeft': {'pos': (0, 1), 'emoji': '↙'},
+            'BottomCenter': {'pos': (0.5, 1), 'emoji': '↓'},
+            'BottomRight': {'pos': (1, 1), 'emoji': '↘'},
+        }
+        
+        CARD_WIDTH = 300
+        EDGE_PADDING = 20
+        MARGIN = 15
+        SPACING = 8
+        
+        def __init__(self, monitor_name, monitor_geom):
+            Gtk.Window.__init__(self, type=Gtk.WindowType.POPUP)
+            
+            self.monitor_name = monitor_name
+            self.monitor_geom = None
+            self.cards = {}
+            
+            # Window setup
+            self.set_decorated(False)
+            self.set_keep_above(True)
+            self.set_skip_taskbar_hint(True)
+            self.set_skip_pager_hint(True)
+            self.set_app_paintable(True)
+            self.set_accept_focus(False)
+            self.set_type_hint(Gdk.WindowTypeHint.POPUP_MENU)
+            
+            # Transparency
+            screen = Gdk.Screen.get_default()
+            visual = screen.get_rgba_visual()
+            if visual:
+                self.set_visual(visual)
+            self.connect("draw", self.on_draw)
+            
+            self.input_shape_combine_region(cairo.Region())
+            self.set_geometry(monitor_geom)
+        
+        def set_geometry(self, monitor_geom):
+            """Cover the monitor and re-place the cards for its size"""
+            if monitor_geom == self.monitor_geom:
+                return
+            self.monitor_geom = dict(monitor_geom)
+            self.move(int(monitor_geom['x']), int(monitor_geom['y']))
+            self.resize(max(int(monitor_geom['width']), 1), max(int(monitor_geom['height']), 1))
+            for zone, card in self.cards.items():
+                card['rect'] = self.card_rect(zone, card['rect'][3])
+            self.update_shape()
+            self.queue_draw()
+        
+        def set_cards(self, zone_commands):
+            """Replace all cards; zone_commands: [(zone, {event: command})]"""
+            self.cards = {zone: self.layout_card(zone, commands) for zone, commands in zone_commands}
+            self.update_shape()
+            self.queue_draw()
+        
+        def set_zone(self, zone, commands):
+            """Re-lay out the card of one zone (no commands removes it)"""
+            old = self.cards.pop(zone, None)
+            if any(command.strip() for command in commands.values()):
+                self.cards[zone] = self.layout_card(zone, commands)
+            self.update_shape()
+            for card in (old, self.cards.get(zone)):
+                if card is not None:
+                    self.queue_draw_area(*card['rect'])
+        
+        def update_shape(self):
+            self.shape_combine_region(
+                cairo.Region([cairo.RectangleInt(*card['rect']) for card in self.cards.values()])
+            )
+        
+        def card_rect(self, zone, height):
+            """Rectangle of a card of the given height, in window coordinates"""
+            geom = self.monitor_geom
+            x_pos, y_pos = self.ZONE_INFO[zone]['pos']
+            x = self.EDGE_PADDING + (geom['width'] - self.CARD_WIDTH - 2 * self.EDGE_PADDING) * x_pos
+            y = self.EDGE_PADDING + (geom['height'] - height - 2 * self.EDGE_PADDING) * y_pos
+            return (int(x), int(y), self.CARD_WIDTH, height)
+        
+        def layout_card(self, zone, commands):
+            """Text layouts and rectangle of one zone card"""
+            text_width = (self.CARD_WIDTH - 2 * self.MARGIN) * Pango.SCALE
+            
+            header = self.create_pango_layout("")
+            header.set_markup(
+                f"<big><b>{self.ZONE_INFO[zone]['emoji']} {zone}</b></big>\n"
+                f"<small>{GLib.markup_escape_text(self.monitor_name)}</small>", -1
+            )
+            header.set_width(text_width)
+            header.set_alignment(Pango.Alignment.CENTER)
+            layouts = [header]
+            
+            for event, command in commands.items():
+                if command.strip():
+                    cmd_display = command if len(command) < 30 else command[:27] + "..."
+                    layout = self.create_pango_layout("")
+                    layout.set_markup(
+                        f"<small><b>{GLib.markup_escape_text(event)}</b>\n"
+                        f"{GLib.markup_escape_text(cmd_display)}</small>", -1
+                    )
+                    layout.set_width(text_width)
+                    layout.set_wrap(Pango.WrapMode.WORD_CHAR)
+                    layouts.append(layout)
+            
+            heights = [layout.get_pixel_size()[1] for layout in layouts]
+            height = 2 * self.MARGIN + sum(heights) + self.SPACING * (len(layouts) - 1)
+            
+            return {
+                'rect': self.card_rect(zone, height),
+                'layouts': list(zip(layouts, heights)),
+            }
+        
+        def on_draw(self, widget, context):
+            """Paint every card in one pass; the rest of the window stays clear"""
+            context.set_operator(cairo.OPERATOR_SOURCE)
+            context.set_source_rgba(0, 0, 0, 0)
+            context.paint()
+            context.set_operator(cairo.OPERATOR_OVER)
+            
+            for card in self.cards.values():
+                x, y, width, height = card['rect']
+                context.set_source_rgba(0.1, 0.1, 0.1, 0.88)
+                context.rectangle(x, y, width, height)
+                context.fill()
+                
+                context.set_source_rgba(0.95, 0.95, 0.95, 1)
+                text_y = y + self.MARGIN
+                for layout, layout_height in card['layouts']:
+                    context.move_to(x + self.MARGIN, text_y)
+                    PangoCairo.show_layout(context, layout)
+                    text_y += layout_height + self.SPACING
+            return False
+    
+    class ZoneGridWidget(Gtk.Grid):
+        """Visual 8-zone grid selector"""
+        
+        ZONE_INFO = {
+            'TopLeft': {'emoji': '↖', 'pos': (0, 0)},
+            'TopCenter': {'emoji': '↑', 'pos': (1, 0)},
+            'TopRight': {'emoji': '↗', 'pos': (2, 0)},
+            'Left': {'emoji': '←', 'pos': (0, 1)},
+            'Right': {'emoji': '→', 'pos': (2, 1)},
+            'BottomLeft': {'emoji': '↙', 'pos': (0, 2)},
+            'BottomCenter': {'emoji': '↓', 'pos': (1, 2)},
+            'BottomRight': {'emoji': '↘', 'pos': (2, 2)},
+        }
+        
+        def __init__(self, zones, callback):
+            Gtk.Grid.__init__(self)
+            self.set_column_spacing(8)
+            self.set_row_spacing(8)
+            self.set_halign(Gtk.Align.CENTER)
+            
+            self.zones = zones
+            self.callback = callback
+            self.buttons = {}
+            self.active_zone = zones[0]
+            # {zone: (badge type, tooltip)} of the zones showing a conflict badge
+            self.badges = {}
+            
+            for row in range(3):
+                for col in range(3):
+                    if row == 1 and col == 1:
+                        continue
+                    
+                    zone = None
+                    for z, info in self.ZONE_INFO.items():
+                        if info['pos'] == (col, row):
+                            zone = z
+                            break
+                    
+                    if zone:
+                        btn = Gtk.Button()
+                        btn.set_size_request(60, 60)
+                        btn.set_label(self.zone_label(zone))
+                        btn.set_tooltip_text(zone)
+                        btn.connect("clicked", self.on_zone_clicked, zone)
+                        
+                        self.buttons[zone] = btn
+                        self.attach(btn, col, row, 1, 1)
+            
+            self.update_colors()
+            self.show_all()
+        
+        def on_zone_clicked(self, button, zone):
+            self.active_zone = zone
+            self.update_colors()
+            self.callback(zone)
+        
+        def update_colors(self):
+            for zone, btn in self.buttons.items():
+                if zone == self.active_zone:
+                    btn.get_style_context().remove_class("zone-inactive")
+                    btn.get_style_context().add_class("zone-active")
+                else:
+                    btn.get_style_context().remove_class("zone-active")
+                    btn.get_style_context().add_class("zone-inactive")
+        
+        def set_active_zone(self, zone):
+            if zone in self.buttons:
+                self.active_zone = zone
+                self.update_colors()
+        
+        def zone_label(self, zone, badge=False):
+            short = zone.replace('Center', 'C').replace('Left', 'L').replace('Right', 'R')
+            return f"{self.ZONE_INFO[zone]['emoji']}{' ⚠' if badge else ''}\n{short}"
+        
+        def set_conflicts(self, conflicts):
+            """Badge the zones in {zone: [conflict]}; only changed buttons are touched"""
+            for zone, btn in self.buttons.items():
+                found = conflicts.get(zone)
+                if found:
+                    kind = 'wheel' if any(c['type'] == 'wheel' for c in found) else 'enter_leave'
+                    tooltip = "\n".join(
+                        [zone] + [f"⚠ {', '.join(c['events'])} ↔ {', '.join(c['conflict_events'])}" for c in found]
+                    )
+                    badge = (kind, tooltip)
+                else:
+                    badge = None
+                if badge == self.badges.get(zone):
+                    continue
+                
+                context = btn.get_style_context()
+                context.remove_class("zone-conflict")
+                context.remove_class("zone-warning")
+                if badge is None:
+                    del self.badges[zone]
+                    btn.set_label(self.zone_label(zone))
+                    btn.set_tooltip_text(zone)
+                else:
+                    self.badges[zone] = badge
+                    btn.set_label(self.zone_label(zone, badge=True))
+                    btn.set_tooltip_text(badge[1])
+                    context.add_class("zone-conflict" if badge[0] == 'wheel' else "zone-warning")
+    
+    
+    class HelpDialog(Gtk.Dialog):
+        """Help dialog with usage information"""
+        
+        def __init__(self, parent):
+            Gtk.Dialog.__init__(
+                self,
+                title=_('help_title'),
+                parent=parent,
+                flags=0
+            )
+            self.add_button(_('close'), Gtk.ResponseType.CLOSE)
+            self.set_default_size(500, 450)
+            
+            content = self.get_content_area()
+            content.set_margin_top(15)
+            content.set_margin_bottom(15)
+            content.set_margin_start(15)
+            content.set_margin_end(15)
+            
+            scroll = Gtk.ScrolledWindow()
+            scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+            
+            help_label = Gtk.Label()
+            help_label.set_markup(_('help_text'))
+            help_label.set_line_wrap(True)
+            help_label.set_xalign(0)
+            help_label.set_selectable(True)
+            
+            scroll.add(help_label)
+            content.pack_start(scroll, True, True, 0)
+    
+            about_sep = Gtk.Separator()
+            about_sep.set_margin_top(10)
+            about_sep.set_margin_bottom(10)
+            content.pack_start(about_sep, False, False, 0)
+    
+            about_label = Gtk.Label()
+            about_label.set_markup(
+                '<big><b>fittsmon-gui</b></big> v{version}\n'
+                '<a href="https://github.com/musqz/fittsmon-gui">github.com/musqz/fittsmon-gui</a>\n'
+                'musqz · MIT'.format(version=GLib.markup_escape_text(_VERSION))
+            )
+            about_label.set_justify(Gtk.Justification.CENTER)
+            about_label.set_selectable(True)
+            content.pack_start(about_label, False, False, 0)
+    
+            self.show_all()
+    
+    
+    class OverviewDialog(Gtk.Dialog):
+        """
+        Every (monitor, zone, event) cell of the config in one table
+        
+        The model holds nothing but the BindingStore cell index of each row;
+        monitor, zone, event and command are looked up by cell data functions,
+        which a fixed-height TreeView only calls for rows that are on screen.
+        Edits go through the GUI like edits in the main window, addressed by
+        section: the unprefixed sections and a leftover [NAME-...] of the
+        current primary are different rows.
+        """
+        
+        COLUMNS = ('col_monitor', 'col_zone', 'col_event', 'col_command')
+        
+        def __init__(self, parent, gui):
+            Gtk.Dialog.__init__(
+                self,
+                title=_('overview_title'),
+                parent=parent,
+                flags=0
+            )
+            self.gui = gui
+            self.store = None
+            self.slot_names = []
+            # Lowercased names for the filter, and the filter itself, read
+            # once per refilter rather than for every row
+            self.slot_keys = self.zone_keys = self.event_keys = []
+            self.needle = ""
+            self.bound_only = True
+            self.refresh_source = None
+            self.add_button(_('close'), Gtk.ResponseType.CLOSE)
+            self.connect("response", lambda *_args: self.hide())
+            self.connect("delete-event", lambda *_args: self.hide_on_delete())
+            self.set_default_size(760, 520)
+            
+            content = self.get_content_area()
+            content.set_spacing(10)
+            content.set_margin_top(15)
+            content.set_margin_bottom(15)
+            content.set_margin_start(15)
+            content.set_margin_end(15)
+            
+            filter_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+            self.filter_entry = Gtk.SearchEntry()
+            self.filter_entry.set_placeholder_text(_('overview_filter'))
+            self.filter_entry.connect("search-changed", lambda *_args: self._refilter())
+            filter_box.pack_start(self.filter_entry, True, True, 0)
+            self.bound_only_check = Gtk.CheckButton(label=_('overview_bound_only'))
+            self.bound_only_check.set_active(True)
+            self.bound_only_check.connect("toggled", lambda *_args: self._refilter())
+            filter_box.pack_start(self.bound_only_check, False, False, 0)
+            content.pack_start(filter_box, False, False, 0)
+            
+            self.rows = self.filter = self.sorted = None
+            self.view = Gtk.TreeView()
+            self.view.set_fixed_height_mode(True)
+            self.view.set_enable_search(False)
+            for column_id, (key, width) in enumerate(zip(self.COLUMNS, (140, 120, 120, 300))):
+                renderer = Gtk.CellRendererText()
+                if key == 'col_command':
+                    renderer.set_property("editable", True)
+                    renderer.set_property("ellipsize", Pango.EllipsizeMode.END)
+                    renderer.connect("edited", self.on_command_edited)
+                column = Gtk.TreeViewColumn(_(key), renderer)
+                column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+                column.set_fixed_width(width)
+                column.set_resizable(True)
+                column.set_expand(key == 'col_command')
+                column.set_sort_column_id(column_id)
+                column.set_cell_data_func(renderer, self._cell_text, column_id)
+                self.view.append_column(column)
+            
+            scroll = Gtk.ScrolledWindow()
+            scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+            scroll.add(self.view)
+            content.pack_start(scroll, True, True, 0)
+            
+            self.count_label = Gtk.Label()
+            self.count_label.set_halign(Gtk.Align.START)
+            content.pack_start(self.count_label, False, False, 0)
+            
+            content.show_all()
+        
+        def present_overview(self):
+            self._refresh()
+            self.present()
+        
+        def refresh(self):
+            """Pick up config changes once the main loop is idle (while shown)"""
+            if self.refresh_source is None and self.get_visible():
+                self.refresh_source = GLib.idle_add(self._refresh)
+        
+        def _refresh(self):
+            self.refresh_source = None
+            store = self.gui.config.store
+            rebuild = store is not self.store or len(store.prefixes) != len(self.slot_names)
+            self.store = store
+            self.slot_names = [name if prefix else f"{name} {_('primary')}".strip()
+                               for prefix, name in zip(store.prefixes, self.gui.slot_monitors())]
+            self.slot_keys = [name.lower() for name in self.slot_names]
+            self.zone_keys = [zone.lower() for zone in store.zones]
+            self.event_keys = [event.lower() for event in store.events]
+            if rebuild:
+                self._build_model()
+            self._refilter()
+            return False
+        
+        def _build_model(self):
+            """
+            One int row per cell, filled before the model is attached to
+            anything; rebuilt only for a new config or a new monitor slot
+            """
+            store = self.store
+            rows = Gtk.ListStore(int)
+            for cell in range(len(store.cells)):
+                rows.insert_with_valuesv(-1, [0], [cell])
+            
+            sort_column = self.sorted.get_sort_column_id() if self.sorted is not None else (None, None)
+            self.rows = rows
+            self.filter = rows.filter_new()
+            self.filter.set_visible_func(self._row_visible)
+            self.sorted = Gtk.TreeModelSort(model=self.filter)
+            for column_id in range(len(self.COLUMNS)):
+                self.sorted.set_sort_func(column_id, self._compare, column_id)
+            if sort_column[0] is not None:
+                self.sorted.set_sort_column_id(*sort_column)
+            self.view.set_model(self.sorted)
+        
+        def _refilter(self):
+            if self.filter is None:
+                return
+            self.needle = self.filter_entry.get_text().strip().lower()
+            self.bound_only = self.bound_only_check.get_active()
+            self.filter.refilter()
+            self.view.queue_draw()
+            self.count_label.set_text(_('overview_count').format(
+                bound=len(self.store), shown=self.sorted.iter_n_children(None)
+            ))
+        
+        def cell_address(self, cell):
+            """(monitor, zone, event) names of a cell index"""
+            slot, zone, event = self.store.address(cell)
+            return self.slot_names[slot], self.store.zones[zone], self.store.events[event]
+        
+        def _row_visible(self, model, tree_iter, _data):
+            cell = model[tree_iter][0]
+            command = self.store.cells[cell]
+            if not command and self.bound_only:
+                return False
+            needle = self.needle
+            if not needle:
+                return True
+            slot, zone, event = self.store.address(cell)
+            return (needle in self.slot_keys[slot] or needle in self.zone_keys[zone]
+                    or needle in self.event_keys[event] or needle in command.lower())
+        
+        def _sort_key(self, cell, column_id):
+            if column_id == 3:
+                return (self.store.cells[cell].lower(), cell)
+            if column_id == 0:
+                return (self.cell_address(cell)[0], cell)
+            # Zone and event in config order, not alphabetical
+            _slot, zone, event = self.store.address(cell)
+            return ((zone, event) if column_id == 1 else (event, zone), cell)
+        
+        def _compare(self, model, a, b, column_id):
+            key_a, key_b = self._sort_key(model[a][0], column_id), self._sort_key(model[b][0], column_id)
+            return (key_a > key_b) - (key_a < key_b)
+        
+        def _cell_text(self, column, renderer, model, tree_iter, column_id):
+            cell = model[tree_iter][0]
+            if column_id == 3:
+                renderer.set_property("text", self.store.cells[cell])
+            else:
+                renderer.set_property("text", self.cell_address(cell)[column_id])
+        
+        def on_command_edited(self, renderer, path, text):
+            tree_iter = self.sorted.get_iter(path)
+            if tree_iter is None:
+                return
+            slot, zone, event = self.store.address(self.sorted[tree_iter][0])
+            self.gui.edit_binding(
+                self.store.section_name(slot, zone), self.store.zones[zone], self.store.events[event], text
+            )
+
+
+class MonitorHelper:
+    """
+    Connected monitors with their geometry, cached
+    
+    Each entry has the RandR connector name fittsmon and fittsmonrc use
+    (HDMI-1, DP-2 ...), the primary flag, the EDID identity and the
+    geometry, all from one RandrOutputs query, like the command line.
+    GDK only reports that the layout changed.
+    """
+    
+    # Docking produces a burst of notifications: rescan once they stop
+    DEBOUNCE_MS = 250
+    
+    def __init__(self):
+        self.monitors = {}
+        self.callback = None
+        self.watched = set()
+        self.rescan_source = None
+    
+    def detect_monitors(self):
+        """Query RandR (main thread only); returns the monitors, primary first"""
+        self.monitors = {}
+        # RandR counts screen pixels, overlays are placed in GDK's units;
+        # the scale is the same for every monitor on X11
+        display = Gdk.Display.get_default()
+        monitor = display.get_monitor(0) if display is not None else None
+        scale = monitor.get_scale_factor() if monitor is not None else 1
+        
+        for output in RandrOutputs.query():
+            name = output['name']
+            self.monitors[name] = {
+                'name': name,
+                'primary': output['primary'],
+                'identity': MonitorIdentities.identity(output['edid']),
+                'x': output['x'] // scale,
+                'y': output['y'] // scale,
+                'width': output['width'] // scale,
+                'height': output['height'] // scale
+            }
+            
+            print(f"[MONITOR] {name}: {output['x']},{output['y']} ({output['width']}x{output['height']})"
+                  f"{' [PRIMARY]' if output['primary'] else ''}")
+        
+        return list(self.monitors.values())
+    
+    def watch(self, callback):
+        """
+        Call callback(added, removed, changed) with monitor names whenever
+        outputs are plugged, unplugged, moved, resized or made primary
+        """
+        self.callback = callback
+        display = Gdk.Display.get_default()
+        if display is None:
+            return
+        display.connect("monitor-added", self._on_monitor_added)
+        display.connect("monitor-removed", self._on_monitor_removed)
+        # Connector names and the primary flag live on the screen in GTK 3
+        display.get_default_screen().connect("monitors-changed", self._on_display_changed)
+        for i in range(display.get_n_monitors()):
+            self._watch_monitor(display.get_monitor(i))
+    
+    def _watch_monitor(self, monitor):
+        if monitor not in self.watched:
+            self.watched.add(monitor)
+            monitor.connect("notify::geometry", self._on_display_changed)
+    
+    def _on_monitor_added(self, display, monitor):
+        self._watch_monitor(monitor)
+        self._on_display_changed()
+    
+    def _on_monitor_removed(self, display, monitor):
+        self.watched.discard(monitor)
+        self._on_display_changed()
+    
+    def _on_display_changed(self, *args):
+        if self.rescan_source is not None:
+            GLib.source_remove(self.rescan_source)
+        self.rescan_source = GLib.timeout_add(self.DEBOUNCE_MS, self._rescan)
+    
+    @staticmethod
+    def _layout_key(mon):
+        return mon['primary'], mon['x'], mon['y'], mon['width'], mon['height']
+    
+    def _rescan(self):
+        self.rescan_source = None
+        old = self.monitors
+        self.detect_monitors()
+        added = [name for name in self.monitors if name not in old]
+        removed = [name for name in old if name not in self.monitors]
+        changed = [name for name, mon in self.monitors.items()
+                   if name in old and self._layout_key(mon) != self._layout_key(old[name])]
+        if (added or removed or changed) and self.callback is not None:
+            self.callback(added, removed, changed)
+        return False
+    
+    def get_monitor_geom(self, monitor_name):
+        """Get geometry for specific monitor"""
+        if monitor_name in self.monitors:
+            return self.monitors[monitor_name]
+        
+        for mon in self.monitors.values():
+            if mon['primary']:
+                return mon
+        if self.monitors:
+            return list(self.monitors.values())[0]
+        
+        return {'x': 0, 'y': 0, 'width': 1920, 'height': 1080}
+
+
+class DaemonSupervisor:
+    """
+    Keeps the fittsmon daemon alive while the GUI is open
+    
+    Exits are delivered by GLib: the child watch of a daemon the GUI
+    spawned, or a watch on the pidfd of one it adopted. Nothing polls while
+    the daemon runs. Unexpected exits are restarted with exponential
+    backoff; too many crashes in a short time stop the auto-restart.
+    """
+    
+    BACKOFF_INITIAL_S = 1
+    BACKOFF_MAX_S = 60
+    STABLE_AFTER_S = 30
+    CRASH_LOOP_COUNT = 5
+    CRASH_LOOP_WINDOW_S = 120
+    UPTIME_REFRESH_S = 30
+    
+    def __init__(self, gui):
+        self.gui = gui
+        self.enabled = True
+        self.pid = None
+        self.started_at = None
+        self.restart_count = 0
+        self.last_exit = None
+        self.crash_times = []
+        self.crash_loop = False
+        self.backoff_s = self.BACKOFF_INITIAL_S
+        self.respawn_due = None
+        self.expected = set()
+        self.exit_source = None
+        self.respawn_source = None
+        self.refresh_source = None
+    
+    @staticmethod
+    def describe_status(status):
+        """Human readable wait status (None: not our child, unknown)"""
+        if status is None:
+            return "?"
+        if os.WIFSIGNALED(status):
+            sig = os.WTERMSIG(status)
+            try:
+                return signal.Signals(sig).name
+            except ValueError:
+                return f"signal {sig}"
+        return f"exit {os.WEXITSTATUS(status)}"
+    
+    @staticmethod
+    def format_uptime(seconds):
+        minutes = int(seconds // 60)
+        if minutes < 1:
+            return "<1 min"
+        if minutes < 60:
+            return f"{minutes} min"
+        return f"{minutes // 60} h {minutes % 60:02d} min"
+    
+    def watching(self, pid, child):
+        """
+        A daemon is running as pid. Our own children are covered by their
+        child watch; adopted daemons get a watch on their pidfd.
+        """
+        self._remove_exit_watch()
+        self.pid = pid
+        self.started_at = time.monotonic()
+        if not self.enabled:
+            return
+        if not child:
+            self._add_exit_watch(pid)
+        if self.refresh_source is None:
+            self.refresh_source = GLib.timeout_add_seconds(self.UPTIME_REFRESH_S, self._on_refresh)
+        self.update_label()
+    
+    def _add_exit_watch(self, pid):
+        tracker = self.gui.daemon
+        if tracker.pid == pid and tracker.pidfd is not None:
+            self.exit_source = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT, tracker.pidfd, GLib.IOCondition.IN,
+                self._on_pidfd_readable, pid
+            )
+        else:
+            # No pidfd (kernel < 5.3): look at /proc now and then, no subprocess
+            self.exit_source = GLib.timeout_add_seconds(5, self._on_proc_check, pid)
+    
+    def _remove_exit_watch(self):
+        if self.exit_source is not None:
+            GLib.source_remove(self.exit_source)
+            self.exit_source = None
+    
+    def _on_pidfd_readable(self, fd, condition, pid):
+        self.exit_source = None
+        self.gui.daemon.forget(pid)
+        self.daemon_exited(pid, None)
+        return False
+    
+    def _on_proc_check(self, pid):
+        if DaemonTracker.pid_alive(pid):
+            return True
+        self.exit_source = None
+        self.gui.daemon.forget(pid)
+        self.daemon_exited(pid, None)
+        return False
+    
+    def expect_exit(self, pids):
+        """We are stopping these ourselves; don't treat it as a crash"""
+        self.expected.update(pids)
+        self.cancel_respawn()
+    
+    def daemon_exited(self, pid, status):
+        expected = pid in self.expected
+        self.expected.discard(pid)
+        if pid != self.pid:
+            return
+        
+        now = time.monotonic()
+        uptime = now - self.started_at
+        self.pid = None
+        self.started_at = None
+        self.last_exit = self.describe_status(status)
+        self._remove_exit_watch()
+        
+        if expected or not self.enabled or self.gui.is_restarting or self.gui.closing:
+            self.update_label()
+            return
+        
+        print(f"[SUPERVISOR] fittsmon died ({self.last_exit}) after {uptime:.1f} s")
+        if uptime >= self.STABLE_AFTER_S:
+            self.backoff_s = self.BACKOFF_INITIAL_S
+            self.crash_times = []
+        self.crash_times = [t for t in self.crash_times if now - t < self.CRASH_LOOP_WINDOW_S]
+        self.crash_times.append(now)
+        if len(self.crash_times) >= self.CRASH_LOOP_COUNT:
+            print(f"[SUPERVISOR] {len(self.crash_times)} crashes within "
+                  f"{self.CRASH_LOOP_WINDOW_S} s, giving up")
+            self.crash_loop = True
+            self.update_label()
+            return
+        
+        self._schedule_respawn()
+    
+    def _schedule_respawn(self):
+        self.cancel_respawn()
+        print(f"[SUPERVISOR] Restarting fittsmon in {self.backoff_s} s")
+        self.respawn_due = time.monotonic() + self.backoff_s
+        self.respawn_source = GLib.timeout_add_seconds(self.backoff_s, self._respawn)
+        self.backoff_s = min(self.backoff_s * 2, self.BACKOFF_MAX_S)
+        self.update_label()
+    
+    def cancel_respawn(self):
+        if self.respawn_source is not None:
+            GLib.source_remove(self.respawn_source)
+            self.respawn_source = None
+            self.respawn_due = None
+    
+    def _respawn(self):
+        self.respawn_source = None
+        self.respawn_due = None
+        if self.gui.is_restarting or self.gui.closing or self.pid is not None:
+            return False
+        self.restart_count += 1
+        if self.gui.spawn_daemon() is None:
+            self._schedule_respawn()
+        return False
+    
+    def reset(self):
+        """A manual restart succeeded: start over with a clean slate"""
+        self.cancel_respawn()
+        self.crash_loop = False
+        self.crash_times = []
+        self.backoff_s = self.BACKOFF_INITIAL_S
+        self.update_label()
+    
+    def stop(self):
+        self.enabled = False
+        self.cancel_respawn()
+        self._remove_exit_watch()
+        if self.refresh_source is not None:
+            GLib.source_remove(self.refresh_source)
+            self.refresh_source = None
+    
+    def _on_refresh(self):
+        if self.pid is None:
+            self.refresh_source = None
+            return False
+        self.update_label()
+        return True
+    
+    def update_label(self):
+        if self.pid is not None:
+            parts = [_('daemon_running').format(
+                pid=self.pid, uptime=self.format_uptime(time.monotonic() - self.started_at))]
+        else:
+            parts = [_('daemon_not_running')]
+        if self.respawn_due is not None:
+            seconds = max(0, round(self.respawn_due - time.monotonic()))
+            parts.append(_('daemon_restart_pending').format(seconds=seconds))
+        if self.crash_loop:
+            parts.append(_('daemon_crash_loop'))
+        if self.restart_count:
+            parts.append(_('daemon_restarts').format(count=self.restart_count))
+        if self.last_exit is not None:
+            parts.append(_('daemon_last_exit').format(status=self.last_exit))
+        self.gui.set_daemon_info(" · ".join(parts), error=self.crash_loop)
+
+
+class DaemonLog:
+    """
+    Output of the daemons the GUI started, kept in a fixed-size ring
+    
+    The pipes are non-blocking and read from the GLib main loop at a
+    priority below input and redraws, at most READ_BUDGET bytes per wakeup,
+    so a daemon flooding its output can't stall the window. Lines reach
+    the view (and the optional on-disk log) in batches every FLUSH_MS.
+    
+    The daemon outlives the GUI, so it never writes to a pipe the GUI
+    reads: each stream goes through a relay process (see relay()) that
+    outlives it too and drains to /dev/null once the GUI is gone.
+    """
+    
+    MAX_LINES = 2000
+    MAX_LINE_LENGTH = 1000
+    READ_CHUNK = 16384
+    READ_BUDGET = 65536
+    FLUSH_MS = 200
+    FILE_MAX_BYTES = 1 << 20
+    FILE_BACKUPS = 3
+    # Copy to the GUI until that fails (EOF, or the GUI closed its end),
+    # then keep reading so the writer never sees a broken pipe
+    RELAY_SCRIPT = "cat; exec cat >/dev/null"
+    
+    def __init__(self, path=None):
+        self.lines = collections.deque(maxlen=self.MAX_LINES)
+        self.seq = 0            # number of lines ever appended
+        self.partial = {}       # fd -> bytes of an unfinished line
+        self.sources = {}       # fd -> GLib source id
+        self.flush_source = None
+        self.unwritten = []
+        self.listener = None    # called with no arguments after each batch
+        self.path = Path(path).expanduser() if path else None
+        self.file = None
+        self.file_size = 0
+        self.dropped_bytes = 0
+    
+    def relay(self, stream):
+        """
+        Start a relay for stream and return the write end of its input,
+        for the daemon's stdout or stderr; None if it can't be started.
+        The relay runs in its own session and isn't a child of the GUI.
+        """
+        read_fd, write_fd = os.pipe()
+        
+        def child_setup():
+            os.setsid()
+            os.dup2(read_fd, 0)
+        
+        try:
+            _pid, _stdin, stdout, _stderr = GLib.spawn_async(
+                ["/bin/sh", "-c", self.RELAY_SCRIPT],
+                flags=GLib.SpawnFlags.STDERR_TO_DEV_NULL,
+                child_setup=child_setup, standard_output=True
+            )
+        except GLib.Error as e:
+            print(f"[ERROR] Failed to start the {stream} relay: {e.message}")
+            os.close(write_fd)
+            return None
+        finally:
+            os.close(read_fd)
+        self.attach(stdout, stream)
+        return write_fd
+    
+    def attach(self, fd, stream):
+        os.set_blocking(fd, False)
+        self.partial[fd] = b""
+        self.sources[fd] = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT_IDLE, fd,
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self._on_readable, stream
+        )
+    
+    def _on_readable(self, fd, condition, stream):
+        budget = self.READ_BUDGET
+        while budget > 0:
+            try:
+                chunk = os.read(fd, self.READ_CHUNK)
+            except BlockingIOError:
+                return True
+            except OSError:
+                chunk = b""
+            if not chunk:
+                # EOF: the daemon closed its end (or exited)
+                if self.partial[fd]:
+                    self._add_line(stream, self.partial[fd])
+                self._detach(fd)
+                return False
+            budget -= len(chunk)
+            *complete, rest = (self.partial[fd] + chunk).split(b"\n")
+            for line in complete:
+                self._add_line(stream, line)
+            if len(rest) > self.MAX_LINE_LENGTH * 4:
+                # No newline in sight, don't let one line grow without bound
+                self._add_line(stream, rest)
+                rest = b""
+            self.partial[fd] = rest
+        # Budget used up: let GTK run, the fd is still readable next time
+        return True
+    
+    def _detach(self, fd):
+        self.sources.pop(fd, None)
+        self.partial.pop(fd, None)
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    
+    def _add_line(self, stream, raw):
+        text = raw.decode("utf-8", errors="replace").rstrip("\r")
+        if len(text) > self.MAX_LINE_LENGTH:
+            text = text[:self.MAX_LINE_LENGTH] + " [...]"
+        self.add(stream, text)
+    
+    def add(self, stream, text):
+        line = f"{time.strftime('%H:%M:%S')} {stream}: {text}"
+        self.lines.append(line)
+        self.seq += 1
+        if self.path is not None:
+            self.unwritten.append(line)
+        if self.flush_source is None:
+            self.flush_source = GLib.timeout_add(self.FLUSH_MS, self._flush)
+    
+    def since(self, seq):
+        """Lines appended after seq, or None if some of them fell out of the ring"""
+        missing = self.seq - seq
+        if missing > len(self.lines):
+            return None
+        return list(self.lines)[len(self.lines) - missing:] if missing else []
+    
+    def _flush(self):
+        self.flush_source = None
+        if self.unwritten:
+            self._write_file(self.unwritten)
+            self.unwritten = []
+        if self.listener is not None:
+            self.listener()
+        return False
+    
+    def _write_file(self, lines):
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        try:
+            if self.file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.file = open(self.path, "ab")
+                self.file_size = self.file.tell()
+            if self.file_size + len(data) > self.FILE_MAX_BYTES and self.file_size:
+                self._rotate()
+            self.file.write(data)
+            self.file.flush()
+            self.file_size += len(data)
+        except OSError as e:
+            print(f"[ERROR] Daemon log {self.path}: {e}, disabling it")
+            self.path = None
+            self.file = None
+    
+    def _rotate(self):
+        self.file.close()
+        for n in range(self.FILE_BACKUPS - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{n}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{n + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        self.file = open(self.path, "ab")
+        self.file_size = 0
+    
+    def close(self):
+        for fd, source in list(self.sources.items()):
+            GLib.source_remove(source)
+            self._detach(fd)
+        if self.flush_source is not None:
+            GLib.source_remove(self.flush_source)
+            self._flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class LogView:
+    """
+    Collapsible text view on a DaemonLog
+    
+    New lines are inserted at the end of the buffer and the oldest ones
+    deleted, the text is never rebuilt as a whole. While collapsed nothing
+    is drawn; expanding catches up with what was missed.
+    """
+    
+    def __init__(self, log):
+        self.log = log
+        self.shown_seq = 0
+        
+        self.expander = Gtk.Expander(label=_('daemon_log'))
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_size_request(-1, 150)
+        self.view = Gtk.TextView()
+        self.view.set_editable(False)
+        self.view.set_cursor_visible(False)
+        self.view.set_monospace(True)
+        scrolled.add(self.view)
+        self.expander.add(scrolled)
+        self.vadjustment = scrolled.get_vadjustment()
+        
+        self.buffer = self.view.get_buffer()
+        self.end_mark = self.buffer.create_mark(None, self.buffer.get_end_iter(), False)
+        
+        self.expander.connect("notify::expanded", lambda *_args: self.refresh())
+        log.listener = self.refresh
+    
+    def refresh(self):
+        if not self.expander.get_expanded():
+            return
+        new = self.log.since(self.shown_seq)
+        if new is None:
+            # Fell behind by more than the ring holds: start from the ring
+            self.buffer.set_text("")
+            new = list(self.log.lines)
+        self.shown_seq = self.log.seq
+        if not new:
+            return
+        
+        adj = self.vadjustment
+        at_bottom = adj.get_value() >= adj.get_upper() - adj.get_page_size() - 1
+        self.buffer.insert(self.buffer.get_end_iter(), "\n".join(new) + "\n")
+        
+        excess = self.buffer.get_line_count() - 1 - self.log.MAX_LINES
+        if excess > 0:
+            self.buffer.delete(self.buffer.get_start_iter(),
+                               self.buffer.get_iter_at_line(excess))
+        if at_bottom:
+            self.view.scroll_mark_onscreen(self.end_mark)
+
+
+class CommandRunner:
+    """
+    Runs the commands of the Test button and keeps track of them
+    
+    Each command runs under /bin/sh in a process group of its own, with
+    stdout and stderr on non-blocking pipes read from the main loop. GLib
+    reaps it and on_finished gets exit status, wall time and output. A run
+    still going after timeout_s gets SIGTERM for its whole group, and
+    SIGKILL KILL_GRACE_S later. Testing a command that is still running
+    replaces that run, and at most MAX_RUNNING run at once: the oldest is
+    stopped to make room.
+    """
+    
+    MAX_RUNNING = 3
+    KILL_GRACE_S = 1
+    OUTPUT_MAX_BYTES = 16384
+    READ_CHUNK = 4096
+    
+    def __init__(self, timeout_s=10.0, on_finished=None):
+        self.timeout_s = timeout_s
+        self.on_finished = on_finished
+        self.runs = {}          # pid -> run
+    
+    def run(self, command):
+        """Start command; returns its pid or None"""
+        for run in list(self.runs.values()):
+            if run['command'] == command:
+                self.stop(run, "replaced")
+        active = sorted((run for run in self.runs.values() if run['stopping'] is None),
+                        key=lambda run: run['started'])
+        for run in active[:max(0, len(active) - self.MAX_RUNNING + 1)]:
+            self.stop(run, "limit")
+        
+        try:
+            pid, _stdin, stdout, stderr = GLib.spawn_async(
+                ["/bin/sh", "-c", command],
+                flags=GLib.SpawnFlags.DO_NOT_REAP_CHILD,
+                standard_output=True, standard_error=True,
+                child_setup=os.setpgrp
+            )
+        except GLib.Error as e:
+            print(f"[ERROR] Failed to run test command: {e.message}")
+            return None
+        
+        run = {
+            'pid': pid, 'command': command, 'started': time.monotonic(),
+            'output': bytearray(), 'dropped': 0, 'fds': {},
+            'stopping': None, 'timeout_source': None, 'kill_source': None,
+        }
+        for fd in (stdout, stderr):
+            os.set_blocking(fd, False)
+            run['fds'][fd] = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT_IDLE, fd,
+                GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+                self._on_readable, run
+            )
+        if self.timeout_s:
+            run['timeout_source'] = GLib.timeout_add(int(self.timeout_s * 1000), self._on_timeout, run)
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_exit, run)
+        self.runs[pid] = run
+        print(f"[TEST] Started (PID {pid}): {command}")
+        return pid
+    
+    def _read(self, fd, run):
+        """Read what fd has now; returns False once it is closed"""
+        while True:
+            try:
+                chunk = os.read(fd, self.READ_CHUNK)
+            except BlockingIOError:
+                return True
+            except OSError:
+                chunk = b""
+            if not chunk:
+                return False
+            room = self.OUTPUT_MAX_BYTES - len(run['output'])
+            run['output'] += chunk[:max(room, 0)]
+            run['dropped'] += max(len(chunk) - max(room, 0), 0)
+    
+    def _on_readable(self, fd, condition, run):
+        if self._read(fd, run):
+            return True
+        del run['fds'][fd]
+        os.close(fd)
+        return False
+    
+    def _on_exit(self, pid, status, run):
+        GLib.spawn_close_pid(pid)
+        del self.runs[pid]
+        # Take what the pipes hold now; a child left in the background may
+        # keep them open, so EOF is not waited for
+        for fd, source in run['fds'].items():
+            self._read(fd, run)
+            GLib.source_remove(source)
+            os.close(fd)
+        run['fds'] = {}
+        for key in ('timeout_source', 'kill_source'):
+            if run[key] is not None:
+                GLib.source_remove(run[key])
+        
+        elapsed = time.monotonic() - run['started']
+        stopped = f" ({run['stopping']})" if run['stopping'] else ""
+        print(f"[TEST] PID {pid} {DaemonSupervisor.describe_status(status)} after {elapsed:.2f} s{stopped}")
+        if self.on_finished is not None:
+            self.on_finished({
+                'command': run['command'],
+                'pid': pid,
+                'status': status,
+                'elapsed': elapsed,
+                'output': run['output'].decode("utf-8", errors="replace"),
+                'dropped': run['dropped'],
+                'stopped': run['stopping'],
+            })
+    
+    def _on_timeout(self, run):
+        run['timeout_source'] = None
+        self.stop(run, "timeout")
+        return False
+    
+    def stop(self, run, reason):
+        """SIGTERM the run's process group, SIGKILL it if that is not enough"""
+        if run['stopping'] is not None:
+            return
+        run['stopping'] = reason
+        print(f"[TEST] Stopping PID {run['pid']} ({reason})")
+        self._signal_group(run['pid'], signal.SIGTERM)
+        
+        def kill():
+            run['kill_source'] = None
+            self._signal_group(run['pid'], signal.SIGKILL)
+            return False
+        
+        run['kill_source'] = GLib.timeout_add_seconds(self.KILL_GRACE_S, kill)
+    
+    @staticmethod
+    def _signal_group(pgid, sig):
+        try:
+            os.killpg(pgid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+class CommandBenchmark:
+    """
+    Spawn-to-exit latency of one command, run `runs` times
+    
+    "sequential" starts each run once the previous one has exited. "wheel"
+    starts one every WHEEL_INTERVAL_MS, the way fast scrolling makes
+    fittsmon fire, whether or not the earlier ones are done, so a command
+    too slow for it shows up as runs piling up. Exits come from GLib child
+    watches, nothing blocks the main loop; a run still going after
+    timeout_s is stopped with its process group and counted as failed.
+    """
+    
+    MODES = ("sequential", "wheel")
+    
+    def __init__(self, command, runs, mode, on_done, timeout_s=10.0):
+        self.command = command
+        self.runs = runs
+        self.mode = mode
+        self.on_done = on_done
+        self.timeout_s = timeout_s
+        self.samples = []       # ms, one per finished run
+        self.failed = 0
+        self.started = 0
+        self.running = {}       # pid -> (start time, timeout source)
+        self.tick_source = None
+        self.cancelled = False
+    
+    def start(self):
+        if self.mode == "wheel":
+            self.tick_source = GLib.timeout_add(WHEEL_INTERVAL_MS, self._tick)
+        self._launch()
+    
+    def cancel(self):
+        """Stop every run; on_done is not called"""
+        self.cancelled = True
+        if self.tick_source is not None:
+            GLib.source_remove(self.tick_source)
+            self.tick_source = None
+        for pid in list(self.running):
+            CommandRunner._signal_group(pid, signal.SIGKILL)
+    
+    def _tick(self):
+        if self.started >= self.runs:
+            self.tick_source = None
+            return False
+        self._launch()
+        return True
+    
+    def _launch(self):
+        self.started += 1
+        started = time.perf_counter()
+        try:
+            pid, _stdin, _stdout, _stderr = GLib.spawn_async(
+                ["/bin/sh", "-c", self.command],
+                flags=(GLib.SpawnFlags.DO_NOT_REAP_CHILD | GLib.SpawnFlags.STDOUT_TO_DEV_NULL
+                       | GLib.SpawnFlags.STDERR_TO_DEV_NULL),
+                child_setup=os.setpgrp
+            )
+        except GLib.Error as e:
+            print(f"[BENCH] Failed to run: {e.message}")
+            self.failed += 1
+            self._next()
+            return
+        timeout = None
+        if self.timeout_s:
+            timeout = GLib.timeout_add(int(self.timeout_s * 1000), self._on_timeout, pid)
+        self.running[pid] = (started, timeout)
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_exit)
+    
+    def _on_timeout(self, pid):
+        started, _timeout = self.running[pid]
+        self.running[pid] = (started, None)
+        CommandRunner._signal_group(pid, signal.SIGKILL)
+        return False
+    
+    def _on_exit(self, pid, status):
+        elapsed_ms = (time.perf_counter() - self.running[pid][0]) * 1000
+        GLib.spawn_close_pid(pid)
+        _started, timeout = self.running.pop(pid)
+        if timeout is not None:
+            GLib.source_remove(timeout)
+        if self.cancelled:
+            return
+        self.samples.append(elapsed_ms)
+        if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0):
+            self.failed += 1
+        self._next()
+    
+    def _next(self):
+        if self.mode == "sequential" and self.started < self.runs:
+            self._launch()
+        elif self.started >= self.runs and not self.running and not self.cancelled:
+            self.on_done(self)
+
+
+class StartupProfile:
+    """Timestamps of the startup phases, printed with --startup-profile"""
+    
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.marks = []
+        self.reported = False
+    
+    def mark(self, phase, started=None):
+        """Record a phase finishing now; started gives its own duration"""
+        now = time.perf_counter()
+        took = None if started is None else now - started
+        self.marks.append((now - _START_TIME, phase, took))
+    
+    def report_when_complete(self):
+        """Print once both the first frame and all background work are in"""
+        phases = {phase for _at, phase, _took in self.marks}
+        if not self.enabled or self.reported:
+            return
+        if not {"first frame", "background work done"} <= phases:
+            return
+        self.reported = True
+        print("[STARTUP] ms since start  phase")
+        for at, phase, took in sorted(self.marks):
+            detail = f" ({took * 1000:.1f} ms)" if took is not None else ""
+            print(f"[STARTUP] {at * 1000:13.1f}  {phase}{detail}")
+
+
+class FittsmonGUI(FittsmonCore):
+    # Idle time after the last edit before the config is written (ms)
+    SAVE_DELAY_MS = 750
+    
+    # Daemon restart: readiness polling and the give-up deadline
+    READY_SETTLE_MS = 300
+    POLL_INITIAL_MS = 10
+    POLL_MAX_MS = 160
+    RESTART_TIMEOUT_S = 5.0
+    HOTPLUG_RESTART_DELAY_MS = 2000
+    # Search hits listed at most; the rest are counted
+    SEARCH_LIMIT = 50
+    # Test button: seconds before a command is stopped (0: never), and
+    # how many lines of its output are shown under the button
+    TEST_TIMEOUT_S = 10.0
+    TEST_OUTPUT_LINES = 5
+    # Benchmark: runs per command and mode
+    BENCHMARK_RUNS = 10
+    CSV_COLUMNS = ("monitor", "zone", "event", "command", "mode", "runs", "failed",
+                   "min_ms", "p50_ms", "p95_ms", "max_ms", "budget_ms", "too_slow")
+    
+    def __init__(self, save_delay_ms=None, sparse=False, profile=None, daemon_log=None,
+                 restart_on_hotplug=False, test_timeout=None):
+        FittsmonCore.__init__(self, sparse=sparse)
+        self.profile = profile or StartupProfile()
+        self.daemon_log = DaemonLog(daemon_log)
+        self.test_runner = CommandRunner(
+            timeout_s=self.TEST_TIMEOUT_S if test_timeout is None else test_timeout,
+            on_finished=self._on_test_finished
+        )
+        self.test_pid = None
+        self.benchmark = None
+        self.benchmark_queue = collections.deque()
+        self.benchmark_total = 0
+        self.benchmark_results = []
+        
+        # Pooled overlays by monitor name, created the first time they are shown
+        self.hotspot_overlays = None
+        self.help_dialog = None
+        self.overview_dialog = None
+        self.search_source = None
+        self.pending_status = None
+        self.monitor_helper = MonitorHelper()
+        self.daemon_was_running = False
+        self.is_restarting = False
+        self.fixable_conflicts = 0
+        self.restart_generation = 0
+        self.restart_source = None
+        self.reload_watch = None
+        self.restart_started = 0.0
+        self.restart_down_at = 0.0
+        self.last_downtime_ms = None
+        self.restart_effective = None
+        
+        # Effective config (see effective_config) the running daemon uses,
+        # None while unknown; Restart is a no-op when it matches the editor
+        self.applied_config = None
+        self.pending_source = None
+        
+        # Monitor hotplug: the combo rows (monitor names, in row order) and
+        # an optional daemon restart once the new layout has settled
+        self.combo_monitors = []
+        self.restart_on_hotplug = restart_on_hotplug
+        self.hotplug_restart_source = None
+        self.daemon_pid = None
+        self.daemon_spawned_at = 0.0
+        self.closing = False
+        
+        # Write-behind saving: edits only mark the config dirty, the file
+        # is written once the user stops typing (or on focus-out/Save/close)
+        self.save_delay_ms = self.SAVE_DELAY_MS if save_delay_ms is None else save_delay_ms
+        self.config_dirty = False
+        self.save_timeout_id = None
+        self.edit_count = 0
+        self.flush_count = 0
+        
+        # Startup: the window is shown first, the daemon check and the config
+        # parse run in worker threads and fill in the widgets as they finish
+        self.ready = False
+        self.startup_pending = {'monitors', 'config', 'daemon'}
+        self.loaded_config = None
+        
+        self.setup_styles()
+        self.profile.mark("styles")
+        self.setup_gui()
+        self.profile.mark("widgets built")
+        self.supervisor = DaemonSupervisor(self)
+        self.start_background_loading()
+    
+    def start_background_loading(self):
+        self.set_editing_sensitive(False)
+        self.spinner.start()
+        self.set_status(_('status_loading'), error=False, busy=True)
+        
+        # Only the /proc scan runs in the worker: the DaemonTracker is
+        # updated on the main thread, in _on_daemon_status
+        self.run_in_background("daemon status", self.daemon.find, self._on_daemon_status)
+        self.run_in_background("config parse", self.read_config, self._on_config_read)
+        
+        # In-process and quick, but GDK belongs to the main thread
+        started = time.perf_counter()
+        self._on_monitors_probed(self.probe_monitors())
+        self.monitor_helper.watch(self._on_monitors_changed)
+        self.profile.mark("monitor query", started)
+    
+    def run_in_background(self, phase, func, callback):
+        """Run func in a worker thread and hand its result to callback on the main loop"""
+        def worker():
+            started = time.perf_counter()
+            try:
+                result = func()
+            except Exception as e:
+                print(f"[ERROR] {phase} failed: {e}")
+                result = None
+            self.profile.mark(phase, started)
+            GLib.idle_add(callback, result)
+        
+        threading.Thread(target=worker, name=phase, daemon=True).start()
+    
+    def probe_monitors(self):
+        """Connected outputs, with their geometry, from one in-process RandR query"""
+        monitors = self.monitor_helper.detect_monitors()
+        return [{'name': mon['name'], 'primary': mon['primary']} for mon in monitors] \
+            or [{'name': 'default', 'primary': True}]
+    
+    def _on_monitors_probed(self, monitors):
+        self.monitors = monitors or []
+        self.section_names = {}
+        self._startup_step_done('monitors')
+        return False
+    
+    def _on_config_read(self, config):
+        if config is None:
+            self.set_status(f"{_('status_error')}: {self.config_file}", error=True)
+            config = ConfigParser(sparse=self.sparse)
+        self.loaded_config = config
+        self._startup_step_done('config')
+        return False
+    
+    def _on_daemon_status(self, pids):
+        running = self.daemon.tracked_alive()
+        if not running and pids:
+            # Adopt it, like DaemonTracker.is_running()
+            self.daemon.record(pids[0])
+            running = True
+        self.daemon_was_running = running
+        print(f"[DAEMON] Initial status at startup: {'Running' if self.daemon_was_running else 'Not running'}")
+        if self.daemon_was_running and self.daemon.pid is not None:
+            self.supervisor.watching(self.daemon.pid, child=False)
+            self.daemon_log.add("gui", _('daemon_log_adopted').format(pid=self.daemon.pid))
+        else:
+            self.supervisor.update_label()
+        self._startup_step_done('daemon')
+        return False
+    
+    def _startup_step_done(self, step):
+        self.startup_pending.discard(step)
+        if not self.ready and not self.startup_pending & {'monitors', 'config'}:
+            self._finish_startup()
+        if not self.startup_pending:
+            self.profile.mark("background work done")
+            self.profile.report_when_complete()
+    
+    def _finish_startup(self):
+        """Monitors and config are known: fill in the widgets"""
+        self.spinner.stop()
+        self.set_status(_('status_ready'), error=False)
+        last_layout = self.profiles.last_layout()
+        self.apply_config(self.loaded_config)
+        self.loaded_config = None
+        
+        if not self.monitors:
+            self.set_status(f"{_('status_error')}: no monitors detected", error=True)
+            return
+        
+        # Docked or undocked while the GUI was closed: fittsmonrc still has
+        # the bindings of the layout it was written for, with any edits made
+        # meanwhile ("Edit File", --set). Keep them as that layout's profile
+        # before the connected layout's profile replaces them.
+        switched = last_layout not in (None, self.profiles.layout_key(self.monitors))
+        if switched:
+            self.profiles.put(last_layout, self.binding_snapshot())
+        
+        self.follow_renamed_monitors()
+        
+        if switched:
+            self.switch_layout()
+        else:
+            self.remember_layout()
+        
+        self.monitor_combo.handler_block_by_func(self.on_monitor_changed)
+        for monitor in self.monitors:
+            self.monitor_combo.append(monitor['name'], self.monitor_label(monitor))
+            self.combo_monitors.append(monitor['name'])
+        self.monitor_combo.set_active(0)
+        self.monitor_combo.handler_unblock_by_func(self.on_monitor_changed)
+        self.current_monitor = self.monitors[0]['name']
+        
+        self.ready = True
+        self.set_editing_sensitive(True)
+        self.update_command_display()
+        
+        # A daemon from an earlier session runs what its pidfile says
+        if self.daemon.fingerprint is not None:
+            effective = self.effective_config()
+            if self.daemon.fingerprint == self.config_fingerprint(effective):
+                self.applied_config = effective
+        self.update_pending_changes()
+        self.profile.mark("ready")
+    
+    @staticmethod
+    def monitor_label(monitor):
+        return f"{monitor['name']} {_('primary') if monitor['primary'] else ''}"
+    
+    def _on_monitors_changed(self, added, removed, changed):
+        """Outputs were (un)plugged or rearranged while the GUI is open"""
+        print(f"[MONITOR] Layout changed: added {added}, removed {removed}, changed {changed}")
+        if self.ready:
+            # Edits made so far belong to the old layout's profile
+            self.flush_config()
+        self.monitors = [{'name': mon['name'], 'primary': mon['primary']}
+                         for mon in self.monitor_helper.monitors.values()]
+        self.section_names = {}
+        if not self.ready:
+            # _finish_startup fills the combo from self.monitors
+            return
+        
+        self.follow_renamed_monitors()
+        switched = self.switch_layout()
+        self._update_monitor_combo(added, removed, changed)
+        if switched:
+            self.sync_hotspot_overlays()
+        else:
+            self.sync_hotspot_overlays(set(added) | set(removed) | set(changed))
+            self.set_status(_('status_monitors_changed').format(
+                names=", ".join([f"+{n}" for n in added] + [f"-{n}" for n in removed] + changed)
+            ), error=False)
+        self.update_pending_changes()
+        
+        if self.restart_on_hotplug:
+            if self.hotplug_restart_source is not None:
+                GLib.source_remove(self.hotplug_restart_source)
+            self.hotplug_restart_source = GLib.timeout_add(
+                self.HOTPLUG_RESTART_DELAY_MS, self._on_hotplug_restart
+            )
+    
+    def follow_renamed_monitors(self):
+        """Move the sections of monitors that show up on another connector"""
+        renames = self.identities.resolve([
+            (mon['name'], self.monitor_helper.monitors.get(mon['name'], {}).get('identity', ""))
+            for mon in self.monitors
+        ])
+        moved = 0
+        for old, new in renames:
+            count = self.move_monitor_sections(old, new)
+            print(f"[MONITOR] {old} is now {new}: moved {count} binding(s)")
+            moved += count
+        if moved:
+            self.config_dirty = True
+            self.flush_config()
+            self.set_status(_('status_monitor_renamed').format(
+                renames=", ".join(f"{old} → {new}" for old, new in renames)
+            ), error=False)
+        return renames
+    
+    def switch_layout(self):
+        """
+        Put the profile of the connected layout into fittsmonrc with one
+        write; returns True if any binding changed
+        """
+        started = time.perf_counter()
+        if not self.restore_layout():
+            self.remember_layout()
+            return False
+        self.config_dirty = True
+        self.flush_config()
+        layout = self.profiles.layout_key(self.monitors)
+        print(f"[CONFIG] Switched to layout {layout} in {(time.perf_counter() - started) * 1000:.1f} ms")
+        self.set_status(_('status_profile_switched').format(layout=layout.replace("*", "")), error=False)
+        if self.ready:
+            self.update_command_display()
+        return True
+    
+    def _update_monitor_combo(self, added, removed, changed):
+        """Remove, add and relabel only the rows of affected monitors"""
+        combo = self.monitor_combo
+        info = {mon['name']: mon for mon in self.monitors}
+        combo.handler_block_by_func(self.on_monitor_changed)
+        
+        for name in removed:
+            row = self.combo_monitors.index(name)
+            combo.remove(row)
+            del self.combo_monitors[row]
+        for name in changed:
+            row = self.combo_monitors.index(name)
+            combo.remove(row)
+            combo.insert(row, name, self.monitor_label(info[name]))
+        order = [mon['name'] for mon in self.monitors]
+        for name in added:
+            row = min(order.index(name), len(self.combo_monitors))
+            combo.insert(row, name, self.monitor_label(info[name]))
+            self.combo_monitors.insert(row, name)
+        
+        if self.current_monitor not in info:
+            self.current_monitor = self.monitors[0]['name'] if self.monitors else None
+        if self.current_monitor is not None:
+            combo.set_active_id(self.current_monitor)
+        combo.handler_unblock_by_func(self.on_monitor_changed)
         
-        self.monitor_helper.detect_monitors()
-    
-    def load_config(self):
-        self.config = ConfigParser()
-        if self.config_file.exists():
-            print(f"[CONFIG] Loading: {self.config_file}")
-            self.config.read(self.config_file)
-        elif self.monitors:
-            print(f"[CONFIG] File not found - creating default from detected displays")
-            self.save_config()
+        if self.current_monitor is None:
+            self.set_editing_sensitive(False)
         else:
-            print(f"[CONFIG] File not found - no monitors detected, skipping default config creation")
-            self.set_status(f"{_('status_error')}: no monitors detected", error=True)
+            self.set_editing_sensitive(not self.is_restarting)
+            self.update_command_display()
     
-    def save_config(self):
-        try:
-            self.config.write(self.config_file, self.zones, self.events, self.monitors)
-            print(f"[CONFIG] Saved: {self.config_file}")
-            self.set_status(_('status_saved'), error=False)
+    def _on_hotplug_restart(self):
+        if self.is_restarting:
+            # Try again once the running restart is through; the source
+            # stays live and tracked, so a new hotplug still replaces it
             return True
-        except Exception as e:
-            print(f"[ERROR] Failed to save config: {e}")
-            self.set_status(f"{_('status_error')}: {e}", error=True)
-            return False
+        self.hotplug_restart_source = None
+        if self.daemon.is_running():
+            print(f"[MONITOR] Restarting fittsmon for {', '.join(self.daemon_command()[2:])}")
+            self.restart_fittsmon()
+        return False
     
-    def get_section_name(self, monitor, zone):
-        if monitor == self.monitors[0]['name'] and self.monitors[0]['primary']:
-            return zone
-        else:
-            return f"{monitor}-{zone}"
+    def set_editing_sensitive(self, sensitive):
+        for widget in (self.monitor_combo, self.zone_grid, self.event_combo,
+                       self.command_entry, self.test_btn, self.hotspot_toggle_btn,
+                       self.save_btn, self.restart_btn):
+            widget.set_sensitive(sensitive)
+        # Stop for a running benchmark, which must stay reachable
+        self.bench_btn.set_sensitive(sensitive or self.benchmark is not None)
+        self.fix_conflicts_btn.set_sensitive(sensitive and self.fixable_conflicts > 0)
     
-    def get_command(self, monitor, zone, event):
-        section = self.get_section_name(monitor, zone)
-        return self.config.get(section, event, fallback="")
+    def _on_first_draw(self, widget, context):
+        self.window.disconnect_by_func(self._on_first_draw)
+        self.profile.mark("first frame")
+        self.profile.report_when_complete()
+        return False
     
-    def set_command(self, monitor, zone, event, command):
-        section = self.get_section_name(monitor, zone)
-        
-        if not self.config.has_section(section):
-            self.config.add_section(section)
+    def mark_config_dirty(self):
+        """Record an edit and (re)arm the idle timer that flushes it"""
+        self.config_dirty = True
+        self.edit_count += 1
+        self.refresh_config_views()
+        if self.pending_source is None:
+            self.pending_source = GLib.idle_add(self.update_pending_changes)
+        if self.save_timeout_id is not None:
+            GLib.source_remove(self.save_timeout_id)
+        self.save_timeout_id = GLib.timeout_add(self.save_delay_ms, self._on_save_timeout)
+    
+    def _on_save_timeout(self):
+        self.save_timeout_id = None
+        self.flush_config()
+        return False
+    
+    def flush_config(self):
+        """Write pending edits to disk, if there are any"""
+        if self.save_timeout_id is not None:
+            GLib.source_remove(self.save_timeout_id)
+            self.save_timeout_id = None
+        if not self.config_dirty:
+            return True
+        # Reading and writing the file must not pass for a daemon reload
+        watch = self.reload_watch
+        with watch.ignoring() if watch is not None else contextlib.nullcontext():
+            saved = self.save_config()
+        if not saved:
+            return False
+        self.config_dirty = False
+        self.refresh_config_views()
+        self.flush_count += 1
+        print(f"[CONFIG] Write-behind: {self.flush_count} flushes for {self.edit_count} edits "
+              f"({self.config.write_count} written, {self.config.skip_count} unchanged)")
+        return True
+    
+    def set_applied_config(self, effective):
+        self.applied_config = effective
+        self.daemon.note_fingerprint(self.config_fingerprint(effective))
+        self.update_pending_changes()
+    
+    def update_pending_changes(self):
+        """Show how the edited config differs from what the daemon runs"""
+        self.pending_source = None
+        if not self.ready:
+            return False
+        if self.applied_config is None:
+            text = _('pending_unknown') if self.daemon.pid is not None else ""
+            self.pending_label.set_text(text)
+            self.pending_label.set_tooltip_text(None)
+            return False
         
-        if command and event in self.WHEEL_CONFLICT_PAIRS:
-            conflict_event = self.WHEEL_CONFLICT_PAIRS[event]
-            conflict_cmd = self.config.get(section, conflict_event, fallback="")
-            if conflict_cmd:
-                print(f"[CONFIG] Auto-clearing: {section}.{conflict_event}")
-                self.config.remove_option(section, conflict_event)
+        old_args, old_bindings = self.applied_config
+        new_args, new_bindings = self.effective_config()
+        changed = sorted({(section, event) for section, event, _cmd in old_bindings ^ new_bindings})
+        parts = []
+        if changed:
+            parts.append(_('pending_bindings').format(count=len(changed)))
+        if old_args != new_args:
+            parts.append(_('pending_monitors'))
+        self.pending_label.set_text(", ".join(parts))
         
-        self.config.set(section, event, command)
-        print(f"[CONFIG] Set {section}.{event} = '{command}'")
+        details = [f"[{section}] {event}" for section, event in changed[:20]]
+        if len(changed) > 20:
+            details.append("...")
+        if old_args != new_args:
+            details.append(f"--monitor {' '.join(old_args[1:])} → {' '.join(new_args[1:])}")
+        self.pending_label.set_tooltip_text("\n".join(details) or None)
+        return False
     
     def check_wheel_conflict(self, event):
         if event not in self.WHEEL_CONFLICT_PAIRS:
             return None
         
         conflict_event = self.WHEEL_CONFLICT_PAIRS[event]
-        current_cmd = self.get_command(self.current_monitor, self.current_zone, event)
-        conflict_cmd = self.get_command(self.current_monitor, self.current_zone, conflict_event)
+        store = self.config.store
+        mask = self.section_mask(self.current_monitor, self.current_zone)
         
-        if current_cmd == "" and conflict_cmd:
+        if not mask & store.event_mask((event,)) and mask & store.event_mask((conflict_event,)):
             return {
                 'event': event,
                 'conflict_event': conflict_event,
-                'conflict_value': conflict_cmd,
+                'conflict_value': self.get_command(self.current_monitor, self.current_zone, conflict_event),
                 'type': 'wheel'
             }
         
         return None
     
     def check_enter_leave_conflict(self, event):
-        section = self.get_section_name(self.current_monitor, self.current_zone)
+        store = self.config.store
+        mask = self.section_mask(self.current_monitor, self.current_zone)
         
         if event in self.ENTER_LEAVE_EVENTS:
-            conflicting_buttons = []
-            for btn_event in self.BUTTON_EVENTS:
-                cmd = self.config.get(section, btn_event, fallback="")
-                if cmd:
-                    conflicting_buttons.append(btn_event)
-            
+            conflicting_buttons = store.event_names(mask & store.event_mask(self.BUTTON_EVENTS))
             if conflicting_buttons:
                 return {
                     'event': event,
@@ -839,12 +4248,7 @@ class FittsmonGUI:
                 }
         
         if event in self.BUTTON_EVENTS:
-            conflicting_motion = []
-            for motion_event in self.ENTER_LEAVE_EVENTS:
-                cmd = self.config.get(section, motion_event, fallback="")
-                if cmd:
-                    conflicting_motion.append(motion_event)
-            
+            conflicting_motion = store.event_names(mask & store.event_mask(self.ENTER_LEAVE_EVENTS))
             if conflicting_motion:
                 return {
                     'event': event,
@@ -854,121 +4258,342 @@ class FittsmonGUI:
         
         return None
     
-    def is_daemon_running(self):
-        try:
-            result = subprocess.run(
-                ["pgrep", "-f", "fittsmon"],
-                capture_output=True, text=True, timeout=2
-            )
-            is_running = result.returncode == 0
-            print(f"[DAEMON] Status check: {'Running' if is_running else 'Not running'}")
-            return is_running
-        except Exception as e:
-            print(f"[ERROR] Failed to check daemon status: {e}")
-            return False
-    
-    def check_daemon_status(self):
-        self.daemon_was_running = self.is_daemon_running()
-        print(f"[DAEMON] Initial status at startup: {'Running' if self.daemon_was_running else 'Not running'}")
-    
-    def kill_fittsmon(self):
-        try:
-            subprocess.run(
-                ["killall", "fittsmon"],
-                capture_output=True, text=True, timeout=3
-            )
-            print("[DAEMON] Killed fittsmon")
-            time.sleep(0.5)
-            return True
-        except:
-            return False
-    
-    def start_fittsmon(self):
-        try:
-            cmd = ["fittsmon", "--monitor"] + [m['name'] for m in self.monitors]
-            print(f"[DAEMON] Starting: {' '.join(cmd)}")
-            
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                stdin=subprocess.DEVNULL,
-                close_fds=True,
-                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
-            )
-            
-            time.sleep(1)
-            
-            if process.poll() is None:
-                print(f"[DAEMON] Started successfully (PID: {process.pid})")
-                return True
-            else:
-                return False
-        except Exception as e:
-            print(f"[ERROR] Failed to start fittsmon: {e}")
-            return False
+    def update_conflicts(self):
+        """Badges on the zone grid and the "fix all" button, from the whole-config list"""
+        conflicts = self.find_conflicts()
+        badges = {}
+        for conflict in conflicts:
+            if conflict['monitor'] == self.current_monitor:
+                badges.setdefault(conflict['zone'], []).append(conflict)
+        self.zone_grid.set_conflicts(badges)
+        
+        self.fixable_conflicts = sum(1 for conflict in conflicts if conflict['type'] == 'wheel')
+        if conflicts:
+            self.fix_conflicts_btn.set_label(_('fix_all_conflicts').format(count=self.fixable_conflicts))
+            self.fix_conflicts_btn.set_sensitive(self.fixable_conflicts > 0 and not self.is_restarting)
+            self.fix_conflicts_btn.set_tooltip_text("\n".join(
+                f"[{c['section']}] {', '.join(c['events'])} ↔ {', '.join(c['conflict_events'])}"
+                for c in conflicts
+            ))
+            self.fix_conflicts_btn.show()
+        else:
+            self.fix_conflicts_btn.hide()
     
-    def restart_fittsmon(self):
+    def restart_fittsmon(self, force=False):
+        """
+        Make the daemon use the current config without ever blocking the
+        main loop. Nothing happens if it already does (unless forced). A
+        daemon that handles SIGHUP reloads in place and keeps its X
+        connection; otherwise it is killed and respawned with a child watch,
+        and readiness is polled with exponential backoff.
+        """
         if self.is_restarting:
             return False
         
+        effective = self.effective_config()
+        if not force and effective == self.applied_config and self.daemon.is_running():
+            print("[DAEMON] Configuration unchanged for the daemon, not restarting")
+            self.set_status(_('status_no_changes'), error=False)
+            return False
+        
+        self.restart_effective = effective
         self.is_restarting = True
+        self.restart_generation += 1
+        self.restart_started = time.monotonic()
         self.set_buttons_sensitive(False)
-        self.set_status(_('status_stopping'), error=False, busy=True)
         self.spinner.start()
         
-        GLib.timeout_add(100, self._restart_phase_kill)
+        # The watch for the reload must see the file the daemon will read
+        self.flush_config()
+        pids, self.reload_watch = self.daemon.reload(self.daemon_command(), self.config_file)
+        if pids:
+            self._reload_phase_verify(pids)
+        else:
+            self._restart_phase_kill()
         return True
     
+    def _reload_phase_verify(self, pids):
+        print(f"[DAEMON] Sent SIGHUP to fittsmon (PID: {', '.join(map(str, pids))})")
+        self.set_status(_('status_reloading'), error=False, busy=True)
+        watch = self.reload_watch
+        
+        # Reloaded once every daemon opened fittsmonrc again and, like a
+        # fresh start, is still alive after READY_SETTLE_MS
+        def check():
+            if not all(self.daemon.pid_alive(pid) for pid in pids):
+                return False
+            elapsed_ms = (time.monotonic() - self.restart_started) * 1000
+            if watch.count() < len(pids):
+                return False if elapsed_ms >= self.RELOAD_CONFIRM_S * 1000 else None
+            return True if elapsed_ms >= self.READY_SETTLE_MS else None
+        
+        def done(reloaded):
+            self.close_reload_watch()
+            if reloaded:
+                self._restart_finished(True, reloaded=True)
+            elif all(self.daemon.pid_alive(pid) for pid in pids):
+                print("[DAEMON] fittsmon did not read fittsmonrc again after SIGHUP, falling back to a restart")
+                self._restart_phase_kill()
+            else:
+                print("[DAEMON] fittsmon did not survive SIGHUP, falling back to a restart")
+                self._restart_phase_kill()
+        
+        self.poll_with_backoff(check, done)
+    
+    def close_reload_watch(self):
+        if self.reload_watch is not None:
+            self.reload_watch.close()
+            self.reload_watch = None
+    
+    def cancel_restart(self):
+        """Abandon a running restart; late callbacks of it are ignored"""
+        self.restart_generation += 1
+        if self.restart_source is not None:
+            GLib.source_remove(self.restart_source)
+            self.restart_source = None
+        self.close_reload_watch()
+        if self.is_restarting:
+            self.is_restarting = False
+            self.spinner.stop()
+            self.set_buttons_sensitive(True)
+    
     def _restart_phase_kill(self):
-        self.kill_fittsmon()
-        GLib.timeout_add(500, self._restart_phase_start)
-        return False
+        self.set_status(_('status_stopping'), error=False, busy=True)
+        self.supervisor.expect_exit(self.daemon.find())
+        pids = self.daemon.terminate()
+        if pids:
+            print(f"[DAEMON] Stopping fittsmon (PID: {', '.join(map(str, pids))})")
+        
+        # Go on once they are gone (or after the deadline, as killall did)
+        def check():
+            return True if not any(self.daemon.pid_alive(pid) for pid in pids) else None
+        
+        self.poll_with_backoff(check, lambda _gone: self._restart_phase_start())
     
     def _restart_phase_start(self):
+        # No daemon from here until the new one is ready: that is the downtime
+        self.restart_down_at = time.monotonic()
         self.set_status(_('status_starting'), error=False, busy=True)
-        GLib.timeout_add(100, self._restart_phase_verify)
-        return False
+        pid = self.spawn_daemon()
+        if pid is None:
+            self._restart_finished(False)
+            return
+        self._restart_phase_verify(pid)
     
-    def _restart_phase_verify(self):
-        success = self.start_fittsmon()
+    def _restart_phase_verify(self, pid):
+        self.wait_daemon_ready(pid, self._restart_finished)
+    
+    def _restart_finished(self, success, reloaded=False):
+        now = time.monotonic()
+        latency_ms = (now - self.restart_started) * 1000
         self.spinner.stop()
         self.is_restarting = False
         self.set_buttons_sensitive(True)
         
-        if success:
-            self.set_status(_('status_ready'), error=False)
+        if success and reloaded:
+            self.set_applied_config(self.restart_effective)
+            self.last_downtime_ms = 0.0
+            print(f"[DAEMON] Reloaded in place, downtime 0 ms (confirmed after {latency_ms:.0f} ms)")
+            self.set_status(_('status_reloaded_in').format(ms=f"{latency_ms:.0f}"), error=False)
+        elif success:
+            self.supervisor.reset()
+            self.last_downtime_ms = (now - self.restart_down_at) * 1000
+            print(f"[DAEMON] Kill-to-ready latency: {latency_ms:.0f} ms, "
+                  f"downtime {self.last_downtime_ms:.0f} ms")
+            self.set_status(_('status_restarted_in').format(ms=f"{latency_ms:.0f}"), error=False)
         else:
             self.set_status(_('status_failed_start'), error=True)
+    
+    def spawn_watched(self, argv, on_exit, capture=False, child_setup=None):
+        """
+        Spawn argv asynchronously; on_exit(pid, status) runs when it exits.
+        With capture its stdout and stderr go to the daemon log, through
+        relays (DaemonLog.relay), else to /dev/null.
+        """
+        flags = (GLib.SpawnFlags.SEARCH_PATH | GLib.SpawnFlags.DO_NOT_REAP_CHILD
+                 | GLib.SpawnFlags.STDOUT_TO_DEV_NULL | GLib.SpawnFlags.STDERR_TO_DEV_NULL)
+        outputs = [self.daemon_log.relay("out"), self.daemon_log.relay("err")] if capture else []
         
-        return False
+        def setup():
+            if child_setup is not None:
+                child_setup()
+            # After GLib's own redirection to /dev/null, so this wins
+            for target, fd in enumerate(outputs, 1):
+                if fd is not None:
+                    os.dup2(fd, target)
+        
+        try:
+            pid, _stdin, _stdout, _stderr = GLib.spawn_async(argv, flags=flags, child_setup=setup)
+        except GLib.Error as e:
+            print(f"[ERROR] Failed to run {argv[0]}: {e.message}")
+            return None
+        finally:
+            for fd in outputs:
+                if fd is not None:
+                    os.close(fd)
+        
+        def exited(pid, status):
+            GLib.spawn_close_pid(pid)
+            on_exit(pid, status)
+        
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, exited)
+        return pid
+    
+    def spawn_daemon(self):
+        """Start fittsmon in its own session; returns its pid or None"""
+        # It reads fittsmonrc when it starts: make the file match the editor
+        self.flush_config()
+        effective = self.effective_config()
+        cmd = self.daemon_command()
+        print(f"[DAEMON] Starting: {' '.join(cmd)}")
+        pid = self.spawn_watched(cmd, self._on_daemon_exited, capture=True,
+                                 child_setup=self._daemon_child_setup)
+        if pid is not None:
+            self.daemon_log.add("gui", f"started {' '.join(cmd)} (PID {pid})")
+            self.daemon.record(pid)
+            self.set_applied_config(effective)
+            self.daemon_pid = pid
+            self.daemon_spawned_at = time.monotonic()
+            self.supervisor.watching(pid, child=True)
+        return pid
+    
+    @staticmethod
+    def _daemon_child_setup():
+        # Own session, so it outlives the GUI
+        os.setsid()
+    
+    def _on_daemon_exited(self, pid, status):
+        print(f"[DAEMON] fittsmon (PID: {pid}) exited with status {status}")
+        self.daemon_log.add("gui", f"fittsmon (PID {pid}) exited: {DaemonSupervisor.describe_status(status)}")
+        self.daemon.forget(pid)
+        self.supervisor.daemon_exited(pid, status)
+        if pid == self.daemon_pid:
+            self.daemon_pid = None
+    
+    def wait_daemon_ready(self, pid, callback):
+        """
+        fittsmon has no readiness handshake: it counts as started once it
+        has stayed alive for READY_SETTLE_MS. Exiting earlier is a failure,
+        which the child watch reports without waiting for the full period.
+        """
+        def check():
+            if self.daemon_pid != pid:
+                return False
+            if (time.monotonic() - self.daemon_spawned_at) * 1000 >= self.READY_SETTLE_MS:
+                print(f"[DAEMON] Started successfully (PID: {pid})")
+                return True
+            return None
+        
+        self.poll_with_backoff(check, lambda ready: callback(bool(ready)))
+    
+    def poll_with_backoff(self, check, callback):
+        """
+        Call check() after POLL_INITIAL_MS, then at doubling intervals up to
+        POLL_MAX_MS, until it returns True/False or RESTART_TIMEOUT_S runs
+        out; the outcome (None on timeout) goes to callback.
+        cancel_restart() stops the polling.
+        """
+        generation = self.restart_generation
+        deadline = time.monotonic() + self.RESTART_TIMEOUT_S
+        delay = self.POLL_INITIAL_MS
+        
+        def tick():
+            nonlocal delay
+            self.restart_source = None
+            if generation != self.restart_generation:
+                return False
+            result = check()
+            if result is None and time.monotonic() < deadline:
+                delay = min(delay * 2, self.POLL_MAX_MS)
+                self.restart_source = GLib.timeout_add(delay, tick)
+                return False
+            callback(result)
+            return False
+        
+        self.restart_source = GLib.timeout_add(delay, tick)
     
     def set_buttons_sensitive(self, sensitive):
         self.restart_btn.set_sensitive(sensitive)
         self.save_btn.set_sensitive(sensitive)
         self.test_btn.set_sensitive(sensitive)
+        self.bench_btn.set_sensitive(sensitive or self.benchmark is not None)
     
     def show_hotspot_windows(self):
-        self.close_hotspot_windows()
+        if self.hotspot_overlays is None:
+            self.hotspot_overlays = {}
+            self.sync_hotspot_overlays()
+        else:
+            self.map_hotspot_overlays()
+    
+    def hide_hotspot_windows(self):
+        for overlay in (self.hotspot_overlays or {}).values():
+            overlay.hide()
+    
+    def map_hotspot_overlays(self):
+        """Map the pooled overlays that have cards while the toggle is on"""
+        visible = self.hotspot_toggle_btn.get_active()
+        for overlay in self.hotspot_overlays.values():
+            overlay.set_visible(visible and bool(overlay.cards))
+    
+    def sync_hotspot_overlays(self, names=None):
+        """
+        Bring the pooled overlays of the given monitors (default: all) in
+        line with the config and the monitor layout, reusing their windows
+        """
+        if self.hotspot_overlays is None:
+            return
+        connected = {mon['name'] for mon in self.monitors}
+        names = connected | set(self.hotspot_overlays) if names is None else set(names)
+        cards = self.build_hotspot_cards([mon for mon in self.monitors if mon['name'] in names])
+        for name in names:
+            overlay = self.hotspot_overlays.get(name)
+            if name not in connected:
+                if overlay is not None:
+                    overlay.destroy()
+                    del self.hotspot_overlays[name]
+                continue
+            geom = self.monitor_helper.get_monitor_geom(name)
+            if overlay is None:
+                overlay = self.hotspot_overlays[name] = MonitorOverlay(name, geom)
+            else:
+                overlay.set_geometry(geom)
+            overlay.set_cards(cards.get(name, []))
+        self.map_hotspot_overlays()
+    
+    def update_hotspot_card(self, monitor, zone):
+        """Redraw the one card an edit touched, leaving the others alone"""
+        overlay = (self.hotspot_overlays or {}).get(monitor)
+        if overlay is None:
+            return
+        overlay.set_zone(zone, {event: self.get_command(monitor, zone, event) for event in self.events})
+        overlay.set_visible(self.hotspot_toggle_btn.get_active() and bool(overlay.cards))
+    
+    def build_hotspot_cards(self, monitors):
+        """{monitor: [(zone, {event: command})]} for the configured zones of the given monitors"""
+        store = self.config.store
+        slot_monitors = {}
+        for mon in monitors:
+            slot = store.monitor_slot(self.get_section_prefix(mon['name']), create=False)
+            if slot is not None:
+                slot_monitors[slot] = mon['name']
         
-        for mon_name in [m['name'] for m in self.monitors]:
-            mon_geom = self.monitor_helper.get_monitor_geom(mon_name)
-            
-            for zone in self.zones:
-                commands_dict = {}
-                for event in self.events:
-                    cmd = self.get_command(mon_name, zone, event)
-                    if cmd.strip():
-                        commands_dict[event] = cmd
-                
-                if commands_dict:
-                    hotspot = HotspotWindow(zone, mon_name, commands_dict, mon_geom)
-                    self.hotspot_windows.append(hotspot)
+        # Walk only the non-empty cells instead of every monitor x zone x event
+        zone_commands = {}
+        for slot, zone, event, cmd in store.iter_filled():
+            if slot in slot_monitors and cmd.strip():
+                zone_commands.setdefault((slot, zone), {})[store.events[event]] = cmd
+        
+        # Cards of each monitor, zones in grid order
+        monitor_cards = {}
+        for (slot, zone), commands_dict in sorted(zone_commands.items()):
+            monitor_cards.setdefault(slot_monitors[slot], []).append((store.zones[zone], commands_dict))
+        
+        return monitor_cards
     
-    def close_hotspot_windows(self):
-        for window in self.hotspot_windows:
-            window.destroy()
-        self.hotspot_windows = []
+    def destroy_hotspot_windows(self):
+        for overlay in (self.hotspot_overlays or {}).values():
+            overlay.destroy()
+        self.hotspot_overlays = None
     
     def setup_styles(self):
         css_provider = Gtk.CssProvider()
@@ -991,6 +4616,12 @@ class FittsmonGUI:
             background-image: none;
             background-color: #BDBDBD;
         }
+        .zone-conflict {
+            border: 2px solid #E53935;
+        }
+        .zone-warning {
+            border: 2px solid #FFB74D;
+        }
         .warning-box {
             background-color: #FFF3E0;
             border: 1px solid #FFB74D;
@@ -1015,6 +4646,7 @@ class FittsmonGUI:
         self.window.set_default_size(850, 850)
         self.window.set_position(Gtk.WindowPosition.CENTER)
         self.window.connect("delete-event", self.on_window_close)
+        self.window.connect("draw", self._on_first_draw)
         
         try:
             self.window.set_icon_name("input-mouse")
@@ -1039,6 +4671,10 @@ class FittsmonGUI:
         help_btn.connect("clicked", self.on_help_clicked)
         title_box.pack_end(help_btn, False, False, 0)
         
+        overview_btn = Gtk.Button(label=_('overview'))
+        overview_btn.connect("clicked", self.on_overview_clicked)
+        title_box.pack_end(overview_btn, False, False, 0)
+        
         main_box.pack_start(title_box, False, False, 0)
         
         # Status with spinner
@@ -1060,18 +4696,46 @@ class FittsmonGUI:
             self.set_status(_('status_ready'), error=False)
         
         main_box.pack_start(status_box, False, False, 0)
+        
+        # Daemon health (filled in by DaemonSupervisor)
+        self.daemon_label = Gtk.Label()
+        self.daemon_label.set_line_wrap(True)
+        self.daemon_label.set_halign(Gtk.Align.CENTER)
+        main_box.pack_start(self.daemon_label, False, False, 0)
+        
+        # Edits the daemon does not run yet
+        self.pending_label = Gtk.Label()
+        self.pending_label.set_line_wrap(True)
+        self.pending_label.set_halign(Gtk.Align.CENTER)
+        self.pending_label.get_style_context().add_class("dim-label")
+        main_box.pack_start(self.pending_label, False, False, 0)
+        
+        self.log_view = LogView(self.daemon_log)
+        main_box.pack_start(self.log_view.expander, False, False, 0)
         main_box.pack_start(Gtk.Separator(), False, False, 0)
         
+        # Search over all bound commands
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text(_('search_placeholder'))
+        self.search_entry.connect("search-changed", self.update_search)
+        main_box.pack_start(self.search_entry, False, False, 0)
+        self.search_list = Gtk.ListBox()
+        self.search_list.set_activate_on_single_click(True)
+        self.search_list.connect("row-activated", self.on_search_row_activated)
+        self.search_scroll = Gtk.ScrolledWindow()
+        self.search_scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.search_scroll.set_max_content_height(160)
+        self.search_scroll.set_propagate_natural_height(True)
+        self.search_scroll.add(self.search_list)
+        main_box.pack_start(self.search_scroll, False, False, 0)
+        
         # Monitor selection
         mon_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         mon_box.pack_start(Gtk.Label(label=_('monitor')), False, False, 0)
+        # Filled in by _finish_startup once monitors and config are known
         self.monitor_combo = Gtk.ComboBoxText()
-        for monitor in self.monitors:
-            label = f"{monitor['name']} {_('primary') if monitor['primary'] else ''}"
-            self.monitor_combo.append_text(label)
-        self.monitor_combo.set_active(0)
         self.monitor_combo.connect("changed", self.on_monitor_changed)
-        self.current_monitor = self.monitors[0]['name']
+        self.current_monitor = None
         mon_box.pack_start(self.monitor_combo, True, True, 0)
         main_box.pack_start(mon_box, False, False, 0)
         
@@ -1084,6 +4748,12 @@ class FittsmonGUI:
         main_box.pack_start(self.zone_grid, False, False, 0)
         self.current_zone = self.zones[0]
         
+        # Conflicts anywhere in the config (all monitors)
+        self.fix_conflicts_btn = Gtk.Button()
+        self.fix_conflicts_btn.set_halign(Gtk.Align.CENTER)
+        self.fix_conflicts_btn.connect("clicked", self.on_fix_conflicts_clicked)
+        main_box.pack_start(self.fix_conflicts_btn, False, False, 0)
+        
         main_box.pack_start(Gtk.Separator(), False, False, 0)
         
         # Event selection
@@ -1111,6 +4781,7 @@ class FittsmonGUI:
         self.command_entry = Gtk.Entry()
         self.command_entry.set_placeholder_text(_('command_placeholder'))
         self.command_entry.connect("changed", self.on_command_changed)
+        self.command_entry.connect("focus-out-event", self.on_command_focus_out)
         main_box.pack_start(self.command_entry, False, False, 0)
         
         # Warning box (wheel conflicts)
@@ -1135,8 +4806,6 @@ class FittsmonGUI:
         self.enter_leave_warning_box.pack_start(self.enter_leave_warning_label, False, False, 0)
         main_box.pack_start(self.enter_leave_warning_box, False, False, 0)
         
-        self.update_command_display()
-        
         # Action buttons
         action_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         
@@ -1144,11 +4813,35 @@ class FittsmonGUI:
         self.test_btn.connect("clicked", self.on_test_clicked)
         action_box.pack_start(self.test_btn, True, True, 0)
         
+        self.bench_btn = Gtk.Button(label=_('benchmark'))
+        self.bench_btn.set_tooltip_text(_('benchmark_tooltip').format(runs=self.BENCHMARK_RUNS))
+        self.bench_btn.connect("clicked", self.on_benchmark_clicked)
+        action_box.pack_start(self.bench_btn, True, True, 0)
+        
         edit_btn = Gtk.Button(label=_('edit_file'))
         edit_btn.connect("clicked", self.on_edit_clicked)
         action_box.pack_start(edit_btn, True, True, 0)
         main_box.pack_start(action_box, False, False, 0)
         
+        # Outcome of the last Test
+        self.test_result_label = Gtk.Label()
+        self.test_result_label.set_line_wrap(True)
+        self.test_result_label.set_selectable(True)
+        self.test_result_label.set_halign(Gtk.Align.START)
+        main_box.pack_start(self.test_result_label, False, False, 0)
+        
+        # Benchmark of every binding
+        bench_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        self.bench_all_btn = Gtk.Button(label=_('benchmark_all'))
+        self.bench_all_btn.connect("clicked", self.on_benchmark_all_clicked)
+        bench_box.pack_start(self.bench_all_btn, True, True, 0)
+        
+        self.bench_export_btn = Gtk.Button(label=_('benchmark_export'))
+        self.bench_export_btn.set_sensitive(False)
+        self.bench_export_btn.connect("clicked", self.on_benchmark_export_clicked)
+        bench_box.pack_start(self.bench_export_btn, True, True, 0)
+        main_box.pack_start(bench_box, False, False, 0)
+        
         # Hotspot toggle
         hotspot_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         self.hotspot_toggle_btn = Gtk.ToggleButton(label=_('show_hotspots'))
@@ -1168,6 +4861,7 @@ class FittsmonGUI:
         self.restart_btn = Gtk.Button(label=_('restart'))
         self.restart_btn.set_size_request(-1, 40)
         self.restart_btn.get_style_context().add_class("destructive-action")
+        self.restart_btn.set_tooltip_text(_('restart_tooltip'))
         self.restart_btn.connect("clicked", self.on_restart_clicked)
         sr_box.pack_start(self.restart_btn, True, True, 0)
         main_box.pack_start(sr_box, False, False, 0)
@@ -1175,30 +4869,59 @@ class FittsmonGUI:
         self.window.show_all()
         self.warning_box.hide()
         self.enter_leave_warning_box.hide()
+        self.fix_conflicts_btn.hide()
+        self.search_scroll.hide()
+        self.test_result_label.hide()
     
     def on_window_close(self, widget, event):
         print("[GUI] Window close requested")
-        self.close_hotspot_windows()
+        if self.closing:
+            # Second close while the daemon is still being brought back
+            return self.quit()
+        
+        self.flush_config()
+        self.destroy_hotspot_windows()
+        self.stop_benchmark()
+        self.cancel_restart()
+        self.supervisor.stop()
         
         if self.daemon_was_running:
             print("[GUI] Daemon was running before GUI started, checking status...")
             if not self.is_daemon_running():
                 print("[GUI] Daemon is not running! Restarting...")
-                self.set_status(_('status_restarting_closing'), error=False)
-                if self.start_fittsmon():
-                    time.sleep(2)
-                    if self.is_daemon_running():
-                        print("[GUI] Daemon successfully restarted")
-                        self.set_status(_('status_daemon_restarted'), error=False)
-                    else:
-                        print("[GUI] Failed to restart daemon!")
-                        self.set_status(_('status_daemon_failed'), error=True)
-                        time.sleep(2)
+                self.set_status(_('status_restarting_closing'), error=False, busy=True)
+                pid = self.spawn_daemon()
+                if pid is not None:
+                    # Keep the window until the daemon is confirmed
+                    self.closing = True
+                    self.set_editing_sensitive(False)
+                    self.spinner.start()
+                    self.wait_daemon_ready(pid, self._on_close_restart_done)
+                    return True
+                print("[GUI] Failed to restart daemon!")
             else:
                 print("[GUI] Daemon is still running, closing cleanly")
         else:
             print("[GUI] Daemon was not running before, not restarting")
         
+        return self.quit()
+    
+    def _on_close_restart_done(self, success):
+        self.spinner.stop()
+        if success:
+            print("[GUI] Daemon successfully restarted")
+            self.set_status(_('status_daemon_restarted'), error=False)
+            self.quit()
+        else:
+            print("[GUI] Failed to restart daemon!")
+            self.set_status(_('status_daemon_failed'), error=True)
+            # Leave the warning readable for a moment, without blocking
+            GLib.timeout_add(2000, self.quit)
+    
+    def quit(self):
+        # Only now: a daemon respawned while closing still has its output
+        # read (and its exit or startup logged) up to this point
+        self.daemon_log.close()
         Gtk.main_quit()
         return False
     
@@ -1221,6 +4944,9 @@ class FittsmonGUI:
         return info_map.get(event, "")
     
     def update_command_display(self):
+        if not self.ready:
+            return
+        
         cmd = self.get_command(self.current_monitor, self.current_zone, self.current_event)
         
         self.command_entry.handler_block_by_func(self.on_command_changed)
@@ -1232,6 +4958,7 @@ class FittsmonGUI:
         self.show_conflict_warnings()
     
     def show_conflict_warnings(self):
+        self.update_conflicts()
         wheel_conflict = self.check_wheel_conflict(self.current_event)
         
         if wheel_conflict:
@@ -1268,9 +4995,9 @@ class FittsmonGUI:
             self.enter_leave_warning_box.hide()
     
     def on_monitor_changed(self, widget):
-        idx = self.monitor_combo.get_active()
-        if idx >= 0:
-            self.current_monitor = self.monitors[idx]['name']
+        name = self.monitor_combo.get_active_id()
+        if name is not None:
+            self.current_monitor = name
             self.update_command_display()
     
     def on_event_changed(self, widget):
@@ -1282,28 +5009,315 @@ class FittsmonGUI:
     def on_command_changed(self, widget):
         command = self.command_entry.get_text()
         self.set_command(self.current_monitor, self.current_zone, self.current_event, command)
-        self.save_config()
+        self.mark_config_dirty()
+        self.update_hotspot_card(self.current_monitor, self.current_zone)
         self.show_conflict_warnings()
     
+    def refresh_config_views(self):
+        """Let the overview and the search results follow config changes"""
+        if self.overview_dialog is not None:
+            self.overview_dialog.refresh()
+        if self.search_source is None and self.search_entry.get_text().strip():
+            self.search_source = GLib.idle_add(self.update_search)
+    
+    def update_search(self, *_args):
+        """List the bindings matching the search box"""
+        self.search_source = None
+        for row in self.search_list.get_children():
+            row.destroy()
+        query = self.search_entry.get_text().strip()
+        if not query:
+            self.search_scroll.hide()
+            return False
+        
+        store = self.config.store
+        cells = store.search(query)
+        # Hits are addressed by section, like the overview: a leftover
+        # [NAME-...] of the current primary is not the primary's binding
+        names = [name if prefix else f"{name} {_('primary')}".strip()
+                 for prefix, name in zip(store.prefixes, self.slot_monitors())]
+        for cell in cells[:self.SEARCH_LIMIT]:
+            slot, zone, event = store.address(cell)
+            zone_name, event_name = store.zones[zone], store.events[event]
+            monitor = self.section_monitor(store.section_name(slot, zone), zone_name)
+            label = Gtk.Label(xalign=0)
+            label.set_markup(
+                f"<b>{GLib.markup_escape_text(names[slot])}</b> · {zone_name} · {event_name}"
+                f"{'' if monitor is not None else ' ' + _('search_not_connected')}\n"
+                f"<small>{GLib.markup_escape_text(store.cells[cell])}</small>"
+            )
+            row = Gtk.ListBoxRow()
+            row.add(label)
+            row.binding = (monitor, zone_name, event_name)
+            row.set_sensitive(monitor is not None)
+            self.search_list.add(row)
+        
+        if len(cells) > self.SEARCH_LIMIT or not cells:
+            note = _('search_more').format(count=len(cells) - self.SEARCH_LIMIT) if cells else _('search_none')
+            row = Gtk.ListBoxRow()
+            row.add(Gtk.Label(label=note, xalign=0))
+            row.set_sensitive(False)
+            self.search_list.add(row)
+        self.search_scroll.show_all()
+        return False
+    
+    def on_search_row_activated(self, listbox, row):
+        """Show the binding of a search hit in the editor"""
+        binding = getattr(row, 'binding', None)
+        if binding is None or binding[0] is None:
+            return
+        monitor, zone, event = binding
+        self.monitor_combo.handler_block_by_func(self.on_monitor_changed)
+        self.monitor_combo.set_active_id(monitor)
+        self.monitor_combo.handler_unblock_by_func(self.on_monitor_changed)
+        self.event_combo.handler_block_by_func(self.on_event_changed)
+        self.event_combo.set_active(self.events.index(event))
+        self.event_combo.handler_unblock_by_func(self.on_event_changed)
+        self.current_monitor, self.current_zone, self.current_event = monitor, zone, event
+        self.update_command_display()
+        self.command_entry.grab_focus()
+    
+    def edit_binding(self, section, zone, event, command):
+        """Bind a command from outside the editor (the overview table), by section"""
+        self.set_section_command(section, event, command)
+        self.mark_config_dirty()
+        monitor = self.section_monitor(section, zone)
+        if monitor is not None:
+            self.update_hotspot_card(monitor, zone)
+        if monitor is not None and (monitor, zone) == (self.current_monitor, self.current_zone):
+            self.update_command_display()
+        else:
+            self.update_conflicts()
+    
+    def on_command_focus_out(self, widget, event):
+        self.flush_config()
+        return False
+    
     def on_auto_clear_clicked(self, widget):
         conflict = self.check_wheel_conflict(self.current_event)
         if conflict:
             section = self.get_section_name(self.current_monitor, self.current_zone)
             self.config.remove_option(section, conflict['conflict_event'])
-            self.save_config()
+            self.mark_config_dirty()
+            self.flush_config()
+            self.update_hotspot_card(self.current_monitor, self.current_zone)
             self.show_conflict_warnings()
             self.set_status(f"{_('status_cleared')} {conflict['conflict_event']}", error=False)
     
+    def on_fix_conflicts_clicked(self, widget):
+        cleared = self.fix_conflicts()
+        if not cleared:
+            return
+        # All fixes go to disk with one write
+        self.config_dirty = True
+        self.flush_config()
+        self.sync_hotspot_overlays()
+        self.update_command_display()
+        self.set_status(_('status_conflicts_fixed').format(count=cleared), error=False)
+    
     def on_test_clicked(self, widget):
         command = self.command_entry.get_text()
         if not command:
             self.set_status(_('status_enter_command'), error=True)
             return
+        pid = self.test_runner.run(command)
+        if pid is None:
+            self.set_status(f"{_('status_error')}: {_('test_failed_start')}", error=True)
+            return
+        self.test_pid = pid
+        self.set_status(_('status_executed'), error=False)
+        self.test_result_label.set_markup(
+            f"<small>{GLib.markup_escape_text(_('test_running').format(pid=pid))}</small>"
+        )
+        self.test_result_label.set_tooltip_text(command)
+        self.test_result_label.show()
+    
+    def _on_test_finished(self, result):
+        if result['pid'] != self.test_pid or self.closing:
+            # Superseded by a later Test; only the latest one is shown
+            return
+        self.test_pid = None
+        
+        status = result['status']
+        if result['stopped'] == "timeout":
+            color = "red"
+            summary = _('test_timed_out').format(timeout=self.test_runner.timeout_s)
+        else:
+            color = "green" if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0 else "red"
+            summary = DaemonSupervisor.describe_status(status)
+        summary += " · " + _('test_elapsed').format(elapsed=result['elapsed'])
+        
+        output = result['output'].rstrip("\n")
+        lines = output.splitlines()[-self.TEST_OUTPUT_LINES:] if output else [_('test_no_output')]
+        if result['dropped']:
+            output += "\n" + _('test_output_dropped').format(count=result['dropped'])
+        self.test_result_label.set_markup(
+            f"<small><span foreground='{color}'>{GLib.markup_escape_text(summary)}</span>\n"
+            f"<tt>{GLib.markup_escape_text(chr(10).join(lines))}</tt></small>"
+        )
+        self.test_result_label.set_tooltip_text(output or None)
+    
+    def on_benchmark_clicked(self, widget):
+        if self.benchmark is not None:
+            self.stop_benchmark()
+            self.set_status(_('benchmark_stopped'), error=False)
+            return
+        command = self.command_entry.get_text()
+        if not command:
+            self.set_status(_('status_enter_command'), error=True)
+            return
+        self.start_benchmark([(self.current_monitor, self.current_zone, self.current_event, command, mode)
+                              for mode in CommandBenchmark.MODES])
+    
+    def on_benchmark_all_clicked(self, widget):
+        bindings = self.bound_commands()
+        if not bindings:
+            self.set_status(_('benchmark_none'), error=True)
+            return
+        
+        # Every bound command really runs, so ask first
+        dialog = Gtk.MessageDialog(
+            transient_for=self.window, modal=True,
+            message_type=Gtk.MessageType.QUESTION, buttons=Gtk.ButtonsType.OK_CANCEL,
+            text=_('benchmark_all_confirm').format(runs=self.BENCHMARK_RUNS)
+        )
+        dialog.format_secondary_text(_('benchmark_all_detail').format(count=len(bindings)))
+        response = dialog.run()
+        dialog.destroy()
+        if response != Gtk.ResponseType.OK:
+            return
+        
+        jobs = []
+        for monitor, zone, event, command in bindings:
+            modes = CommandBenchmark.MODES if event in WHEEL_REPEAT_EVENTS else ("sequential",)
+            jobs.extend((monitor, zone, event, command, mode) for mode in modes)
+        self.start_benchmark(jobs)
+    
+    def start_benchmark(self, jobs):
+        self.benchmark_queue = collections.deque(jobs)
+        self.benchmark_total = len(jobs)
+        self.benchmark_results = []
+        self.bench_btn.set_label(_('benchmark_stop'))
+        self.bench_all_btn.set_sensitive(False)
+        self.bench_export_btn.set_sensitive(False)
+        self.test_result_label.show()
+        self._next_benchmark()
+    
+    def _next_benchmark(self):
+        if not self.benchmark_queue:
+            self.benchmark = None
+            self._finish_benchmark()
+            return
+        monitor, zone, event, command, mode = self.benchmark_queue.popleft()
+        done = self.benchmark_total - len(self.benchmark_queue)
+        self.test_result_label.set_markup("<small>{}</small>".format(GLib.markup_escape_text(
+            _('benchmark_progress').format(done=done, total=self.benchmark_total, command=command)
+        )))
+        self.test_result_label.set_tooltip_text(command)
+        self.benchmark = CommandBenchmark(
+            command, self.BENCHMARK_RUNS, mode,
+            on_done=lambda bench: self._on_benchmark_done(bench, monitor, zone, event),
+            timeout_s=self.test_runner.timeout_s
+        )
+        self.benchmark.start()
+    
+    def _on_benchmark_done(self, bench, monitor, zone, event):
+        budget = WHEEL_INTERVAL_MS if bench.mode == "wheel" else LATENCY_BUDGET_MS[event]
+        stats = latency_summary(bench.samples)
+        row = {
+            'monitor': monitor, 'zone': zone, 'event': event, 'command': bench.command,
+            'mode': bench.mode, 'runs': bench.runs, 'failed': bench.failed,
+            'budget_ms': budget, 'too_slow': stats is not None and stats['p95'] > budget,
+        }
+        for key in ('min', 'p50', 'p95', 'max'):
+            row[f"{key}_ms"] = round(stats[key], 1) if stats else None
+        self.benchmark_results.append(row)
+        print(f"[BENCH] {monitor} {zone} {event} ({bench.mode}): p50 {row['p50_ms']} ms, "
+              f"p95 {row['p95_ms']} ms, {bench.failed} failed{' - too slow' if row['too_slow'] else ''}")
+        self._next_benchmark()
+    
+    def stop_benchmark(self):
+        if self.benchmark is None:
+            return
+        self.benchmark.cancel()
+        self.benchmark = None
+        self.benchmark_queue.clear()
+        if not self.closing:
+            self._finish_benchmark()
+    
+    def benchmark_line(self, row):
+        """One result row as label markup, red when the command is too slow"""
+        if row['mode'] == "wheel":
+            mode = _('benchmark_mode_wheel').format(interval=WHEEL_INTERVAL_MS)
+        else:
+            mode = _('benchmark_mode_sequential')
+        if row['p50_ms'] is None:
+            text = _('benchmark_no_runs').format(mode=mode)
+        else:
+            text = _('benchmark_stats').format(mode=mode, min=row['min_ms'], p50=row['p50_ms'],
+                                               p95=row['p95_ms'], max=row['max_ms'])
+        notes = []
+        if row['too_slow']:
+            notes.append(_('benchmark_too_slow').format(event=row['event'], budget=row['budget_ms']))
+        if row['failed']:
+            notes.append(_('benchmark_failed_runs').format(count=row['failed'], runs=row['runs']))
+        if notes:
+            text += " · " + ", ".join(notes)
+        color = "red" if row['too_slow'] or row['p50_ms'] is None else "green"
+        return f"<span foreground='{color}'>{GLib.markup_escape_text(text)}</span>"
+    
+    def _finish_benchmark(self):
+        self.bench_btn.set_label(_('benchmark'))
+        # Back in line with Test if a restart greyed the buttons meanwhile
+        self.bench_btn.set_sensitive(self.test_btn.get_sensitive())
+        self.bench_all_btn.set_sensitive(True)
+        results = self.benchmark_results
+        self.bench_export_btn.set_sensitive(bool(results))
+        if not results:
+            self.test_result_label.hide()
+            return
+        
+        commands = {(row['monitor'], row['zone'], row['event']) for row in results}
+        if len(commands) == 1:
+            lines = [self.benchmark_line(row) for row in results]
+        else:
+            slow = {(row['monitor'], row['zone'], row['event']) for row in results if row['too_slow']}
+            lines = [GLib.markup_escape_text(
+                _('benchmark_summary').format(count=len(commands), slow=len(slow)))]
+            flagged = [row for row in results if row['too_slow'] or row['failed'] or row['p50_ms'] is None]
+            for row in flagged[:self.TEST_OUTPUT_LINES]:
+                lines.append(f"<tt>{GLib.markup_escape_text(row['monitor'])} {row['zone']} {row['event']}</tt> "
+                             + self.benchmark_line(row))
+        self.test_result_label.set_markup(f"<small>{chr(10).join(lines)}</small>")
+        if len(commands) == 1:
+            self.test_result_label.set_tooltip_text(results[0]['command'])
+        else:
+            self.test_result_label.set_tooltip_text(None)
+    
+    def on_benchmark_export_clicked(self, widget):
+        dialog = Gtk.FileChooserDialog(
+            title=_('benchmark_export'), transient_for=self.window, action=Gtk.FileChooserAction.SAVE
+        )
+        dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_SAVE, Gtk.ResponseType.ACCEPT)
+        dialog.set_do_overwrite_confirmation(True)
+        dialog.set_current_name("fittsmon-benchmark.csv")
+        response = dialog.run()
+        path = dialog.get_filename()
+        dialog.destroy()
+        if response != Gtk.ResponseType.ACCEPT or not path:
+            return
+        
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=self.CSV_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(self.benchmark_results)
         try:
-            subprocess.Popen(command, shell=True)
-            self.set_status(_('status_executed'), error=False)
-        except Exception as e:
+            atomic_write(path, out.getvalue())
+        except OSError as e:
             self.set_status(f"{_('status_error')}: {e}", error=True)
+            return
+        print(f"[BENCH] Wrote {len(self.benchmark_results)} rows to {path}")
+        self.set_status(_('benchmark_exported').format(path=path), error=False)
     
     def on_edit_clicked(self, widget):
         try:
@@ -1318,20 +5332,32 @@ class FittsmonGUI:
             self.hotspot_toggle_btn.set_label(_('hide_hotspots'))
             self.set_status(_('status_showing_hotspots'), error=False)
         else:
-            self.close_hotspot_windows()
+            self.hide_hotspot_windows()
             self.hotspot_toggle_btn.set_label(_('show_hotspots'))
             self.set_status(_('status_hotspots_hidden'), error=False)
     
     def on_save_clicked(self, widget):
-        self.save_config()
+        self.config_dirty = True
+        self.flush_config()
     
     def on_restart_clicked(self, widget):
-        self.restart_fittsmon()
+        # The daemon reads fittsmonrc on start, so pending edits go first
+        self.flush_config()
+        _ok, state = Gtk.get_current_event_state()
+        self.restart_fittsmon(force=bool(state & Gdk.ModifierType.SHIFT_MASK))
     
     def on_help_clicked(self, widget):
-        dialog = HelpDialog(self.window)
-        dialog.run()
-        dialog.destroy()
+        # Built on first use and kept around for later clicks
+        if self.help_dialog is None:
+            self.help_dialog = HelpDialog(self.window)
+        self.help_dialog.run()
+        self.help_dialog.hide()
+    
+    def on_overview_clicked(self, widget):
+        # Built on first use; hiding it keeps the model for the next time
+        if self.overview_dialog is None:
+            self.overview_dialog = OverviewDialog(self.window, self)
+        self.overview_dialog.present_overview()
     
     def set_status(self, message, error=False, busy=False):
         if not hasattr(self, 'status_label'):
@@ -1353,15 +5379,38 @@ class FittsmonGUI:
             f"</span>"
         )
     
+    def set_daemon_info(self, message, error=False):
+        color = "red" if error else "gray"
+        self.daemon_label.set_markup(
+            f"<small><span foreground='{color}'>{GLib.markup_escape_text(message)}</span></small>"
+        )
+    
     def run(self):
         print("\n" + "="*50)
         print("  fittsmon")
         print("="*50 + "\n")
+        self.profile.mark("main loop")
         Gtk.main()
 
 
-if __name__ == "__main__":
-    import signal
+def main(argv=None):
+    args = parse_args(argv)
+    if args.benchmark_config is not None:
+        return benchmark_config(args.benchmark_config)
+    if args.benchmark_bindings is not None:
+        return benchmark_bindings(args.benchmark_bindings)
+    if args.headless:
+        return run_headless(args)
+    
+    load_gtk()
     signal.signal(signal.SIGINT, signal.SIG_DFL)  # Allow Ctrl+C to exit cleanly
-    app = FittsmonGUI()
+    profile = StartupProfile(enabled=args.startup_profile)
+    profile.mark("imports")
+    app = FittsmonGUI(sparse=args.sparse, profile=profile, daemon_log=args.daemon_log,
+                      restart_on_hotplug=args.restart_on_hotplug, test_timeout=args.test_timeout)
     app.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""
+Shared by the tests: fittsmon-gui.py imported as a module
+
+Importing it doesn't load GTK (main() does, for the GUI only), so the
+tests run without PyGObject or a display.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "fittsmon-gui.py"
+
+
+def load_gui_module():
+    """Import fittsmon-gui.py once, without running its main block"""
+    module = sys.modules.get("fittsmon_gui")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("fittsmon_gui", SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+fittsmon_gui = load_gui_module()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+BindingStore: cell addressing, conflict masks and the token index
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from support import fittsmon_gui
+
+BindingStore = fittsmon_gui.BindingStore
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.store = BindingStore()
+        self.primary = self.store.monitor_slot("")
+        self.hdmi = self.store.monitor_slot("HDMI-1")
+    
+    def bind(self, slot, zone, event, command):
+        store = self.store
+        return store.set(slot, store.zone_index[zone], store.event_index[event], command)
+    
+    def command(self, slot, zone, event):
+        store = self.store
+        return store.get(slot, store.zone_index[zone], store.event_index[event])
+
+
+class AddressingTest(StoreTestCase):
+    def test_slots(self):
+        self.assertEqual((self.primary, self.hdmi), (0, 1))
+        self.assertEqual(self.store.monitor_slot("HDMI-1"), 1)
+        self.assertIsNone(self.store.monitor_slot("DP-2", create=False))
+        self.assertEqual(len(self.store.cells), 2 * len(fittsmon_gui.ZONES) * len(fittsmon_gui.EVENTS))
+    
+    def test_section_names(self):
+        zone = self.store.zone_index["TopLeft"]
+        self.assertEqual(self.store.section_name(self.primary, zone), "TopLeft")
+        self.assertEqual(self.store.section_name(self.hdmi, zone), "HDMI-1-TopLeft")
+    
+    def test_cells_are_independent(self):
+        self.bind(self.hdmi, "Left", "Enter", "true")
+        self.assertEqual(self.command(self.hdmi, "Left", "Enter"), "true")
+        self.assertEqual(self.command(self.primary, "Left", "Enter"), "")
+        self.assertEqual(self.command(self.hdmi, "Left", "Leave"), "")
+        self.assertEqual(self.command(self.hdmi, "Right", "Enter"), "")
+    
+    def test_address_round_trip(self):
+        self.bind(self.hdmi, "BottomRight", "Leave", "x")
+        (cell,) = self.store.filled
+        store = self.store
+        self.assertEqual(store.address(cell),
+                         (self.hdmi, store.zone_index["BottomRight"], store.event_index["Leave"]))
+    
+    def test_set_reports_changes(self):
+        self.assertTrue(self.bind(self.primary, "Left", "Enter", "a"))
+        self.assertFalse(self.bind(self.primary, "Left", "Enter", "a"))
+        self.assertTrue(self.bind(self.primary, "Left", "Enter", ""))
+        self.assertEqual(len(self.store), 0)
+    
+    def test_commands_are_interned(self):
+        self.bind(self.primary, "Left", "Enter", "".join(["rofi", " -show drun"]))
+        self.bind(self.hdmi, "Left", "Enter", "".join(["rofi -show", " drun"]))
+        self.assertIs(self.command(self.primary, "Left", "Enter"), self.command(self.hdmi, "Left", "Enter"))
+    
+    def test_iter_filled_and_clear_section(self):
+        self.bind(self.hdmi, "Left", "Leave", "b")
+        self.bind(self.hdmi, "Left", "Enter", "a")
+        self.bind(self.primary, "Right", "Enter", "c")
+        store = self.store
+        left, right = store.zone_index["Left"], store.zone_index["Right"]
+        enter, leave = store.event_index["Enter"], store.event_index["Leave"]
+        self.assertEqual(list(store.iter_filled()),
+                         [(self.primary, right, enter, "c"), (self.hdmi, left, enter, "a"), (self.hdmi, left, leave, "b")])
+        store.clear_section(self.hdmi, left)
+        self.assertEqual(list(store.iter_filled()), [(self.primary, right, enter, "c")])
+
+
+class ConflictMaskTest(StoreTestCase):
+    def mask(self, *events):
+        return self.store.event_mask(events)
+    
+    def section(self, slot, zone):
+        return slot, self.store.zone_index[zone]
+    
+    def test_section_masks(self):
+        self.bind(self.hdmi, "Left", "Enter", "a")
+        self.bind(self.hdmi, "Left", "WheelUp", "b")
+        self.assertEqual(self.store.section_mask(*self.section(self.hdmi, "Left")), self.mask("Enter", "WheelUp"))
+        self.assertEqual(self.store.section_mask(*self.section(self.primary, "Left")), 0)
+        self.assertEqual(self.store.event_names(self.mask("Enter", "WheelUp")), ["WheelUp", "Enter"])
+    
+    def test_conflicts(self):
+        self.bind(self.primary, "Left", "WheelUp", "a")
+        self.bind(self.primary, "Left", "WheelUpOnce", "b")
+        self.bind(self.primary, "Left", "WheelDownOnce", "c")
+        self.bind(self.hdmi, "TopLeft", "Enter", "d")
+        self.bind(self.hdmi, "TopLeft", "LeftButton", "e")
+        self.bind(self.hdmi, "TopLeft", "RightButton", "f")
+        self.store.validate()
+        self.assertEqual(self.store.conflicts, {
+            self.section(self.primary, "Left"): (("wheel", self.mask("WheelUp"), self.mask("WheelUpOnce")),),
+            self.section(self.hdmi, "TopLeft"): (
+                ("enter_leave", self.mask("LeftButton", "RightButton"), self.mask("Enter")),
+            ),
+        })
+    
+    def test_validate_checks_only_written_sections(self):
+        self.bind(self.primary, "Left", "WheelDown", "a")
+        self.bind(self.hdmi, "Left", "Enter", "b")
+        self.assertEqual(self.store.validate(),
+                         {self.section(self.primary, "Left"), self.section(self.hdmi, "Left")})
+        self.assertEqual(self.store.validate(), set())
+        
+        self.bind(self.primary, "Left", "WheelDownOnce", "c")
+        self.assertEqual(self.store.validate(), {self.section(self.primary, "Left")})
+        self.assertIn(self.section(self.primary, "Left"), self.store.conflicts)
+        self.assertFalse(self.bind(self.primary, "Left", "WheelDownOnce", "c"))
+        self.assertEqual(self.store.validate(), set())
+        
+        self.bind(self.primary, "Left", "WheelDown", "")
+        self.store.validate()
+        self.assertEqual(self.store.conflicts, {})
+        self.store.clear_section(*self.section(self.primary, "Left"))
+        self.store.validate()
+        self.assertEqual(self.store.masks, {self.section(self.hdmi, "Left"): self.mask("Enter")})
+    
+    def test_section_mask_validates_first(self):
+        self.store.validate()
+        self.bind(self.hdmi, "Right", "Leave", "a")
+        self.assertEqual(self.store.section_mask(*self.section(self.hdmi, "Right")), self.mask("Leave"))
+        self.assertEqual(self.store.stale, set())
+
+
+class TokenIndexTest(StoreTestCase):
+    def cells(self, *bindings):
+        store = self.store
+        return sorted((slot * store.n_zones + store.zone_index[zone]) * store.n_events + store.event_index[event]
+                      for slot, zone, event in bindings)
+    
+    def test_search(self):
+        self.bind(self.primary, "TopLeft", "WheelUp", "amixer set Master 5%+")
+        self.bind(self.primary, "TopLeft", "WheelDown", "amixer set Master 5%-")
+        self.bind(self.hdmi, "Left", "Enter", "amixer set Capture toggle")
+        self.bind(self.hdmi, "Right", "Enter", "rofi -show drun")
+        store = self.store
+        self.assertEqual(store.search("amixer"), self.cells(
+            (self.primary, "TopLeft", "WheelUp"), (self.primary, "TopLeft", "WheelDown"),
+            (self.hdmi, "Left", "Enter")))
+        self.assertEqual(store.search("master amix"), self.cells(
+            (self.primary, "TopLeft", "WheelUp"), (self.primary, "TopLeft", "WheelDown")))
+        self.assertEqual(store.search("CAPT"), self.cells((self.hdmi, "Left", "Enter")))
+        self.assertEqual(store.search("rofi master"), [])
+        self.assertEqual(store.search("'  ;"), [])
+    
+    def test_shell_punctuation_splits_tokens(self):
+        self.bind(self.primary, "Left", "Enter", "pkill -x conky;(/usr/bin/conky &)")
+        self.assertIn("conky", self.store.tokens)
+        self.assertIn("/usr/bin/conky", self.store.tokens)
+        self.assertEqual(self.store.search("/usr/bin"), self.cells((self.primary, "Left", "Enter")))
+    
+    def test_index_follows_writes(self):
+        self.bind(self.primary, "Left", "Enter", "xdotool key super")
+        self.bind(self.hdmi, "Left", "Enter", "xdotool click 1")
+        self.bind(self.primary, "Left", "Enter", "rofi -show run")
+        self.assertNotIn("super", self.store.tokens)
+        self.assertEqual(self.store.search("xdotool"), self.cells((self.hdmi, "Left", "Enter")))
+        self.store.clear_section(self.hdmi, self.store.zone_index["Left"])
+        self.assertEqual(self.store.search("xdotool"), [])
+        self.assertEqual(set(self.store.tokens), {"rofi", "-show", "run"})
+        self.bind(self.primary, "Left", "Enter", "")
+        self.assertEqual(self.store.tokens, {})
+
+
+class SectionMonitorTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with mock.patch.dict(os.environ, HOME=tmp.name):
+            self.core = fittsmon_gui.FittsmonCore()
+        self.core.monitors = [{'name': "eDP-1", 'primary': True}, {'name': "HDMI-1", 'primary': False}]
+    
+    def test_sections_of_connected_monitors(self):
+        self.assertEqual(self.core.section_monitor("Left", "Left"), "eDP-1")
+        self.assertEqual(self.core.section_monitor("HDMI-1-Left", "Left"), "HDMI-1")
+    
+    def test_find_conflicts(self):
+        config = self.core.config
+        config.set("eDP-1-Left", "WheelUp", "a")
+        config.set("eDP-1-Left", "WheelUpOnce", "b")
+        config.set("HDMI-1-Right", "Leave", "c")
+        config.set("HDMI-1-Right", "MiddleButton", "d")
+        self.assertEqual(self.core.find_conflicts(), [
+            {'section': "eDP-1-Left", 'monitor': "eDP-1", 'zone': "Left", 'type': "wheel",
+             'events': ["WheelUp"], 'conflict_events': ["WheelUpOnce"]},
+            {'section': "HDMI-1-Right", 'monitor': "HDMI-1", 'zone': "Right", 'type': "enter_leave",
+             'events': ["MiddleButton"], 'conflict_events': ["Leave"]},
+        ])
+    
+    def test_leftover_section_of_primary(self):
+        # [eDP-1-Left] from a session where eDP-1 wasn't the primary
+        self.assertIsNone(self.core.section_monitor("eDP-1-Left", "Left"))
+        self.assertIsNone(self.core.section_monitor("DP-2-Left", "Left"))
+
+
+class ConfigAddressingTest(unittest.TestCase):
+    def test_section_slots(self):
+        config = fittsmon_gui.ConfigParser()
+        store = config.store
+        self.assertEqual(config.slot("TopLeft"), (store.monitor_slot(""), store.zone_index["TopLeft"]))
+        self.assertEqual(config.slot("DP-1-1-Left"), (store.monitor_slot("DP-1-1"), store.zone_index["Left"]))
+        self.assertIsNone(config.slot("Notes"))
+    
+    def test_unknown_events_are_kept(self):
+        config = fittsmon_gui.ConfigParser()
+        config.set("Left", "Enter", "a")
+        config.set("Left", "Custom", "b")
+        self.assertEqual(config.values("Left"), {'Enter': "a", 'Custom': "b"})
+        self.assertEqual(len(config.store), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
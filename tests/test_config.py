@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+fittsmonrc as a lossless document: edits patch single lines
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from support import fittsmon_gui
+
+EVENTS = fittsmon_gui.EVENTS
+MONITORS = [{'name': "eDP-1", 'primary': True}]
+ZONES = ["TopLeft", "Left"]
+
+HAND_EDITED = """\
+# My fittsmon setup
+# edited by hand
+
+[TopLeft]
+# volume
+WheelUp = amixer set Master 5%+
+WheelDown = amixer set Master 5%-
+WheelUpOnce=
+WheelDownOnce=
+LeftButton=rofi -show drun   
+RightButton=
+MiddleButton=
+Enter=
+Leave=
+
+[Left]
+LeftButton=xdotool key super
+CustomKey=kept
+
+[Notes]
+anything=goes
+"""
+
+
+class ConfigTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "fittsmonrc"
+    
+    def load(self, text, sparse=False):
+        self.path.write_text(text)
+        config = fittsmon_gui.ConfigParser(sparse=sparse)
+        config.read(self.path)
+        return config
+    
+    def write(self, config, zones=ZONES):
+        return config.write(self.path, zones, EVENTS, MONITORS)
+    
+    def assertOnlyLinesChanged(self, before, after, changed):
+        """after is before with the lines {number: new line} replaced"""
+        expected = before.splitlines()
+        for i, line in changed.items():
+            expected[i] = line
+        self.assertEqual(after, "\n".join(expected) + "\n")
+
+
+class RoundTripTest(ConfigTestCase):
+    def test_edit_one_key(self):
+        config = self.load(HAND_EDITED)
+        config.set("TopLeft", "WheelUp", "amixer set Master 10%+")
+        self.assertTrue(self.write(config))
+        self.assertOnlyLinesChanged(HAND_EDITED, self.path.read_text(),
+                                    {5: "WheelUp = amixer set Master 10%+"})
+    
+    def test_clear_one_key(self):
+        config = self.load(HAND_EDITED)
+        config.remove_option("TopLeft", "WheelDown")
+        self.write(config)
+        self.assertOnlyLinesChanged(HAND_EDITED, self.path.read_text(), {6: "WheelDown ="})
+    
+    def test_unknown_keys_and_sections(self):
+        config = self.load(HAND_EDITED)
+        self.assertEqual(config.get("Left", "CustomKey"), "kept")
+        self.assertEqual(config.get("Notes", "anything"), "goes")
+        config.set("Notes", "anything", "changed")
+        self.write(config)
+        self.assertOnlyLinesChanged(HAND_EDITED, self.path.read_text(), {20: "anything=changed"})
+    
+    def test_unchanged_write_is_skipped(self):
+        config = self.load(HAND_EDITED)
+        before = os.stat(self.path).st_mtime_ns
+        config.set("TopLeft", "WheelUp", "amixer set Master 5%+")
+        self.assertFalse(self.write(config))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, before)
+        self.assertEqual(self.path.read_text(), HAND_EDITED)
+    
+    def test_new_section_is_appended(self):
+        config = self.load(HAND_EDITED)
+        config.set("Right", "Enter", "notify-send hi")
+        self.write(config, ZONES + ["Right"])
+        text = self.path.read_text()
+        self.assertTrue(text.startswith(HAND_EDITED))
+        self.assertIn("[Right]\n", text[len(HAND_EDITED):])
+        self.assertIn("Enter=notify-send hi\n", text[len(HAND_EDITED):])
+
+
+class ExternalEditTest(ConfigTestCase):
+    def test_merge_keeps_both_edits(self):
+        config = self.load(HAND_EDITED)
+        config.set("TopLeft", "RightButton", "xterm")
+        
+        # "Edit File" while the GUI holds an unsaved edit
+        edited = HAND_EDITED.replace("LeftButton=xdotool key super", "LeftButton=xdotool key alt")
+        edited = edited.replace("[Notes]", "# a new comment\n[Notes]")
+        self.path.write_text(edited)
+        
+        self.assertTrue(self.write(config))
+        self.assertOnlyLinesChanged(edited, self.path.read_text(), {10: "RightButton=xterm"})
+        self.assertEqual(config.get("Left", "LeftButton"), "xdotool key alt")
+    
+    def test_section_deleted_on_disk(self):
+        config = self.load(HAND_EDITED)
+        self.path.write_text(HAND_EDITED.replace("[Notes]\nanything=goes\n", ""))
+        config.set("TopLeft", "Enter", "true")
+        self.write(config)
+        self.assertFalse(config.has_section("Notes"))
+        self.assertNotIn("[Notes]", self.path.read_text())
+
+
+SPARSE = """\
+[TopLeft]
+WheelUp=amixer set Master 5%+
+LeftButton=rofi -show drun
+
+[Left]
+# launcher
+Enter=true
+
+[HDMI-1-Left]
+Leave=false
+"""
+
+
+class SparseTest(ConfigTestCase):
+    def test_missing_keys_read_empty(self):
+        config = self.load(SPARSE, sparse=True)
+        self.assertEqual(config.get("TopLeft", "WheelDown"), "")
+        self.assertEqual(config.get("Right", "Enter"), "")
+    
+    def test_emptied_key_is_removed(self):
+        config = self.load(SPARSE, sparse=True)
+        config.remove_option("TopLeft", "WheelUp")
+        self.write(config)
+        self.assertEqual(self.path.read_text(), SPARSE.replace("WheelUp=amixer set Master 5%+\n", ""))
+    
+    def test_emptied_section_is_removed(self):
+        config = self.load(SPARSE, sparse=True)
+        config.remove_option("TopLeft", "WheelUp")
+        config.remove_option("TopLeft", "LeftButton")
+        self.write(config)
+        self.assertEqual(self.path.read_text(), SPARSE[SPARSE.index("[Left]"):])
+    
+    def test_section_with_comment_keeps_its_header(self):
+        config = self.load(SPARSE, sparse=True)
+        config.remove_option("Left", "Enter")
+        self.write(config)
+        self.assertEqual(self.path.read_text(), SPARSE.replace("Enter=true\n", ""))
+    
+    def test_new_binding_only(self):
+        config = self.load(SPARSE, sparse=True)
+        config.set("Right", "Enter", "notify-send hi")
+        self.write(config, ZONES + ["Right"])
+        self.assertEqual(self.path.read_text(), SPARSE + "\n[Right]\nEnter=notify-send hi\n\n")
+    
+    def test_fresh_file(self):
+        config = fittsmon_gui.ConfigParser(sparse=True)
+        config.set("Left", "Enter", "true")
+        monitors = MONITORS + [{'name': "HDMI-1", 'primary': False}]
+        text = config.serialize(ZONES, EVENTS, monitors)
+        self.assertEqual(text.split("\n", 3)[3], "[Left]\nEnter=true\n\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+DaemonTracker: the pidfile, its fingerprint and liveness checks
+
+A `sleep` child stands in for the daemon (the tracker matches the process
+name exactly).
+
+    python3 -m unittest discover tests
+"""
+
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from support import fittsmon_gui
+
+DaemonTracker = fittsmon_gui.DaemonTracker
+
+
+class DaemonTrackerTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.pidfile = Path(tmp.name) / "fittsmon-gui" / "fittsmon.pid"
+        self.child = subprocess.Popen(["sleep", "60"])
+        self.addCleanup(self.stop_child)
+        # Popen may return before the child's exec: wait for its new name
+        deadline = time.monotonic() + 5
+        while not self.tracker()._is_daemon(self.child.pid) and time.monotonic() < deadline:
+            time.sleep(0.01)
+    
+    def stop_child(self):
+        self.child.kill()
+        self.child.wait()
+    
+    def tracker(self):
+        return DaemonTracker(name="sleep", pidfile=self.pidfile)
+    
+    def test_record_writes_pidfile(self):
+        tracker = self.tracker()
+        tracker.record(self.child.pid, "abc123")
+        starttime = DaemonTracker.proc_stat(self.child.pid)[1]
+        self.assertEqual(self.pidfile.read_text(), f"{self.child.pid} {starttime} abc123\n")
+        self.assertTrue(tracker.tracked_alive())
+    
+    def test_pidfile_survives_restart(self):
+        self.tracker().record(self.child.pid, "abc123")
+        tracker = self.tracker()
+        self.assertEqual((tracker.pid, tracker.fingerprint), (self.child.pid, "abc123"))
+        tracker.note_fingerprint("def456")
+        self.assertEqual(self.tracker().fingerprint, "def456")
+    
+    def test_no_fingerprint(self):
+        self.tracker().record(self.child.pid)
+        tracker = self.tracker()
+        self.assertEqual(tracker.pid, self.child.pid)
+        self.assertIsNone(tracker.fingerprint)
+    
+    def test_exited_daemon_is_forgotten(self):
+        tracker = self.tracker()
+        tracker.record(self.child.pid, "abc123")
+        self.stop_child()
+        self.assertFalse(tracker.tracked_alive())
+        self.assertIsNone(tracker.pid)
+        self.assertFalse(self.pidfile.exists())
+    
+    def test_stale_pidfile_is_dropped(self):
+        self.tracker().record(self.child.pid, "abc123")
+        self.stop_child()
+        self.assertIsNone(self.tracker().pid)
+        self.assertFalse(self.pidfile.exists())
+    
+    def test_reused_pid_is_not_trusted(self):
+        starttime = DaemonTracker.proc_stat(self.child.pid)[1]
+        self.pidfile.parent.mkdir()
+        self.pidfile.write_text(f"{self.child.pid} {starttime + 1} abc123\n")
+        self.assertIsNone(self.tracker().pid)
+        self.assertFalse(self.pidfile.exists())
+    
+    def test_other_process_name_is_not_trusted(self):
+        self.tracker().record(self.child.pid)
+        tracker = DaemonTracker(name="fittsmon-test-none", pidfile=self.pidfile)
+        self.assertIsNone(tracker.pid)
+    
+    def test_find_and_adopt(self):
+        tracker = self.tracker()
+        self.assertIn(self.child.pid, tracker.find())
+        self.assertTrue(tracker.is_running())
+        self.assertIsNotNone(tracker.pid)
+        self.assertTrue(self.pidfile.exists())
+    
+    def test_forget_other_pid(self):
+        tracker = self.tracker()
+        tracker.record(self.child.pid)
+        tracker.forget(self.child.pid + 1)
+        self.assertEqual(tracker.pid, self.child.pid)
+        tracker.forget(self.child.pid)
+        self.assertIsNone(tracker.pid)
+        self.assertFalse(self.pidfile.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
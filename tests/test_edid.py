@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Monitor identities from EDID
+
+Needs neither GTK nor a display:
+
+    python3 -m unittest discover tests
+"""
+
+import unittest
+
+from support import fittsmon_gui
+
+# A complete EDID 1.4 base block (checksum included): vendor "XYZ",
+# product 0x1234, serial number 16909060 in bytes 12-15, a 1920x1080
+# detailed timing, range limits, the name "FITTS TEST" and the serial
+# "SN12345678" in the 0xFF descriptor
+EDID_HEX = (
+    "00ffffffffffff00633a341204030201"
+    "0c210104a5351e783afc81a3574da024"
+    "0f505400000001010101010101010101"
+    "010101010101023a801871382d40582c"
+    "4500132a2100001e000000fd00384b1e"
+    "5311000a202020202020000000fc0046"
+    "4954545320544553540a2020000000ff"
+    "00534e31323334353637380a20200039"
+)
+EDID = bytes.fromhex(EDID_HEX)
+
+class EdidIdentityTest(unittest.TestCase):
+    identity = staticmethod(fittsmon_gui.MonitorIdentities.identity)
+    
+    def test_checksum(self):
+        self.assertEqual(sum(EDID) % 256, 0)
+    
+    def test_serial_descriptor(self):
+        self.assertEqual(self.identity(EDID), "XYZ-1234-SN12345678")
+    
+    def test_numeric_serial_without_descriptor(self):
+        edid = bytearray(EDID)
+        edid[111] = 0xFE  # the 0xFF descriptor becomes unspecified text
+        self.assertEqual(self.identity(bytes(edid)), "XYZ-1234-16909060")
+    
+    def test_no_serial(self):
+        edid = bytearray(EDID)
+        edid[111] = 0xFE
+        edid[12:16] = bytes(4)
+        self.assertEqual(self.identity(bytes(edid)), "XYZ-1234-")
+    
+    def test_not_an_edid(self):
+        self.assertEqual(self.identity(b""), "")
+        self.assertEqual(self.identity(EDID[:127]), "")
+        self.assertEqual(self.identity(bytes(128)), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
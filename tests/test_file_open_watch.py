@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+FileOpenWatch: confirming that the daemon read fittsmonrc again
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from support import fittsmon_gui
+
+
+class FileOpenWatchTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "fittsmonrc"
+        self.path.write_text("[TopLeft]\n")
+    
+    def watch(self, path=None):
+        watch = fittsmon_gui.FileOpenWatch(path or self.path)
+        self.addCleanup(watch.close)
+        return watch
+    
+    def test_counts_opens_of_the_file_only(self):
+        watch = self.watch()
+        self.path.read_text()
+        (self.dir / "profiles.json").write_text("{}")
+        self.assertEqual(watch.count(), 1)
+    
+    def test_file_replaced_by_rename(self):
+        watch = self.watch()
+        fittsmon_gui.atomic_write(self.path, "[Left]\n")
+        self.path.read_text()
+        self.assertEqual(watch.count(), 1)
+    
+    def test_own_opens_are_ignored(self):
+        watch = self.watch()
+        self.path.read_text()
+        with watch.ignoring():
+            self.path.read_text()
+            fittsmon_gui.atomic_write(self.path, "[Left]\n")
+        self.assertEqual(watch.count(), 1)
+    
+    def test_symlinked_file(self):
+        link = self.dir / "link"
+        os.symlink(self.path, link)
+        watch = self.watch(link)
+        link.read_text()
+        self.assertEqual(watch.count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+--get/--set/--clear/--batch: results and exit codes
+
+Runs fittsmon-gui.py as a script with HOME in a temporary directory.
+
+    python3 -m unittest discover tests
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import SCRIPT, fittsmon_gui
+
+
+class HeadlessTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.home = Path(tmp.name)
+        self.env = dict(os.environ, HOME=tmp.name, XDG_RUNTIME_DIR=tmp.name)
+    
+    def run_cli(self, *args, stdin=""):
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), "--monitors", "eDP-1", "HDMI-1", *args],
+            input=stdin, capture_output=True, text=True, env=self.env, timeout=30
+        )
+    
+    def get(self, monitor, zone, event):
+        result = self.run_cli("--get", monitor, zone, event)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout
+    
+    def test_set_and_get(self):
+        result = self.run_cli("--set", "HDMI-1", "TopLeft", "WheelUp", "amixer set Master 5%+")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(self.get("HDMI-1", "TopLeft", "WheelUp"), "amixer set Master 5%+\n")
+        self.assertIn("[HDMI-1-TopLeft]", (self.home / ".config/fittsmon/fittsmonrc").read_text())
+    
+    def test_clear(self):
+        self.run_cli("--set", "eDP-1", "Left", "Enter", "true")
+        result = self.run_cli("--clear", "eDP-1", "Left", "Enter")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(self.get("eDP-1", "Left", "Enter"), "\n")
+    
+    def test_wheel_conflict_is_cleared(self):
+        self.run_cli("--set", "eDP-1", "Left", "WheelUp", "a")
+        self.run_cli("--set", "eDP-1", "Left", "WheelUpOnce", "b")
+        self.assertEqual(self.get("eDP-1", "Left", "WheelUp"), "\n")
+    
+    def test_batch_from_stdin(self):
+        result = self.run_cli("--batch", "-", stdin=(
+            "# provisioning\n"
+            "set eDP-1 TopLeft LeftButton rofi -show drun\n"
+            "set HDMI-1 Right Enter true\n"
+            "clear HDMI-1 Right Enter\n"
+        ))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(self.get("eDP-1", "TopLeft", "LeftButton"), "rofi -show drun\n")
+        self.assertEqual(self.get("HDMI-1", "Right", "Enter"), "\n")
+    
+    def test_monitors_edit_is_not_a_layout(self):
+        self.run_cli("--set", "eDP-1", "Left", "Enter", "true")
+        self.assertFalse((self.home / ".config/fittsmon/profiles.json").exists())
+    
+    def test_invalid_input(self):
+        for args in (
+            ("--set", "DP-9", "TopLeft", "WheelUp", "x"),
+            ("--get", "eDP-1", "Middle", "WheelUp"),
+            ("--clear", "eDP-1", "TopLeft", "Scroll"),
+            ("--batch", str(self.home / "missing")),
+        ):
+            with self.subTest(args=args):
+                self.assertEqual(self.run_cli(*args).returncode, 2)
+        result = self.run_cli("--batch", "-", stdin="set eDP-1 TopLeft\n")
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("-:1:", result.stderr)
+        self.assertFalse((self.home / ".config/fittsmon/fittsmonrc").exists())
+    
+    def test_batch_leaves_stdin_open(self):
+        stdin = io.StringIO("set eDP-1 Left Enter true\n")
+        with mock.patch.object(sys, "stdin", stdin):
+            edits = fittsmon_gui.read_batch("-")
+        self.assertEqual(edits, [("set", "eDP-1", "Left", "Enter", "true")])
+        self.assertFalse(stdin.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+latency_summary: nearest-rank percentiles of benchmark samples
+
+    python3 -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from support import fittsmon_gui
+
+latency_summary = fittsmon_gui.latency_summary
+
+
+class LatencySummaryTest(unittest.TestCase):
+    def test_no_samples(self):
+        self.assertIsNone(latency_summary([]))
+    
+    def test_one_sample(self):
+        self.assertEqual(latency_summary([7.5]), {'min': 7.5, 'p50': 7.5, 'p95': 7.5, 'max': 7.5})
+    
+    def test_nearest_rank(self):
+        # 1..100: p50 is the 50th sample, p95 the 95th
+        samples = list(range(1, 101))
+        random.Random(0).shuffle(samples)
+        self.assertEqual(latency_summary(samples), {'min': 1, 'p50': 50, 'p95': 95, 'max': 100})
+    
+    def test_ranks_round_up(self):
+        # 10 runs, the benchmark default: ceil(0.5 * 10) = 5, ceil(0.95 * 10) = 10
+        samples = [float(i) for i in range(10, 0, -1)]
+        self.assertEqual(latency_summary(samples), {'min': 1.0, 'p50': 5.0, 'p95': 10.0, 'max': 10.0})
+        # ceil(0.5 * 3) = 2, ceil(0.95 * 3) = 3
+        self.assertEqual(latency_summary([3, 1, 2]), {'min': 1, 'p50': 2, 'p95': 3, 'max': 3})
+    
+    def test_samples_are_not_reordered(self):
+        samples = [5, 1, 3]
+        latency_summary(samples)
+        self.assertEqual(samples, [5, 1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()